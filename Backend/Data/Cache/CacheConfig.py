@@ -0,0 +1,25 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Size and freshness limits for one collection's entity cache"""
+    max_size: int
+    ttl_seconds: float
+
+# Collections read-through cached by default; others are always read from Firestore
+DEFAULT_CACHE_CONFIG: Dict[str, CacheConfig] = {
+    'tasks': CacheConfig(max_size=2048, ttl_seconds=30),
+    'users': CacheConfig(max_size=4096, ttl_seconds=300),
+}
+
+def get_cache_config(collection_name: str) -> Optional[CacheConfig]:
+    """Get the cache settings for a collection, honouring MOONTRIP_CACHE_<COLLECTION>=size,ttl overrides"""
+    override = os.environ.get(f"MOONTRIP_CACHE_{collection_name.upper()}")
+    if override is not None:
+        if override.strip().lower() in ('', '0', 'off'):
+            return None
+        max_size, ttl_seconds = override.split(',')
+        return CacheConfig(max_size=int(max_size), ttl_seconds=float(ttl_seconds))
+    return DEFAULT_CACHE_CONFIG.get(collection_name)
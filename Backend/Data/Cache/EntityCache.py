@@ -0,0 +1,86 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+from .CacheConfig import CacheConfig, get_cache_config
+
+T = TypeVar('T')
+
+class EntityCache(Generic[T]):
+    """Thread-safe LRU cache with a per-entry TTL, shared by all repositories of a collection"""
+
+    _registry: Dict[str, 'EntityCache'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, config: CacheConfig):
+        self._config = config
+        self._entries: 'OrderedDict[str, Tuple[float, T]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def for_collection(cls, collection_name: str) -> Optional['EntityCache']:
+        """Get the process-wide cache for a collection, or None if it is not cached"""
+        with cls._registry_lock:
+            if collection_name not in cls._registry:
+                config = get_cache_config(collection_name)
+                cls._registry[collection_name] = cls(config) if config else None
+            return cls._registry[collection_name]
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Get hit/miss counters for every configured collection cache"""
+        with cls._registry_lock:
+            caches = dict(cls._registry)
+        return {name: cache.stats() for name, cache in caches.items() if cache is not None}
+
+    def get(self, id: str) -> Optional[T]:
+        """Get a copy of a cached entity, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(id)
+            self.hits += 1
+            entity = entry[1]
+        return copy.deepcopy(entity)
+
+    def put(self, id: str, entity: T) -> None:
+        """Store a copy of an entity, evicting the least recently used entry when full"""
+        stored = copy.deepcopy(entity)
+        with self._lock:
+            self._entries[id] = (time.monotonic() + self._config.ttl_seconds, stored)
+            self._entries.move_to_end(id)
+            while len(self._entries) > self._config.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, id: str) -> None:
+        """Drop an entity from the cache"""
+        with self._lock:
+            self._entries.pop(id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entities"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self._config.max_size,
+                'ttl_seconds': self._config.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,9 @@
+from Backend.Data.Cache.CacheConfig import CacheConfig, DEFAULT_CACHE_CONFIG, get_cache_config
+from Backend.Data.Cache.EntityCache import EntityCache
+
+__all__ = [
+    'CacheConfig',
+    'DEFAULT_CACHE_CONFIG',
+    'get_cache_config',
+    'EntityCache'
+]
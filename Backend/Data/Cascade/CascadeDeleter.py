@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+from google.cloud import firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
+from google.cloud.firestore_v1.field_path import FieldPath
+from ..Cache.EntityCache import EntityCache
+from .CascadeResult import CascadeResult
+
+DOCUMENT_ID = FieldPath.document_id()
+
+# (collection name, field holding the parent document ID)
+RelatedCollection = Tuple[str, str]
+
+TASK_RELATED_COLLECTIONS: Sequence[RelatedCollection] = (
+    ('task_members', 'task_id'),
+    ('task_comments', 'task_id'),
+    ('task_activities', 'task_id'),
+    ('task_attachments', 'task_id'),
+)
+
+# Documents enumerated per query page; only their references are read
+ENUMERATION_PAGE_SIZE = 1000
+MAX_ATTEMPTS = 5
+PROGRESS_EVERY = 500
+# Deletes do not create hotspots the way new writes do, so skip most of the 500/50/5 ramp-up
+BULK_WRITER_OPTIONS = BulkWriterOptions(initial_ops_per_second=2000, max_ops_per_second=10000)
+
+ProgressCallback = Callable[[CascadeResult], None]
+
+class CascadeDeleter:
+    """Deletes a document, its subcollections and the documents that reference it through a BulkWriter"""
+    
+    def __init__(self, db: firestore.Client, related: Sequence[RelatedCollection] = (),
+                 on_progress: Optional[ProgressCallback] = None, max_attempts: int = MAX_ATTEMPTS,
+                 max_ops_per_second: Optional[int] = None):
+        self._db = db
+        self._related = related
+        self._on_progress = on_progress
+        self._max_attempts = max_attempts
+        self._options = BULK_WRITER_OPTIONS
+        if max_ops_per_second is not None:
+            # Throttled cascades start and stay at the requested rate
+            self._options = BulkWriterOptions(initial_ops_per_second=max_ops_per_second,
+                                              max_ops_per_second=max_ops_per_second)
+        self._lock = threading.Lock()
+    
+    def delete(self, collection_name: str, id: str) -> CascadeResult:
+        """Delete the document and everything that hangs off it, returning the counts"""
+        result = CascadeResult()
+        started = time.monotonic()
+        writer = self._db.bulk_writer(options=self._options)
+        writer.on_write_result(lambda ref, write_result, bulk_writer: self._deleted(result, ref))
+        writer.on_write_error(lambda error, bulk_writer: self._retry(result, error))
+        
+        root = self._db.collection(collection_name).document(id)
+        try:
+            # Subcollections at any depth, e.g. tasks/{id}/mini_tasks
+            for subcollection in root.collections():
+                self._db.recursive_delete(subcollection, bulk_writer=writer)
+            
+            # Documents in other collections that point at the root
+            for related_collection, field in self._related:
+                query = self._db.collection(related_collection).where(field, '==', id)
+                for ref in self._references(query):
+                    writer.delete(ref)
+            
+            # The root goes last so a failed cascade can be resumed by deleting again
+            writer.flush()
+            writer.delete(root)
+        finally:
+            writer.close()
+            result.elapsed_seconds = time.monotonic() - started
+            self._report(result)
+        return result
+    
+    @staticmethod
+    def _references(query) -> Iterator[firestore.DocumentReference]:
+        """Yield the references matched by a query, reading one page of keys at a time"""
+        query = query.select([DOCUMENT_ID]).order_by(DOCUMENT_ID).limit(ENUMERATION_PAGE_SIZE)
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            docs = list(page.stream())
+            for doc in docs:
+                yield doc.reference
+            if len(docs) < ENUMERATION_PAGE_SIZE:
+                return
+            last_doc = docs[-1]
+    
+    def _deleted(self, result: CascadeResult, ref: firestore.DocumentReference) -> None:
+        """BulkWriter success callback"""
+        cache = EntityCache.for_collection(ref.parent.id)
+        if cache is not None:
+            cache.invalidate(ref.id)
+        with self._lock:
+            result.deleted += 1
+            report = result.deleted % PROGRESS_EVERY == 0
+        if report:
+            self._report(result)
+    
+    def _retry(self, result: CascadeResult, error) -> bool:
+        """BulkWriter error callback; returning True retries the write with backoff"""
+        if error.attempts < self._max_attempts:
+            return True
+        with self._lock:
+            result.failed += 1
+            result.errors.append(f"{error.operation.reference.path}: {error.message}")
+        return False
+    
+    def _report(self, result: CascadeResult) -> None:
+        if self._on_progress is not None:
+            self._on_progress(result)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass
+class CascadeResult:
+    """Outcome of a cascade delete"""
+    deleted: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def success(self) -> bool:
+        return self.failed == 0
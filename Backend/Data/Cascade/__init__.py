@@ -0,0 +1,8 @@
+from Backend.Data.Cascade.CascadeResult import CascadeResult
+from Backend.Data.Cascade.CascadeDeleter import CascadeDeleter, TASK_RELATED_COLLECTIONS
+
+__all__ = [
+    'CascadeResult',
+    'CascadeDeleter',
+    'TASK_RELATED_COLLECTIONS'
+]
@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, Optional
 from enum import Enum
+from .TrackedEntity import TrackedEntity
 @dataclass
-class Activity:
+class Activity(TrackedEntity):
     """Activity entity representing an activity log for a task"""
     id: str
     task_id: str
@@ -12,6 +13,20 @@ class Activity:
     description: str
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict = field(default_factory=dict)  # Additional activity data 
+    
+    @staticmethod
+    def create(task_id: str, user_id: str, activity_type: Any, metadata: Optional[Dict] = None) -> 'Activity':
+        """Build a new activity log entry from an ActivityType or its value"""
+        activity_type = getattr(activity_type, 'value', activity_type)
+        return Activity(
+            id=None,
+            task_id=task_id,
+            user_id=user_id,
+            activity_type=activity_type,
+            description=activity_type.replace('_', ' '),
+            created_at=datetime.utcnow(),
+            metadata=metadata or {}
+        )
 
     
 class ActivityType(Enum):
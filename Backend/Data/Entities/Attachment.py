@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from .TrackedEntity import TrackedEntity
 
 @dataclass
-class Attachment:
+class Attachment(TrackedEntity):
     """Attachment entity representing a file attached to a task"""
     id: str
     task_id: str
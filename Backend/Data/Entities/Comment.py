@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
+from .TrackedEntity import TrackedEntity
 
 @dataclass
-class Comment:
+class Comment(TrackedEntity):
     """Comment entity representing a comment on a task"""
     id: str
     task_id: str
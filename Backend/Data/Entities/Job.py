@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from ..Enums.JobStatus import JobStatus
+from .TrackedEntity import TrackedEntity
+
+@dataclass
+class Job(TrackedEntity):
+    """Job entity representing a persistent background job"""
+    id: str
+    type: str  # e.g., "delete_user", "delete_task"
+    params: Dict[str, Any] = field(default_factory=dict)
+    status: str = JobStatus.QUEUED.value
+    progress: Dict[str, Any] = field(default_factory=dict)
+    checkpoint: Dict[str, Any] = field(default_factory=dict)  # Where a resumed run continues
+    error: Optional[str] = None
+    attempts: int = 0
+    lease_owner: Optional[str] = None  # Worker currently running the job
+    lease_until: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
@@ -1,12 +1,24 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
+from .TrackedEntity import TrackedEntity
 
 @dataclass
-class Member:
+class Member(TrackedEntity):
     """Member entity representing a user's membership in a task"""
     id: str
     user_id: str
     task_id: str
     joined_at: datetime = field(default_factory=datetime.now)
-    role: Optional[str] = None  # e.g., "admin", "member", "viewer" 
\ No newline at end of file
+    role: Optional[str] = None  # e.g., "admin", "member", "viewer"
+    
+    @staticmethod
+    def membership_id(task_id: str, user_id: str) -> str:
+        """Document ID of the membership of a user in a task"""
+        return f"{task_id}_{user_id}"
+    
+    @staticmethod
+    def parse_membership_id(membership_id: str) -> Tuple[str, str]:
+        """Task and user IDs of a membership document ID; generated task IDs never contain '_'"""
+        task_id, _, user_id = membership_id.partition('_')
+        return task_id, user_id
@@ -2,9 +2,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 from ..Enums.TaskStatus import TaskStatus
+from .TrackedEntity import TrackedEntity
 
 @dataclass
-class Task:
+class Task(TrackedEntity):
     """Task entity representing a task in the system"""
     id: str
     title: str
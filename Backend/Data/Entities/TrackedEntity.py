@@ -0,0 +1,29 @@
+import copy
+from typing import Any, Dict, Optional
+
+class TrackedEntity:
+    """Base class for entities that track which fields changed since they were loaded"""
+
+    def to_document(self) -> Dict[str, Any]:
+        """Get the persisted fields of the entity, without tracking state"""
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
+
+    def mark_clean(self) -> None:
+        """Record the current field values as the state stored in Firestore"""
+        self.__dict__['_loaded_state'] = copy.deepcopy(self.to_document())
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the entity mirrors a stored document"""
+        return self.__dict__.get('_loaded_state') is not None
+
+    def changed_fields(self) -> Dict[str, Any]:
+        """Get the fields whose values differ from the loaded state, including in-place list edits"""
+        loaded: Optional[Dict[str, Any]] = self.__dict__.get('_loaded_state')
+        current = self.to_document()
+        if loaded is None:
+            return current
+        return {
+            key: value for key, value in current.items()
+            if key not in loaded or loaded[key] != value
+        }
@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
+from .TrackedEntity import TrackedEntity
 
 @dataclass
-class User:
+class User(TrackedEntity):
     """User entity representing a system user"""
     id: str
     email: str
@@ -1,17 +1,21 @@
+from Backend.Data.Entities.TrackedEntity import TrackedEntity
 from Backend.Data.Entities.Task import Task
 from Backend.Data.Entities.User import User
 from Backend.Data.Entities.Member import Member
 from Backend.Data.Entities.Comment import Comment
 from Backend.Data.Entities.Attachment import Attachment
 from Backend.Data.Entities.Activity import Activity
+from Backend.Data.Entities.Job import Job
 
 
 __all__ = [
+    'TrackedEntity',
     'User',
     'Task',
     'Member',
     'Comment',
     'Attachment',
     'Activity',
+    'Job',
 
 ] 
\ No newline at end of file
@@ -11,4 +11,9 @@ class ActivityType(Enum):
     ATTACHMENT_ADDED = "attachment_added"
     ATTACHMENT_DELETED = "attachment_deleted"
     STATUS_CHANGED = "status_changed"
-    ASSIGNEE_CHANGED = "assignee_changed" 
\ No newline at end of file
+    ASSIGNEE_CHANGED = "assignee_changed"
+    MEMBER_ADDED = "member_added"
+    MEMBER_ROLE_UPDATED = "member_role_updated"
+    MEMBER_REMOVED = "member_removed"
+    MEMBER_DEACTIVATED = "member_deactivated"
+    MEMBER_REACTIVATED = "member_reactivated"
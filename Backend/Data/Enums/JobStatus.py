@@ -0,0 +1,8 @@
+from enum import Enum
+
+class JobStatus(Enum):
+    """Enum representing the lifecycle of a background job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -2,10 +2,12 @@ from .ActivityType import ActivityType
 from .TaskStatus import TaskStatus
 from .TaskPriority import TaskPriority
 from .MemberRole import MemberRole
+from .JobStatus import JobStatus
 
 __all__ = [
     'ActivityType',
     'TaskStatus',
     'TaskPriority',
-    'MemberRole'
+    'MemberRole',
+    'JobStatus'
 ] 
\ No newline at end of file
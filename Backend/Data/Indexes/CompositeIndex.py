@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+ASCENDING = 'ASCENDING'
+DESCENDING = 'DESCENDING'
+# Array fields filtered with array_contains are indexed by membership rather than order
+ARRAY_CONTAINS = 'CONTAINS'
+
+@dataclass(frozen=True)
+class CompositeIndex:
+    """A Firestore composite index required by a repository query"""
+    collection: str
+    fields: Tuple[Tuple[str, str], ...]  # (field path, ASCENDING, DESCENDING or ARRAY_CONTAINS)
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Index entry in the format of firestore.indexes.json"""
+        return {
+            "collectionGroup": self.collection,
+            "queryScope": "COLLECTION",
+            "fields": [
+                {"fieldPath": path, "arrayConfig": order} if order == ARRAY_CONTAINS else {"fieldPath": path, "order": order}
+                for path, order in self.fields
+            ]
+        }
+
+def ordered_both_ways(collection: str, equality_fields: Tuple[str, ...], order_field: str) -> Tuple[CompositeIndex, ...]:
+    """Indexes for equality filters followed by a range or sort on one field, in either direction"""
+    prefix = tuple((path, ASCENDING) for path in equality_fields)
+    return tuple(
+        CompositeIndex(collection, prefix + ((order_field, direction),))
+        for direction in (ASCENDING, DESCENDING)
+    )
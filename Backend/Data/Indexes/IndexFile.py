@@ -0,0 +1,34 @@
+"""Generate firestore.indexes.json from the indexes declared by the repositories.
+
+Usage: python -m Backend.Data.Indexes.IndexFile [output path]
+"""
+import json
+import sys
+from typing import Any, Dict, Iterable
+from Backend.Data.Indexes.CompositeIndex import CompositeIndex
+from Backend.Data.Repositories.ActivityRepository import ActivityRepository
+from Backend.Data.Repositories.TaskRepository import TaskRepository
+
+# Repositories whose queries need composite indexes
+INDEXED_REPOSITORIES = (ActivityRepository, TaskRepository)
+
+DEFAULT_PATH = 'firestore.indexes.json'
+
+def build_index_file(indexes: Iterable[CompositeIndex]) -> Dict[str, Any]:
+    """Index file contents with duplicates removed, in a stable order"""
+    unique = sorted(set(indexes), key=lambda index: (index.collection, index.fields))
+    return {"indexes": [index.to_json() for index in unique], "fieldOverrides": []}
+
+def write_index_file(path: str = DEFAULT_PATH) -> int:
+    """Write the index file and return the number of indexes in it"""
+    contents = build_index_file(
+        index for repository in INDEXED_REPOSITORIES for index in repository.COMPOSITE_INDEXES
+    )
+    with open(path, 'w') as f:
+        json.dump(contents, f, indent=2)
+        f.write('\n')
+    return len(contents["indexes"])
+
+if __name__ == '__main__':
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    print(f"Wrote {write_index_file(output)} indexes to {output}")
@@ -0,0 +1,9 @@
+from Backend.Data.Indexes.CompositeIndex import CompositeIndex, ordered_both_ways, ASCENDING, DESCENDING, ARRAY_CONTAINS
+
+__all__ = [
+    'CompositeIndex',
+    'ordered_both_ways',
+    'ASCENDING',
+    'DESCENDING',
+    'ARRAY_CONTAINS'
+]
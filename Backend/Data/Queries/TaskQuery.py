@@ -0,0 +1,237 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+from google.cloud import firestore
+from ..Indexes.CompositeIndex import CompositeIndex, ASCENDING, DESCENDING, ARRAY_CONTAINS
+from ..Repositories.Repository.Cursor import DOCUMENT_ID, parse_order_by
+
+# Firestore accepts at most this many values in an 'in', 'not-in' or 'array-contains-any' filter
+MAX_DISJUNCTION = 10
+
+def _value(value: Any) -> Any:
+    """Stored representation of a filter value, unwrapping enums"""
+    return getattr(value, 'value', value)
+
+class UnindexedQueryError(ValueError):
+    """Raised when no declared composite index serves a compiled task query"""
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """One Firestore query of a plan; exact when Firestore applies every filter and the ordering"""
+    query: Any
+    exact: bool
+    # Composite index fields the query needs; empty when single-field indexes serve it
+    index_fields: Tuple[Tuple[str, str], ...] = ()
+    
+    def is_served_by(self, indexes: Iterable[CompositeIndex]) -> bool:
+        """Whether one of the indexes serves the query; equality fields may come in any order"""
+        if not self.index_fields:
+            return True
+        *equalities, ordered = self.index_fields
+        return any(
+            index.fields[-1] == ordered and sorted(index.fields[:-1]) == sorted(equalities)
+            for index in indexes
+        )
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """Composable task filter compiled into as few Firestore queries as possible"""
+    owner_id: Optional[str] = None
+    # Owned tasks plus these member tasks of visible_user_id
+    visible_user_id: Optional[str] = None
+    member_task_ids: Tuple[str, ...] = ()
+    statuses: Tuple[Any, ...] = ()
+    excluded_statuses: Tuple[Any, ...] = ()
+    priorities: Tuple[Any, ...] = ()
+    tags_all: Tuple[str, ...] = ()
+    tags_any: Tuple[str, ...] = ()
+    due_from: Optional[datetime] = None
+    due_to: Optional[datetime] = None
+    order_by: Optional[str] = None
+    limit: Optional[int] = None
+    
+    # Builders; each returns a new query so partial queries can be shared
+    
+    def owned_by(self, owner_id: str) -> 'TaskQuery':
+        return replace(self, owner_id=owner_id, visible_user_id=None, member_task_ids=())
+    
+    def visible_to(self, user_id: str, member_task_ids: Iterable[str]) -> 'TaskQuery':
+        """Tasks the user owns or is a member of"""
+        return replace(self, owner_id=None, visible_user_id=user_id,
+                       member_task_ids=tuple(dict.fromkeys(id for id in member_task_ids if id)))
+    
+    def with_status(self, *statuses: Any) -> 'TaskQuery':
+        return replace(self, statuses=tuple(_value(status) for status in statuses))
+    
+    def without_status(self, *statuses: Any) -> 'TaskQuery':
+        return replace(self, excluded_statuses=tuple(_value(status) for status in statuses))
+    
+    def with_priority(self, *priorities: Any) -> 'TaskQuery':
+        return replace(self, priorities=tuple(_value(priority) for priority in priorities))
+    
+    def tagged(self, *tags: str) -> 'TaskQuery':
+        """Tasks having all of the tags"""
+        return replace(self, tags_all=self.tags_all + tuple(tags))
+    
+    def tagged_any(self, *tags: str) -> 'TaskQuery':
+        """Tasks having at least one of the tags"""
+        return replace(self, tags_any=tuple(tags))
+    
+    def due_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> 'TaskQuery':
+        """Tasks due within [start, end]; either bound may be open"""
+        return replace(self, due_from=start, due_to=end)
+    
+    def ordered_by(self, order_by: Optional[str]) -> 'TaskQuery':
+        """Order by a field, '-field' for descending"""
+        return replace(self, order_by=order_by)
+    
+    def take(self, limit: Optional[int]) -> 'TaskQuery':
+        return replace(self, limit=limit)
+    
+    # Evaluation
+    
+    def matches(self, task: Any) -> bool:
+        """Apply every filter in memory; used for what Firestore could not evaluate"""
+        if self.owner_id is not None and task.owner_id != self.owner_id:
+            return False
+        if self.visible_user_id is not None and task.owner_id != self.visible_user_id \
+                and task.id not in self.member_task_ids:
+            return False
+        status = _value(task.status)
+        if self.statuses and status not in self.statuses:
+            return False
+        if status in self.excluded_statuses:
+            return False
+        if self.priorities and _value(task.priority) not in self.priorities:
+            return False
+        tags = task.tags or []
+        if any(tag not in tags for tag in self.tags_all):
+            return False
+        if self.tags_any and not any(tag in tags for tag in self.tags_any):
+            return False
+        if self.due_from is not None or self.due_to is not None:
+            if task.due_date is None:
+                return False
+            if self.due_from is not None and task.due_date < self.due_from:
+                return False
+            if self.due_to is not None and task.due_date > self.due_to:
+                return False
+        return True
+    
+    def sort(self, tasks: Iterable[Any]) -> List[Any]:
+        """Order merged results the way the query asks, then apply the limit"""
+        field_name, descending = parse_order_by(self.order_by)
+        if field_name:
+            # Missing values sort first, as they do in Firestore
+            key = lambda task: (getattr(task, field_name) is not None, _value(getattr(task, field_name)), task.id)
+        else:
+            key = lambda task: task.id
+        ordered = sorted(tasks, key=key, reverse=descending)
+        return ordered[:self.limit] if self.limit is not None else ordered
+    
+    # Compilation
+    
+    def compile(self, collection) -> List[CompiledQuery]:
+        """Firestore queries whose union, filtered by matches(), is the result"""
+        if self.visible_user_id is None:
+            base = collection.where('owner_id', '==', self.owner_id) if self.owner_id is not None else collection
+            return [self._compile(base, ('owner_id',) if self.owner_id is not None else ())]
+        
+        plans = [self._compile(collection.where('owner_id', '==', self.visible_user_id), ('owner_id',))]
+        # Member tasks are selected by ID, at most MAX_DISJUNCTION per query, so they are
+        # filtered and ordered in memory rather than needing an index for every filter combination
+        ids = list(self.member_task_ids)
+        for start in range(0, len(ids), MAX_DISJUNCTION):
+            refs = [collection.document(id) for id in ids[start:start + MAX_DISJUNCTION]]
+            plans.append(CompiledQuery(collection.where(DOCUMENT_ID, 'in', refs), exact=False))
+        return plans
+    
+    def _compile(self, query, equality_fields: Tuple[str, ...]) -> CompiledQuery:
+        """Push down every filter Firestore can combine; the rest is left to matches()"""
+        exact = True
+        has_range = self.due_from is not None or self.due_to is not None
+        disjunction_free = True
+        # Index entries of the equality and array filters pushed down, in the order they are added
+        index_prefix = [(path, ASCENDING) for path in equality_fields]
+        
+        def disjunction(field_path: str, op: str, values: Tuple[Any, ...]) -> bool:
+            nonlocal query, disjunction_free
+            if not disjunction_free or len(values) > MAX_DISJUNCTION:
+                return False
+            query = query.where(field_path, op, list(values))
+            disjunction_free = False
+            return True
+        
+        if len(self.statuses) == 1:
+            query = query.where('status', '==', self.statuses[0])
+            index_prefix.append(('status', ASCENDING))
+        elif self.statuses and disjunction('status', 'in', self.statuses):
+            index_prefix.append(('status', ASCENDING))
+        elif self.statuses:
+            exact = False
+        
+        if len(self.priorities) == 1:
+            query = query.where('priority', '==', self.priorities[0])
+            index_prefix.append(('priority', ASCENDING))
+        elif self.priorities and disjunction('priority', 'in', self.priorities):
+            index_prefix.append(('priority', ASCENDING))
+        elif self.priorities:
+            exact = False
+        
+        if self.tags_all:
+            query = query.where('tags', 'array_contains', self.tags_all[0])
+            index_prefix.append(('tags', ARRAY_CONTAINS))
+            exact &= len(self.tags_all) == 1
+            if self.tags_any:
+                # Firestore cannot combine array-contains with array-contains-any
+                exact = False
+        elif self.tags_any and disjunction('tags', 'array_contains_any', self.tags_any):
+            index_prefix.append(('tags', ARRAY_CONTAINS))
+        elif self.tags_any:
+            exact = False
+        
+        field_name, descending = parse_order_by(self.order_by)
+        # The one field Firestore orders the index scan by: the range field, else the sort field
+        index_order = None
+        
+        if self.excluded_statuses:
+            # not-in is an inequality, so it cannot share the query with the due-date range or another ordering
+            if not has_range and field_name in (None, 'status') and disjunction('status', 'not-in', self.excluded_statuses):
+                index_order = ('status', DESCENDING if descending else ASCENDING)
+            else:
+                exact = False
+        
+        if self.due_from is not None:
+            query = query.where('due_date', '>=', self.due_from)
+        if self.due_to is not None:
+            query = query.where('due_date', '<=', self.due_to)
+        if has_range:
+            index_order = ('due_date', DESCENDING if descending and field_name == 'due_date' else ASCENDING)
+        
+        direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+        if field_name and (not has_range or field_name == 'due_date'):
+            query = query.order_by(field_name, direction=direction).order_by(DOCUMENT_ID, direction=direction)
+            index_order = (field_name, DESCENDING if descending else ASCENDING)
+            ordered = True
+        else:
+            # A range query is ordered by its range field first; other orders are applied in memory
+            ordered = not field_name and not has_range
+        
+        # A limit can only be sent when Firestore returns exactly the wanted rows in the wanted order
+        if exact and ordered and self.limit is not None:
+            query = query.limit(self.limit)
+        
+        # Equality filters alone are served by merging single-field indexes, and so is a lone ordering
+        index_fields = tuple(index_prefix) + (index_order,) if index_prefix and index_order else ()
+        return CompiledQuery(query, exact and ordered, index_fields)
+    
+    def compile_indexed(self, collection, indexes: Iterable[CompositeIndex]) -> List[CompiledQuery]:
+        """compile(), rejecting the query when a compiled part is not served by one of the indexes"""
+        indexes = tuple(indexes)
+        plans = self.compile(collection)
+        for plan in plans:
+            if not plan.is_served_by(indexes):
+                fields = ', '.join(f"{path} {order.lower()}" for path, order in plan.index_fields)
+                raise UnindexedQueryError(f"No index serves a task query on ({fields}); "
+                                          "use fewer filters or another order")
+        return plans
@@ -0,0 +1,7 @@
+from Backend.Data.Queries.TaskQuery import TaskQuery, CompiledQuery, UnindexedQueryError
+
+__all__ = [
+    'TaskQuery',
+    'CompiledQuery',
+    'UnindexedQueryError'
+]
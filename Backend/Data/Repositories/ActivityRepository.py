@@ -1,27 +1,90 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Iterator
 from Backend.Data.Entities.Activity import Activity
-from Backend.Data.Repositories.Repository.BaseRepository import BaseRepository
+from Backend.Data.Repositories.Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
+from Backend.Data.Sinks.ActivitySink import ActivitySink
+from Backend.Data.Indexes.CompositeIndex import ordered_both_ways
 
 class ActivityRepository(BaseRepository[Activity]):
     """Repository for Activity entities"""
     
-    def __init__(self):
-        super().__init__('task_activities')
+    # Time-ordered queries within a task, optionally narrowed to one activity type
+    COMPOSITE_INDEXES = (
+        ordered_both_ways('task_activities', ('task_id',), 'created_at')
+        + ordered_both_ways('task_activities', ('task_id', 'activity_type'), 'created_at')
+    )
     
-    def find_by_task(self, task_id: str) -> List[Activity]:
+    def __init__(self, sink: Optional[ActivitySink] = None):
+        super().__init__('task_activities', Activity)
+        self._sink = sink
+    
+    def create_activity(self, task_id: str, user_id: str, activity_type: Any,
+                        metadata: Optional[Dict[str, Any]] = None) -> Activity:
+        """Log an activity through the write-behind sink, once the open unit of work commits"""
+        activity = Activity.create(task_id, user_id, activity_type, metadata)
+        if self._sink is None:
+            self.add(activity)
+        elif self._buffering:
+            self._write_buffer.after_commit(lambda: self._sink.put(activity))
+        else:
+            self._sink.put(activity)
+        return activity
+    
+    def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
         """Find all activities for a specific task"""
         query = self.collection.where('task_id', '==', task_id)
-        docs = query.stream()
-        return [Activity(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Activity]:
+        """Lazily iterate over all activities for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
     
-    def find_by_user(self, user_id: str) -> List[Activity]:
+    def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
         """Find all activities performed by a specific user"""
         query = self.collection.where('user_id', '==', user_id)
-        docs = query.stream()
-        return [Activity(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Activity]:
+        """Lazily iterate over all activities performed by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
     
-    def find_by_activity_type(self, activity_type: str) -> List[Activity]:
+    def find_by_activity_type(self, activity_type: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
         """Find all activities of a specific type"""
         query = self.collection.where('activity_type', '==', activity_type)
-        docs = query.stream()
-        return [Activity(**doc.to_dict()) for doc in docs] 
\ No newline at end of file
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_activity_type(self, activity_type: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Activity]:
+        """Lazily iterate over all activities of a specific type"""
+        query = self.collection.where('activity_type', '==', activity_type)
+        return self._iter(query, page_size)
+    
+    def _timeline_query(self, task_id: str, start: Optional[datetime], end: Optional[datetime],
+                        activity_type: Optional[str]):
+        """Filter a task's activities by type and created_at range on the server"""
+        query = self.collection.where('task_id', '==', task_id)
+        if activity_type is not None:
+            query = query.where('activity_type', '==', activity_type)
+        if start is not None:
+            query = query.where('created_at', '>=', start)
+        if end is not None:
+            query = query.where('created_at', '<=', end)
+        return query
+    
+    def find_by_task_in_range(self, task_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                              activity_type: Optional[str] = None, limit: Optional[int] = None,
+                              newest_first: bool = False, start_after: Optional[str] = None) -> List[Activity]:
+        """Find a task's activities created within [start, end], ordered by time"""
+        query = self._timeline_query(task_id, start, end, activity_type)
+        order_by = '-created_at' if newest_first else 'created_at'
+        return self._find(query, limit, order_by, start_after)
+    
+    def find_by_task_and_type(self, task_id: str, activity_type: str, limit: Optional[int] = None,
+                              newest_first: bool = False, start_after: Optional[str] = None) -> List[Activity]:
+        """Find a task's activities of one type, ordered by time"""
+        return self.find_by_task_in_range(task_id, activity_type=activity_type, limit=limit,
+                                          newest_first=newest_first, start_after=start_after)
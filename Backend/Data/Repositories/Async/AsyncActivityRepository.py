@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, AsyncIterator
+from ...Entities.Activity import Activity
+from ...Sinks.ActivitySink import ActivitySink
+from ..Repository.AsyncBaseRepository import AsyncBaseRepository, ITER_PAGE_SIZE
+
+class AsyncActivityRepository(AsyncBaseRepository[Activity]):
+    """Async repository for Activity entities"""
+    
+    def __init__(self, sink: Optional[ActivitySink] = None):
+        super().__init__('task_activities', Activity)
+        self._sink = sink
+    
+    async def create_activity(self, task_id: str, user_id: str, activity_type: Any,
+                              metadata: Optional[Dict[str, Any]] = None) -> Activity:
+        """Log an activity through the write-behind sink, once the open unit of work commits"""
+        activity = Activity.create(task_id, user_id, activity_type, metadata)
+        if self._sink is None:
+            await self.add(activity)
+        elif self._buffering:
+            self._write_buffer.after_commit(lambda: self._enqueue(activity))
+        elif not self._sink.offer(activity):
+            # Queue is full: wait for room on a worker thread rather than on the event loop
+            await asyncio.to_thread(self._sink.put, activity)
+        return activity
+    
+    def _enqueue(self, activity: Activity) -> None:
+        """Queue an activity from the event loop without blocking it"""
+        if not self._sink.offer(activity):
+            asyncio.get_running_loop().run_in_executor(None, self._sink.put, activity)
+    
+    async def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
+        """Find all activities for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Activity]:
+        """Lazily iterate over all activities for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
+    
+    async def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
+        """Find all activities performed by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Activity]:
+        """Lazily iterate over all activities performed by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
+    
+    async def find_by_activity_type(self, activity_type: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Activity]:
+        """Find all activities of a specific type"""
+        query = self.collection.where('activity_type', '==', activity_type)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_activity_type(self, activity_type: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Activity]:
+        """Lazily iterate over all activities of a specific type"""
+        query = self.collection.where('activity_type', '==', activity_type)
+        return self._iter(query, page_size)
+    
+    def _timeline_query(self, task_id: str, start: Optional[datetime], end: Optional[datetime],
+                        activity_type: Optional[str]):
+        """Filter a task's activities by type and created_at range; see ActivityRepository.COMPOSITE_INDEXES"""
+        query = self.collection.where('task_id', '==', task_id)
+        if activity_type is not None:
+            query = query.where('activity_type', '==', activity_type)
+        if start is not None:
+            query = query.where('created_at', '>=', start)
+        if end is not None:
+            query = query.where('created_at', '<=', end)
+        return query
+    
+    async def find_by_task_in_range(self, task_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                                    activity_type: Optional[str] = None, limit: Optional[int] = None,
+                                    newest_first: bool = False, start_after: Optional[str] = None) -> List[Activity]:
+        """Find a task's activities created within [start, end], ordered by time"""
+        query = self._timeline_query(task_id, start, end, activity_type)
+        order_by = '-created_at' if newest_first else 'created_at'
+        return await self._find(query, limit, order_by, start_after)
+    
+    async def find_by_task_and_type(self, task_id: str, activity_type: str, limit: Optional[int] = None,
+                                    newest_first: bool = False, start_after: Optional[str] = None) -> List[Activity]:
+        """Find a task's activities of one type, ordered by time"""
+        return await self.find_by_task_in_range(task_id, activity_type=activity_type, limit=limit,
+                                                newest_first=newest_first, start_after=start_after)
@@ -0,0 +1,42 @@
+from typing import List, Optional, AsyncIterator
+from ...Entities.Attachment import Attachment
+from ..Repository.AsyncBaseRepository import AsyncBaseRepository, ITER_PAGE_SIZE
+
+class AsyncAttachmentRepository(AsyncBaseRepository[Attachment]):
+    """Async repository for Attachment entities"""
+    
+    def __init__(self):
+        super().__init__('task_attachments', Attachment)
+    
+    async def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
+        """Find all attachments for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Attachment]:
+        """Lazily iterate over all attachments for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
+    
+    async def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
+        """Find all attachments uploaded by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Attachment]:
+        """Lazily iterate over all attachments uploaded by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
+    
+    async def find_by_file_type(self, file_type: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
+        """Find all attachments of a specific file type"""
+        query = self.collection.where('file_type', '==', file_type)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_file_type(self, file_type: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Attachment]:
+        """Lazily iterate over all attachments of a specific file type"""
+        query = self.collection.where('file_type', '==', file_type)
+        return self._iter(query, page_size)
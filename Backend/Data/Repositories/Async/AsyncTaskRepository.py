@@ -0,0 +1,93 @@
+import asyncio
+from typing import List, Optional, AsyncIterator, TYPE_CHECKING
+from ...Entities.Task import Task
+from ...Enums.TaskStatus import TaskStatus
+from ..Repository.AsyncBaseRepository import AsyncBaseRepository, ITER_PAGE_SIZE
+from ...Cascade.CascadeDeleter import CascadeDeleter, ProgressCallback, TASK_RELATED_COLLECTIONS
+from ...Cascade.CascadeResult import CascadeResult
+from ...Database.FirestoreClient import FirestoreClient
+from ..TaskRepository import TaskRepository
+
+if TYPE_CHECKING:
+    from ...Queries.TaskQuery import TaskQuery
+
+class AsyncTaskRepository(AsyncBaseRepository[Task]):
+    """Async repository for Task entities"""
+    
+    def __init__(self):
+        super().__init__('tasks', Task)
+    
+    async def find_by_owner(self, owner_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
+        """Find all tasks owned by a specific user"""
+        query = self.collection.where('owner_id', '==', owner_id)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_owner(self, owner_id: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Task]:
+        """Lazily iterate over all tasks owned by a specific user"""
+        query = self.collection.where('owner_id', '==', owner_id)
+        return self._iter(query, page_size)
+    
+    async def find_ids_by_owner(self, owner_id: str) -> List[str]:
+        """Get the IDs of the tasks owned by a user without reading their fields"""
+        query = self.collection.where('owner_id', '==', owner_id).select([])
+        return [doc.id async for doc in query.stream(transaction=self._transaction)]
+    
+    async def find_by_status(self, status: TaskStatus, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
+        """Find all tasks with a specific status"""
+        query = self.collection.where('status', '==', status.value)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_status(self, status: TaskStatus, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Task]:
+        """Lazily iterate over all tasks with a specific status"""
+        query = self.collection.where('status', '==', status.value)
+        return self._iter(query, page_size)
+    
+    async def find_by_tag(self, tag: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
+        """Find all tasks with a specific tag"""
+        query = self.collection.where('tags', 'array_contains', tag)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_tag(self, tag: str, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Task]:
+        """Lazily iterate over all tasks with a specific tag"""
+        query = self.collection.where('tags', 'array_contains', tag)
+        return self._iter(query, page_size)
+    
+    async def find_by_priority(self, priority: int, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
+        """Find all tasks with a specific priority"""
+        query = self.collection.where('priority', '==', priority)
+        return await self._find(query, limit, order_by, start_after)
+    
+    def iter_by_priority(self, priority: int, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[Task]:
+        """Lazily iterate over all tasks with a specific priority"""
+        query = self.collection.where('priority', '==', priority)
+        return self._iter(query, page_size)
+    
+    async def find_by_query(self, task_query: 'TaskQuery') -> List[Task]:
+        """Run the Firestore queries a TaskQuery compiles to concurrently, then the filtering and ordering they could not do"""
+        async def run(query) -> List[Task]:
+            return [self._hydrate(doc) async for doc in query.stream(transaction=self._transaction)]
+        
+        found = {}
+        plans = task_query.compile_indexed(self.collection, TaskRepository.COMPOSITE_INDEXES)
+        for tasks in await asyncio.gather(*(run(compiled.query) for compiled in plans)):
+            for task in tasks:
+                if task_query.matches(task):
+                    found[task.id] = task
+        return task_query.sort(found.values())
+    
+    async def delete_cascade(self, task_id: str, on_progress: Optional[ProgressCallback] = None,
+                       max_ops_per_second: Optional[int] = None) -> CascadeResult:
+        """Delete a task with its subcollections and related documents; runs immediately, outside the unit of work"""
+        self._forget(task_id)
+        # BulkWriter only exists on the sync client, so the cascade runs on a worker thread
+        deleter = CascadeDeleter(FirestoreClient().db, TASK_RELATED_COLLECTIONS, on_progress,
+                                 max_ops_per_second=max_ops_per_second)
+        result = await asyncio.to_thread(deleter.delete, self._collection_name, task_id)
+        if result.success:
+            # The cascade bypasses the write buffer, so observers hear about it right away
+            self._notify('entity_deleted', task_id, deferred=False)
+        return result
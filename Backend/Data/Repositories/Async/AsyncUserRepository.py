@@ -0,0 +1,19 @@
+from typing import Optional
+from ...Entities.User import User
+from ..Repository.AsyncBaseRepository import AsyncBaseRepository
+
+class AsyncUserRepository(AsyncBaseRepository[User]):
+    """Async repository for User entities"""
+    
+    def __init__(self):
+        super().__init__('users', User)
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find a user by their email address"""
+        query = self.collection.where('email', '==', email)
+        return await self._find_one(query)
+    
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Find a user by their username"""
+        query = self.collection.where('username', '==', username)
+        return await self._find_one(query)
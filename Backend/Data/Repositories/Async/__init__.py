@@ -0,0 +1,15 @@
+from Backend.Data.Repositories.Async.AsyncUserRepository import AsyncUserRepository
+from Backend.Data.Repositories.Async.AsyncTaskRepository import AsyncTaskRepository
+from Backend.Data.Repositories.Async.AsyncMemberRepository import AsyncMemberRepository
+from Backend.Data.Repositories.Async.AsyncCommentRepository import AsyncCommentRepository
+from Backend.Data.Repositories.Async.AsyncAttachmentRepository import AsyncAttachmentRepository
+from Backend.Data.Repositories.Async.AsyncActivityRepository import AsyncActivityRepository
+
+__all__ = [
+    'AsyncUserRepository',
+    'AsyncTaskRepository',
+    'AsyncMemberRepository',
+    'AsyncCommentRepository',
+    'AsyncAttachmentRepository',
+    'AsyncActivityRepository'
+]
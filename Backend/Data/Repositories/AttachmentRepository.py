@@ -1,26 +1,41 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator
 from ..Entities.Attachment import Attachment
-from .Repository.BaseRepository import BaseRepository
+from .Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
 class AttachmentRepository(BaseRepository[Attachment]):
     """Repository for Attachment entities"""
     
     def __init__(self):
-        super().__init__('task_attachments')
+        super().__init__('task_attachments', Attachment)
     
-    def find_by_task(self, task_id: str) -> List[Attachment]:
+    def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
         """Find all attachments for a specific task"""
         query = self.collection.where('task_id', '==', task_id)
-        docs = query.stream()
-        return [Attachment(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
     
-    def find_by_user(self, user_id: str) -> List[Attachment]:
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Attachment]:
+        """Lazily iterate over all attachments for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
+    
+    def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
         """Find all attachments uploaded by a specific user"""
         query = self.collection.where('user_id', '==', user_id)
-        docs = query.stream()
-        return [Attachment(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Attachment]:
+        """Lazily iterate over all attachments uploaded by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
     
-    def find_by_file_type(self, file_type: str) -> List[Attachment]:
+    def find_by_file_type(self, file_type: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Attachment]:
         """Find all attachments of a specific file type"""
         query = self.collection.where('file_type', '==', file_type)
-        docs = query.stream()
-        return [Attachment(**doc.to_dict()) for doc in docs] 
\ No newline at end of file
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_file_type(self, file_type: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Attachment]:
+        """Lazily iterate over all attachments of a specific file type"""
+        query = self.collection.where('file_type', '==', file_type)
+        return self._iter(query, page_size) 
\ No newline at end of file
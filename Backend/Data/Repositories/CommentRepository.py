@@ -1,27 +1,42 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator
 from ..Entities.Comment import Comment
-from .Repository.BaseRepository import BaseRepository
+from .Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
 
 class CommentRepository(BaseRepository[Comment]):
     """Repository for Comment entities"""
     
     def __init__(self):
-        super().__init__('task_comments')
+        super().__init__('task_comments', Comment)
     
-    def find_by_task(self, task_id: str) -> List[Comment]:
+    def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Comment]:
         """Find all comments for a specific task"""
         query = self.collection.where('task_id', '==', task_id)
-        docs = query.stream()
-        return [Comment(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
     
-    def find_by_user(self, user_id: str) -> List[Comment]:
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Comment]:
+        """Lazily iterate over all comments for a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
+    
+    def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Comment]:
         """Find all comments made by a specific user"""
         query = self.collection.where('user_id', '==', user_id)
-        docs = query.stream()
-        return [Comment(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Comment]:
+        """Lazily iterate over all comments made by a specific user"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
     
-    def find_replies(self, parent_comment_id: str) -> List[Comment]:
+    def find_replies(self, parent_comment_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Comment]:
         """Find all replies to a specific comment"""
         query = self.collection.where('parent_comment_id', '==', parent_comment_id)
-        docs = query.stream()
-        return [Comment(**doc.to_dict()) for doc in docs] 
\ No newline at end of file
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_replies(self, parent_comment_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Comment]:
+        """Lazily iterate over all replies to a specific comment"""
+        query = self.collection.where('parent_comment_id', '==', parent_comment_id)
+        return self._iter(query, page_size) 
\ No newline at end of file
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+from google.cloud import firestore
+from Backend.Data.Entities.Job import Job
+from Backend.Data.Enums.JobStatus import JobStatus
+from Backend.Data.Repositories.Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
+
+class JobRepository(BaseRepository[Job]):
+    """Repository for Job entities"""
+    
+    def __init__(self):
+        super().__init__('jobs', Job)
+    
+    def find_by_status(self, status: JobStatus, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Job]:
+        """Find all jobs in a specific state"""
+        query = self.collection.where('status', '==', status.value)
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_status(self, status: JobStatus, page_size: int = ITER_PAGE_SIZE) -> Iterator[Job]:
+        """Lazily iterate over all jobs in a specific state"""
+        query = self.collection.where('status', '==', status.value)
+        return self._iter(query, page_size)
+    
+    def claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[Job]:
+        """Atomically take a queued job, or a running one whose lease expired or already names this owner, for a worker
+
+        A lease held under the worker's own owner string was left by an earlier process with the same
+        host name and PID, such as a restarted container; callers never claim a job they are still running.
+        """
+        ref = self.collection.document(job_id)
+        
+        @firestore.transactional
+        def claim_in_transaction(transaction) -> Optional[Job]:
+            doc = ref.get(transaction=transaction)
+            if not doc.exists:
+                return None
+            job = self._to_entity(doc)
+            now = datetime.now(timezone.utc)
+            abandoned = job.status == JobStatus.RUNNING.value and (
+                job.lease_until is None or job.lease_until < now or job.lease_owner == owner)
+            if job.status != JobStatus.QUEUED.value and not abandoned:
+                return None
+            job.status = JobStatus.RUNNING.value
+            job.lease_owner = owner
+            job.lease_until = now + timedelta(seconds=lease_seconds)
+            job.attempts += 1
+            job.updated_at = now
+            transaction.update(ref, job.changed_fields())
+            job.mark_clean()
+            return job
+        
+        return claim_in_transaction(self._client.db.transaction())
+    
+    def save(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Write job state immediately; jobs are never part of a request's unit of work"""
+        self._update(self.collection.document(job_id), dict(fields, updated_at=datetime.now(timezone.utc)))
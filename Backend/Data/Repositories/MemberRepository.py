@@ -1,30 +1,60 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Iterator
 from ..Entities.Member import Member
-from .Repository.BaseRepository import BaseRepository
+from .Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
 
 class MemberRepository(BaseRepository[Member]):
     """Repository for Member entities"""
     
     def __init__(self):
-        super().__init__('task_members')
+        super().__init__('task_members', Member)
     
-    def find_by_task(self, task_id: str) -> List[Member]:
+    def find_by_task(self, task_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Member]:
         """Find all members of a specific task"""
         query = self.collection.where('task_id', '==', task_id)
-        docs = query.stream()
-        return [Member(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
     
-    def find_by_user(self, user_id: str) -> List[Member]:
+    def iter_by_task(self, task_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Member]:
+        """Lazily iterate over all members of a specific task"""
+        query = self.collection.where('task_id', '==', task_id)
+        return self._iter(query, page_size)
+    
+    def find_by_user(self, user_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Member]:
         """Find all tasks a user is a member of"""
         query = self.collection.where('user_id', '==', user_id)
-        docs = query.stream()
-        return [Member(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_user(self, user_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Member]:
+        """Lazily iterate over all tasks a user is a member of"""
+        query = self.collection.where('user_id', '==', user_id)
+        return self._iter(query, page_size)
 
     
+    def find_task_ids_by_user(self, user_id: str) -> List[str]:
+        """Get the IDs of the tasks a user is a member of, reading only the task_id field"""
+        query = self.collection.where('user_id', '==', user_id).select(['task_id'])
+        return [doc.get('task_id') for doc in query.stream(transaction=self._transaction)]
+    
     def find_by_task_and_user(self, task_id: str, user_id: str) -> Optional[Member]:
         """Find a specific task member by task and user IDs"""
-        query = self.collection.where('task_id', '==', task_id).where('user_id', '==', user_id).limit(1)
-        docs = query.stream()
-        for doc in docs:
-            return Member(**doc.to_dict())
-        return None 
\ No newline at end of file
+        return self.find_by_id(Member.membership_id(task_id, user_id))
+    
+    def add_member(self, task_id: str, user_id: str, role: Optional[str] = None) -> Member:
+        """Add a user to a task; adding the same user again overwrites the membership"""
+        member = Member(
+            id=Member.membership_id(task_id, user_id),
+            user_id=user_id,
+            task_id=task_id,
+            joined_at=datetime.utcnow(),
+            role=role
+        )
+        self.add(member)
+        return member
+    
+    def remove_member(self, task_id: str, user_id: str) -> None:
+        """Remove a user from a task"""
+        membership_id = Member.membership_id(task_id, user_id)
+        self._delete(self.collection.document(membership_id))
+        self._notify('entity_deleted', membership_id)
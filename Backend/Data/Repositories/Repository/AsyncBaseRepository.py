@@ -0,0 +1,131 @@
+import asyncio
+from typing import Generic, TypeVar, List, Optional, Type, Iterable, AsyncIterator, Dict, Any
+from ...Database.AsyncFirestoreClient import AsyncFirestoreClient
+from .Cursor import DOCUMENT_ID
+from .RepositoryCore import RepositoryCore, GET_ALL_CHUNK_SIZE, ITER_PAGE_SIZE
+
+T = TypeVar('T')
+
+class AsyncBaseRepository(RepositoryCore[T], Generic[T]):
+    """Base repository implementation using the asyncio Firestore client"""
+
+    def __init__(self, collection_name: str, entity_type: Type[T]):
+        """Initialize repository with Firestore collection name and entity type"""
+        super().__init__(collection_name, entity_type, AsyncFirestoreClient())
+
+    async def _set(self, ref, data: Dict[str, Any]) -> None:
+        """Write a full document now or queue it in the unit of work"""
+        self._invalidate(ref.id)
+        if self._buffering:
+            self._write_buffer.set(ref, data)
+        else:
+            await ref.set(data)
+
+    async def _update(self, ref, fields: Dict[str, Any]) -> None:
+        """Update only the given fields now or queue the update in the unit of work"""
+        self._invalidate(ref.id)
+        if self._buffering:
+            self._write_buffer.update(ref, fields)
+        else:
+            await ref.update(fields)
+
+    async def _delete(self, ref) -> None:
+        """Delete a document now or queue the deletion in the unit of work"""
+        self._forget(ref.id)
+        if self._buffering:
+            self._write_buffer.delete(ref)
+        else:
+            await ref.delete()
+
+    async def _find(self, query, limit: Optional[int] = None, order_by: Optional[str] = None,
+                    start_after: Optional[str] = None) -> List[T]:
+        """Run a query with optional pagination and build entities from the results"""
+        query = self._paginate(query, limit, order_by, start_after)
+        return [self._hydrate(doc) async for doc in query.stream(transaction=self._transaction)]
+
+    async def _find_one(self, query) -> Optional[T]:
+        """Run a query and build the first matching entity, if any"""
+        async for doc in query.limit(1).stream(transaction=self._transaction):
+            return self._hydrate(doc)
+        return None
+
+    async def _iter(self, query, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[T]:
+        """Lazily yield entities from a query, reading one bounded page at a time"""
+        query = query.order_by(DOCUMENT_ID).limit(page_size)
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            count = 0
+            async for doc in page.stream():
+                count += 1
+                last_doc = doc
+                yield self._to_entity(doc)
+            if count < page_size:
+                return
+
+    async def get_all(self, limit: Optional[int] = None, order_by: Optional[str] = None,
+                      start_after: Optional[str] = None) -> List[T]:
+        """Get all entities from the collection"""
+        return await self._find(self.collection, limit, order_by, start_after)
+
+    def iter_all(self, page_size: int = ITER_PAGE_SIZE) -> AsyncIterator[T]:
+        """Lazily iterate over all entities in the collection"""
+        return self._iter(self.collection, page_size)
+
+    async def find_by_id(self, id: str) -> Optional[T]:
+        """Find an entity by its ID"""
+        loaded = self._loaded(id)
+        if loaded is not None:
+            return loaded
+        doc = await self.collection.document(id).get(transaction=self._transaction)
+        return self._remember(doc) if doc.exists else None
+
+    async def _get_chunk(self, ids: List[str]) -> list:
+        """Read one chunk of documents with a single batched get_all"""
+        refs = [self.collection.document(id) for id in ids]
+        return [doc async for doc in self._client.db.get_all(refs, transaction=self._transaction)]
+
+    async def find_by_ids(self, ids: Iterable[str]) -> List[T]:
+        """Find entities by their IDs, reading all chunks concurrently and keeping the input order"""
+        unique_ids = self._unique_ids(ids)
+        found = {}
+        for id in unique_ids:
+            loaded = self._loaded(id)
+            if loaded is not None:
+                found[id] = loaded
+        missing = [id for id in unique_ids if id not in found]
+        chunks = [missing[start:start + GET_ALL_CHUNK_SIZE] for start in range(0, len(missing), GET_ALL_CHUNK_SIZE)]
+        for docs in await asyncio.gather(*(self._get_chunk(chunk) for chunk in chunks)):
+            for doc in docs:
+                if doc.exists:
+                    found[doc.id] = self._remember(doc)
+        return [found[id] for id in unique_ids if id in found]
+
+    async def update(self, entity: T) -> None:
+        """Update an existing entity, sending only the fields changed since it was loaded"""
+        if not hasattr(entity, 'id'):
+            return
+        ref = self.collection.document(entity.id)
+        changes = self._partial_changes(entity)
+        if changes is None:
+            await self._set(ref, self._to_document(entity))
+        elif changes:
+            await self._update(ref, changes)
+            self._mark_clean(entity)
+        else:
+            return
+        self._notify('entity_saved', entity)
+
+    async def delete(self, entity: T) -> None:
+        """Delete an entity"""
+        if hasattr(entity, 'id'):
+            await self._delete(self.collection.document(entity.id))
+            self._notify('entity_deleted', entity.id)
+
+    async def add(self, entity: T) -> None:
+        """Add a new entity, assigning a generated ID when it has none"""
+        ref = self._new_ref(entity)
+        await self._set(ref, self._to_document(entity))
+        self._mark_clean(entity)
+        self._map(ref.id, entity)
+        self._notify('entity_saved', entity)
@@ -1,40 +1,122 @@
-from typing import Generic, TypeVar, List, Optional
+from typing import Generic, TypeVar, List, Optional, Type, Iterable, Iterator, Dict, Any
+from google.cloud import firestore
 from ...Database.FirestoreClient import FirestoreClient
 from .IRepository import IRepository
+from .Cursor import DOCUMENT_ID
+from .RepositoryCore import RepositoryCore, GET_ALL_CHUNK_SIZE, ITER_PAGE_SIZE
 
 T = TypeVar('T')
 
-class BaseRepository(IRepository[T], Generic[T]):
+class BaseRepository(RepositoryCore[T], IRepository[T], Generic[T]):
     """Base repository implementation using Firestore"""
-    
-    def __init__(self, collection_name: str):
-        """Initialize repository with Firestore collection name"""
-        self._client = FirestoreClient()
-        self.collection = self._client.get_collection(collection_name)
-    
-    def get_all(self) -> List[T]:
+
+    def __init__(self, collection_name: str, entity_type: Type[T]):
+        """Initialize repository with Firestore collection name and entity type"""
+        super().__init__(collection_name, entity_type, FirestoreClient())
+
+    def _set(self, ref: firestore.DocumentReference, data: Dict[str, Any]) -> None:
+        """Write a full document now or queue it in the unit of work"""
+        self._invalidate(ref.id)
+        if self._buffering:
+            self._write_buffer.set(ref, data)
+        else:
+            ref.set(data)
+
+    def _update(self, ref: firestore.DocumentReference, fields: Dict[str, Any]) -> None:
+        """Update only the given fields now or queue the update in the unit of work"""
+        self._invalidate(ref.id)
+        if self._buffering:
+            self._write_buffer.update(ref, fields)
+        else:
+            ref.update(fields)
+
+    def _delete(self, ref: firestore.DocumentReference) -> None:
+        """Delete a document now or queue the deletion in the unit of work"""
+        self._forget(ref.id)
+        if self._buffering:
+            self._write_buffer.delete(ref)
+        else:
+            ref.delete()
+
+    def _find(self, query, limit: Optional[int] = None, order_by: Optional[str] = None,
+              start_after: Optional[str] = None) -> List[T]:
+        """Run a query with optional pagination and build entities from the results"""
+        docs = self._paginate(query, limit, order_by, start_after).stream(transaction=self._transaction)
+        return [self._hydrate(doc) for doc in docs]
+
+    def _iter(self, query, page_size: int = ITER_PAGE_SIZE) -> Iterator[T]:
+        """Lazily yield entities from a query, reading one bounded page at a time"""
+        query = query.order_by(DOCUMENT_ID).limit(page_size)
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            count = 0
+            for doc in page.stream():
+                count += 1
+                last_doc = doc
+                yield self._to_entity(doc)
+            if count < page_size:
+                return
+
+    def get_all(self, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[T]:
         """Get all entities from the collection"""
-        docs = self.collection.stream()
-        return [doc.to_dict() for doc in docs]
-    
+        return self._find(self.collection, limit, order_by, start_after)
+
+    def iter_all(self, page_size: int = ITER_PAGE_SIZE) -> Iterator[T]:
+        """Lazily iterate over all entities in the collection"""
+        return self._iter(self.collection, page_size)
+
     def find_by_id(self, id: str) -> Optional[T]:
         """Find an entity by its ID"""
-        doc = self.collection.document(id).get()
-        return doc.to_dict() if doc.exists else None
-    
+        loaded = self._loaded(id)
+        if loaded is not None:
+            return loaded
+        doc = self.collection.document(id).get(transaction=self._transaction)
+        return self._remember(doc) if doc.exists else None
+
+    def find_by_ids(self, ids: Iterable[str]) -> List[T]:
+        """Find entities by their IDs using batched reads, keeping the input order"""
+        unique_ids = self._unique_ids(ids)
+        found = {}
+        for id in unique_ids:
+            loaded = self._loaded(id)
+            if loaded is not None:
+                found[id] = loaded
+        missing = [id for id in unique_ids if id not in found]
+        for start in range(0, len(missing), GET_ALL_CHUNK_SIZE):
+            chunk = missing[start:start + GET_ALL_CHUNK_SIZE]
+            refs = [self.collection.document(id) for id in chunk]
+            for doc in self._client.db.get_all(refs, transaction=self._transaction):
+                if doc.exists:
+                    found[doc.id] = self._remember(doc)
+        return [found[id] for id in unique_ids if id in found]
+
     def update(self, entity: T) -> None:
-        """Update an existing entity"""
-        if hasattr(entity, 'id'):
-            self.collection.document(entity.id).set(entity.__dict__)
-    
+        """Update an existing entity, sending only the fields changed since it was loaded"""
+        if not hasattr(entity, 'id'):
+            return
+        ref = self.collection.document(entity.id)
+        changes = self._partial_changes(entity)
+        if changes is None:
+            self._set(ref, self._to_document(entity))
+        elif changes:
+            self._update(ref, changes)
+            self._mark_clean(entity)
+        else:
+            return
+        self._notify('entity_saved', entity)
+
     def delete(self, entity: T) -> None:
         """Delete an entity"""
         if hasattr(entity, 'id'):
-            self.collection.document(entity.id).delete()
-    
+            self._delete(self.collection.document(entity.id))
+            self._notify('entity_deleted', entity.id)
+
     def add(self, entity: T) -> None:
-        """Add a new entity"""
-        if hasattr(entity, 'id'):
-            self.collection.document(entity.id).set(entity.__dict__)
-        else:
-            self.collection.add(entity.__dict__) 
\ No newline at end of file
+        """Add a new entity, assigning a generated ID when it has none"""
+        ref = self._new_ref(entity)
+        self._set(ref, self._to_document(entity))
+        self._mark_clean(entity)
+        self._map(ref.id, entity)
+        self._notify('entity_saved', entity)
@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+
+# Firestore's special field path for the document ID, used as the ordering tie-breaker
+DOCUMENT_ID = '__name__'
+
+def parse_order_by(order_by: Optional[str]) -> Tuple[Optional[str], bool]:
+    """Split an order_by spec such as '-created_at' into (field, descending)"""
+    if not order_by:
+        return None, False
+    if order_by.startswith('-'):
+        return order_by[1:], True
+    return order_by, False
+
+def _encode_value(value: Any) -> Any:
+    """Convert a cursor value to a JSON-safe representation"""
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+def _decode_value(value: Any) -> Any:
+    """Convert a JSON cursor value back to its Firestore representation"""
+    if isinstance(value, dict) and '$dt' in value:
+        return datetime.fromisoformat(value['$dt'])
+    return value
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the ordering values of the last returned document as an opaque token"""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a token produced by encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return [_decode_value(value) for value in values]
+
+def cursor_after(item: Any, order_by: Optional[str] = None) -> str:
+    """Build the cursor that resumes a listing right after the given item"""
+    field, _ = parse_order_by(order_by)
+    values = [getattr(item, field)] if field else []
+    values.append(item.id)
+    return encode_cursor(values)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional
+from typing import Generic, TypeVar, List, Optional, Iterable, Iterator
 
 T = TypeVar('T')
 
@@ -7,15 +7,26 @@ class IRepository(Generic[T], ABC):
     """Base repository interface defining common CRUD operations"""
     
     @abstractmethod
-    def get_all(self) -> List[T]:
+    def get_all(self, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[T]:
         """Get all entities of type T"""
         pass
     
+    @abstractmethod
+    def iter_all(self) -> Iterator[T]:
+        """Lazily iterate over all entities of type T"""
+        pass
+    
     @abstractmethod
     def find_by_id(self, id: str) -> Optional[T]:
         """Find an entity by its ID"""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[str]) -> List[T]:
+        """Find entities by their IDs, keeping the input order"""
+        pass
+    
     @abstractmethod
     def update(self, entity: T) -> None:
         """Update an existing entity"""
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+class IRepositoryObserver(ABC):
+    """Receives the entities a repository writes, after the write is committed"""
+    
+    @abstractmethod
+    def entity_saved(self, collection_name: str, entity: Any) -> None:
+        """Called after an entity is added or updated"""
+        pass
+    
+    @abstractmethod
+    def entity_deleted(self, collection_name: str, entity_id: str) -> None:
+        """Called after an entity is deleted"""
+        pass
@@ -0,0 +1,186 @@
+import copy
+from typing import Generic, TypeVar, Optional, Type, Dict, Any, List, TYPE_CHECKING
+from google.cloud import firestore
+from ...Cache.EntityCache import EntityCache
+from ...Entities.TrackedEntity import TrackedEntity
+from .Cursor import DOCUMENT_ID, parse_order_by, decode_cursor, cursor_after
+from .IRepositoryObserver import IRepositoryObserver
+
+if TYPE_CHECKING:
+    from ...UnitOfWork.WriteBuffer import WriteBuffer
+    from ...UnitOfWork.IdentityMap import IdentityMap
+
+T = TypeVar('T')
+
+# Number of document references sent in a single batched get_all call
+GET_ALL_CHUNK_SIZE = 100
+
+# Number of documents held in memory at once by the iter_* methods
+ITER_PAGE_SIZE = 300
+
+class RepositoryCore(Generic[T]):
+    """State and I/O-free helpers shared by the sync and async Firestore repositories"""
+
+    def __init__(self, collection_name: str, entity_type: Type[T], client):
+        """Initialize repository with Firestore collection name, entity type and client wrapper"""
+        self._client = client
+        self._entity_type = entity_type
+        self._collection_name = collection_name
+        self.collection = self._client.get_collection(collection_name)
+        self._write_buffer: Optional['WriteBuffer'] = None
+        self._identity_map: Optional['IdentityMap'] = None
+        self._cache: Optional[EntityCache[T]] = EntityCache.for_collection(collection_name)
+        # Shared with every bound copy, so observers see writes made through any unit of work
+        self._observers: List[IRepositoryObserver] = []
+
+    def observe(self, observer: IRepositoryObserver) -> None:
+        """Notify an observer of every entity written through this repository"""
+        self._observers.append(observer)
+
+    def _notify(self, event: str, payload: Any, deferred: bool = True) -> None:
+        """Tell the observers about a write, once the unit of work commits if one is open and deferred is set"""
+        if not self._observers:
+            return
+        def notify():
+            for observer in self._observers:
+                try:
+                    getattr(observer, event)(self._collection_name, payload)
+                except Exception as e:
+                    print(f"Error notifying {type(observer).__name__}: {str(e)}")
+        if deferred and self._buffering:
+            self._write_buffer.after_commit(notify)
+        else:
+            notify()
+
+    def bind(self, write_buffer: 'WriteBuffer', identity_map: Optional['IdentityMap'] = None):
+        """Get a copy of this repository that uses a unit of work's write buffer and identity map"""
+        bound = copy.copy(self)
+        bound._write_buffer = write_buffer
+        bound._identity_map = identity_map
+        return bound
+
+    def _mapped(self, id: str) -> Optional[T]:
+        """Get the entity already loaded for this document in the current unit of work"""
+        if self._identity_map is None:
+            return None
+        return self._identity_map.get(self._collection_name, id)
+
+    def _map(self, id: str, entity: T) -> T:
+        """Register an entity in the identity map and return the canonical instance"""
+        if self._identity_map is None:
+            return entity
+        return self._identity_map.add(self._collection_name, id, entity)
+
+    def _hydrate(self, doc) -> T:
+        """Build an entity from a snapshot, reusing the instance already loaded for it"""
+        mapped = self._mapped(doc.id)
+        if mapped is not None:
+            return mapped
+        return self._map(doc.id, self._to_entity(doc))
+
+    def _loaded(self, id: str) -> Optional[T]:
+        """Get an entity from the identity map or the shared cache without a read"""
+        entity = self._mapped(id)
+        if entity is None and self._use_cache:
+            entity = self._cache.get(id)
+            if entity is not None:
+                entity = self._map(id, entity)
+        return entity
+
+    def _remember(self, doc) -> T:
+        """Build an entity from a freshly read snapshot and record it in the cache and identity map"""
+        entity = self._to_entity(doc)
+        if self._use_cache:
+            self._cache.put(doc.id, entity)
+        return self._map(doc.id, entity)
+
+    @property
+    def _buffering(self) -> bool:
+        """Whether writes are currently deferred to the unit of work"""
+        return self._write_buffer is not None and self._write_buffer.is_open
+
+    @property
+    def _transaction(self):
+        """The transaction reads must go through, if the unit of work opened one"""
+        return self._write_buffer.transaction if self._buffering else None
+
+    @property
+    def _use_cache(self) -> bool:
+        """Whether reads may be served from the shared entity cache"""
+        # Isolated transactions must read the current document state
+        return self._cache is not None and self._transaction is None
+
+    def _invalidate(self, id: str) -> None:
+        """Drop a document from the shared entity cache after it is written"""
+        if self._cache is not None:
+            self._cache.invalidate(id)
+
+    def _forget(self, id: str) -> None:
+        """Drop a deleted document from the cache and identity map"""
+        self._invalidate(id)
+        if self._identity_map is not None:
+            self._identity_map.remove(self._collection_name, id)
+
+    def _to_entity(self, doc) -> T:
+        """Build an entity from a Firestore document snapshot"""
+        entity = self._entity_type(**doc.to_dict())
+        if isinstance(entity, TrackedEntity):
+            entity.mark_clean()
+        return entity
+
+    @staticmethod
+    def _to_document(entity: T) -> Dict[str, Any]:
+        """Get the fields of an entity that are stored in Firestore"""
+        if isinstance(entity, TrackedEntity):
+            return entity.to_document()
+        return dict(entity.__dict__)
+
+    def _new_ref(self, entity: T):
+        """Get the document reference for a new entity, assigning a generated ID when it has none"""
+        if getattr(entity, 'id', None) is None:
+            ref = self.collection.document()
+            entity.id = ref.id
+            return ref
+        return self.collection.document(entity.id)
+
+    @staticmethod
+    def _partial_changes(entity: T) -> Optional[Dict[str, Any]]:
+        """Get the changed fields of a loaded entity, or None when a full write is needed"""
+        if isinstance(entity, TrackedEntity) and entity.is_loaded:
+            return entity.changed_fields()
+        return None
+
+    @staticmethod
+    def _mark_clean(entity: T) -> None:
+        """Record an entity's current values as stored"""
+        if isinstance(entity, TrackedEntity):
+            entity.mark_clean()
+
+    def _paginate(self, query, limit: Optional[int] = None, order_by: Optional[str] = None,
+                  start_after: Optional[str] = None):
+        """Apply server-side ordering, cursor and limit to a query"""
+        if limit is None and order_by is None and start_after is None:
+            return query
+        field, descending = parse_order_by(order_by)
+        direction = firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+        if field:
+            query = query.order_by(field, direction=direction)
+        # Order by document ID last so cursors are stable when field values repeat
+        query = query.order_by(DOCUMENT_ID, direction=direction)
+        if start_after:
+            values = decode_cursor(start_after)
+            if len(values) != (2 if field else 1):
+                raise ValueError("Cursor does not match the requested ordering")
+            query = query.start_after(values)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def _unique_ids(ids) -> list:
+        """Drop empty and repeated IDs while keeping the first-seen order"""
+        return list(dict.fromkeys(id for id in ids if id))
+
+    def cursor_for(self, entity: T, order_by: Optional[str] = None) -> str:
+        """Get the opaque cursor that resumes a listing after the given entity"""
+        return cursor_after(entity, order_by)
@@ -1,34 +1,103 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator, TYPE_CHECKING
 from ..Entities.Task import Task
 from ..Enums.TaskStatus import TaskStatus
-from .Repository.BaseRepository import BaseRepository
+from .Repository.BaseRepository import BaseRepository, ITER_PAGE_SIZE
+from ..Cascade.CascadeDeleter import CascadeDeleter, ProgressCallback, TASK_RELATED_COLLECTIONS
+from ..Cascade.CascadeResult import CascadeResult
+from ..Indexes.CompositeIndex import CompositeIndex, ordered_both_ways, ARRAY_CONTAINS, ASCENDING
+
+if TYPE_CHECKING:
+    from ..Queries.TaskQuery import TaskQuery
 
 class TaskRepository(BaseRepository[Task]):
     """Repository for Task entities"""
     
+    # Board views compiled by TaskQuery: owner scope in any order, status and tag filters ordered or ranged by
+    # due date; find_by_query rejects the combinations not listed here
+    COMPOSITE_INDEXES = (
+        ordered_both_ways('tasks', ('owner_id',), 'due_date')
+        + ordered_both_ways('tasks', ('owner_id',), 'created_at')
+        + ordered_both_ways('tasks', ('owner_id',), 'updated_at')
+        + ordered_both_ways('tasks', ('owner_id',), 'priority')
+        + ordered_both_ways('tasks', ('owner_id',), 'title')
+        # Excluded statuses (not-in) scan status in ascending order
+        + (CompositeIndex('tasks', (('owner_id', ASCENDING), ('status', ASCENDING))),)
+        + ordered_both_ways('tasks', ('owner_id', 'status'), 'due_date')
+        + ordered_both_ways('tasks', ('owner_id', 'status'), 'created_at')
+        + ordered_both_ways('tasks', ('owner_id', 'priority'), 'due_date')
+        + (CompositeIndex('tasks', (('tags', ARRAY_CONTAINS), ('owner_id', ASCENDING), ('due_date', ASCENDING))),)
+    )
+    
     def __init__(self):
-        super().__init__('tasks')
+        super().__init__('tasks', Task)
     
-    def find_by_owner(self, owner_id: str) -> List[Task]:
+    def find_by_owner(self, owner_id: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
         """Find all tasks owned by a specific user"""
         query = self.collection.where('owner_id', '==', owner_id)
-        docs = query.stream()
-        return [Task(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_owner(self, owner_id: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Task]:
+        """Lazily iterate over all tasks owned by a specific user"""
+        query = self.collection.where('owner_id', '==', owner_id)
+        return self._iter(query, page_size)
     
-    def find_by_status(self, status: TaskStatus) -> List[Task]:
+    def find_ids_by_owner(self, owner_id: str) -> List[str]:
+        """Get the IDs of the tasks owned by a user without reading their fields"""
+        query = self.collection.where('owner_id', '==', owner_id).select([])
+        return [doc.id for doc in query.stream(transaction=self._transaction)]
+    
+    def find_by_status(self, status: TaskStatus, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
         """Find all tasks with a specific status"""
         query = self.collection.where('status', '==', status.value)
-        docs = query.stream()
-        return [Task(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_status(self, status: TaskStatus, page_size: int = ITER_PAGE_SIZE) -> Iterator[Task]:
+        """Lazily iterate over all tasks with a specific status"""
+        query = self.collection.where('status', '==', status.value)
+        return self._iter(query, page_size)
     
-    def find_by_tag(self, tag: str) -> List[Task]:
+    def find_by_tag(self, tag: str, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
         """Find all tasks with a specific tag"""
         query = self.collection.where('tags', 'array_contains', tag)
-        docs = query.stream()
-        return [Task(**doc.to_dict()) for doc in docs]
+        return self._find(query, limit, order_by, start_after)
     
-    def find_by_priority(self, priority: int) -> List[Task]:
+    def iter_by_tag(self, tag: str, page_size: int = ITER_PAGE_SIZE) -> Iterator[Task]:
+        """Lazily iterate over all tasks with a specific tag"""
+        query = self.collection.where('tags', 'array_contains', tag)
+        return self._iter(query, page_size)
+    
+    def find_by_priority(self, priority: int, limit: Optional[int] = None, order_by: Optional[str] = None,
+                start_after: Optional[str] = None) -> List[Task]:
         """Find all tasks with a specific priority"""
         query = self.collection.where('priority', '==', priority)
-        docs = query.stream()
-        return [Task(**doc.to_dict()) for doc in docs] 
\ No newline at end of file
+        return self._find(query, limit, order_by, start_after)
+    
+    def iter_by_priority(self, priority: int, page_size: int = ITER_PAGE_SIZE) -> Iterator[Task]:
+        """Lazily iterate over all tasks with a specific priority"""
+        query = self.collection.where('priority', '==', priority)
+        return self._iter(query, page_size)
+    
+    def find_by_query(self, task_query: 'TaskQuery') -> List[Task]:
+        """Run the Firestore queries a TaskQuery compiles to, then the filtering and ordering they could not do"""
+        found = {}
+        for compiled in task_query.compile_indexed(self.collection, self.COMPOSITE_INDEXES):
+            for doc in compiled.query.stream(transaction=self._transaction):
+                task = self._hydrate(doc)
+                if task_query.matches(task):
+                    found[task.id] = task
+        return task_query.sort(found.values())
+    
+    def delete_cascade(self, task_id: str, on_progress: Optional[ProgressCallback] = None,
+                       max_ops_per_second: Optional[int] = None) -> CascadeResult:
+        """Delete a task with its subcollections and related documents; runs immediately, outside the unit of work"""
+        self._forget(task_id)
+        deleter = CascadeDeleter(self._client.db, TASK_RELATED_COLLECTIONS, on_progress,
+                                 max_ops_per_second=max_ops_per_second)
+        result = deleter.delete(self._collection_name, task_id)
+        if result.success:
+            # The cascade bypasses the write buffer, so observers hear about it right away
+            self._notify('entity_deleted', task_id, deferred=False)
+        return result
@@ -6,7 +6,7 @@ class UserRepository(BaseRepository[User]):
     """Repository for User entities"""
     
     def __init__(self):
-        super().__init__('users')
+        super().__init__('users', User)
     
     def find_by_email(self, email: str) -> Optional[User]:
         """Find a user by their email address"""
@@ -1,19 +1,25 @@
 from Backend.Data.Repositories.Repository.IRepository import IRepository
+from Backend.Data.Repositories.Repository.IRepositoryObserver import IRepositoryObserver
 from Backend.Data.Repositories.Repository.BaseRepository import BaseRepository
+from Backend.Data.Repositories.Repository.AsyncBaseRepository import AsyncBaseRepository
 from Backend.Data.Repositories.UserRepository import UserRepository
 from Backend.Data.Repositories.TaskRepository import TaskRepository
 from Backend.Data.Repositories.MemberRepository import MemberRepository
 from Backend.Data.Repositories.CommentRepository import CommentRepository
 from Backend.Data.Repositories.AttachmentRepository import AttachmentRepository
 from Backend.Data.Repositories.ActivityRepository import ActivityRepository
+from Backend.Data.Repositories.JobRepository import JobRepository
 
 __all__ = [
     'IRepository',
+    'IRepositoryObserver',
     'BaseRepository',
+    'AsyncBaseRepository',
     'UserRepository',
     'TaskRepository',
     'MemberRepository',
     'CommentRepository',
     'AttachmentRepository',
-    'ActivityRepository'
+    'ActivityRepository',
+    'JobRepository'
 ] 
\ No newline at end of file
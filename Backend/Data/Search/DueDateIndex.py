@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+def timestamp(moment: datetime) -> float:
+    """POSIX timestamp of a datetime, reading naive values as UTC like the rest of the backend"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def _insert(lists: Dict[str, List[Tuple[float, str]]], user_id: str, item: Tuple[float, str]) -> None:
+    insort(lists.setdefault(user_id, []), item)
+
+def _delete(lists: Dict[str, List[Tuple[float, str]]], user_id: str, item: Tuple[float, str]) -> None:
+    entries = lists.get(user_id)
+    if not entries:
+        return
+    position = bisect_left(entries, item)
+    if position < len(entries) and entries[position] == item:
+        del entries[position]
+    if not entries:
+        del lists[user_id]
+
+class DueDateIndex:
+    """Due dates of tasks kept sorted per user who can see them, so date ranges are found by binary search
+    
+    A user sees the tasks they own and those they are a member of. Open tasks are also kept in a
+    list of their own, so open-only ranges are a single slice as well.
+    """
+    
+    def __init__(self):
+        # user_id -> sorted (due timestamp, task_id) of every visible task, and of the open ones only
+        self._visible: Dict[str, List[Tuple[float, str]]] = {}
+        self._open: Dict[str, List[Tuple[float, str]]] = {}
+        # task_id -> (owner_id, due timestamp, done)
+        self._entries: Dict[str, Tuple[str, float, bool]] = {}
+        # task_id -> IDs of the users who are members, whether or not the task has a due date
+        self._members: Dict[str, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def upsert(self, task_id: str, owner_id: str, due_date: Optional[datetime], done: bool = False) -> None:
+        """Record the current owner, due date and completion of a task"""
+        self._unlist(task_id)
+        if due_date is None or not owner_id:
+            return
+        entry = (owner_id, timestamp(due_date), done)
+        self._entries[task_id] = entry
+        for user_id in self._viewers(task_id, owner_id):
+            self._list(user_id, task_id, entry)
+    
+    def remove(self, task_id: str) -> None:
+        """Forget a deleted task and its memberships"""
+        self._unlist(task_id)
+        self._members.pop(task_id, None)
+    
+    def add_member(self, task_id: str, user_id: str) -> None:
+        """Show a task in the ranges of a user who joined it"""
+        members = self._members.setdefault(task_id, set())
+        entry = self._entries.get(task_id)
+        if entry is not None and user_id not in members and user_id != entry[0]:
+            self._list(user_id, task_id, entry)
+        members.add(user_id)
+    
+    def remove_member(self, task_id: str, user_id: str) -> None:
+        """Stop showing a task to a user who left it, unless they own it"""
+        members = self._members.get(task_id)
+        if members is None or user_id not in members:
+            return
+        members.discard(user_id)
+        if not members:
+            del self._members[task_id]
+        entry = self._entries.get(task_id)
+        if entry is not None and user_id != entry[0]:
+            self._unlist_for(user_id, task_id, entry)
+    
+    def between(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                open_only: bool = False) -> Iterator[Tuple[float, str]]:
+        """(due timestamp, task ID) of the tasks a user sees due within [start, end], earliest first
+        
+        Either bound may be open.
+        """
+        low = float('-inf') if start is None else timestamp(start)
+        high = float('inf') if end is None else timestamp(end)
+        entries = (self._open if open_only else self._visible).get(user_id, [])
+        # A task ID sorts after the empty string, so the lower bound includes tasks due exactly at start
+        return iter(entries[bisect_left(entries, (low, '')):bisect_right(entries, (high, '\uffff'))])
+    
+    def _viewers(self, task_id: str, owner_id: str) -> Set[str]:
+        return self._members.get(task_id, set()) | {owner_id}
+    
+    def _list(self, user_id: str, task_id: str, entry: Tuple[str, float, bool]) -> None:
+        _, due, done = entry
+        _insert(self._visible, user_id, (due, task_id))
+        if not done:
+            _insert(self._open, user_id, (due, task_id))
+    
+    def _unlist_for(self, user_id: str, task_id: str, entry: Tuple[str, float, bool]) -> None:
+        _, due, done = entry
+        _delete(self._visible, user_id, (due, task_id))
+        if not done:
+            _delete(self._open, user_id, (due, task_id))
+    
+    def _unlist(self, task_id: str) -> None:
+        """Take a task out of every user's lists, keeping its memberships"""
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        for user_id in self._viewers(task_id, entry[0]):
+            self._unlist_for(user_id, task_id, entry)
@@ -0,0 +1,88 @@
+import threading
+import time
+from abc import abstractmethod
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from ..Database.FirestoreClient import FirestoreClient
+from ..Repositories.Repository.IRepositoryObserver import IRepositoryObserver
+
+I = TypeVar('I')
+
+class ReloadingIndexer(IRepositoryObserver, Generic[I]):
+    """In-memory index kept current from repository writes and rebuilt from Firestore on an interval"""
+    
+    # Name of the background thread, also used in log messages
+    name = "index"
+    
+    def __init__(self, rebuild_seconds: float):
+        self._client = FirestoreClient()
+        self._index: I = self._new_index()
+        self._rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        # Writes seen while a rebuild runs, replayed onto the new index before it replaces the old one
+        self._pending: Optional[List[Tuple[str, str, Any]]] = None
+        self._worker: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+    
+    @abstractmethod
+    def _new_index(self) -> I:
+        """Create an empty index"""
+        pass
+    
+    @abstractmethod
+    def _load(self, index: I, db) -> None:
+        """Fill an empty index from Firestore"""
+        pass
+    
+    @abstractmethod
+    def _apply(self, index: I, event: str, collection_name: str, payload: Any) -> None:
+        """Apply one repository write ('saved' with the entity, 'deleted' with its ID) to the index"""
+        pass
+    
+    @property
+    def ready(self) -> bool:
+        """Whether the first full load has finished"""
+        return self._ready.is_set()
+    
+    def start(self) -> None:
+        """Load the index in the background and reload it periodically"""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._worker.start()
+    
+    def entity_saved(self, collection_name: str, entity: Any) -> None:
+        self._record('saved', collection_name, entity)
+    
+    def entity_deleted(self, collection_name: str, entity_id: str) -> None:
+        self._record('deleted', collection_name, entity_id)
+    
+    def _record(self, event: str, collection_name: str, payload: Any) -> None:
+        with self._lock:
+            self._apply(self._index, event, collection_name, payload)
+            if self._pending is not None:
+                self._pending.append((event, collection_name, payload))
+    
+    def rebuild(self) -> None:
+        """Load a fresh index from Firestore and swap it in"""
+        with self._lock:
+            self._pending = []
+        try:
+            index = self._new_index()
+            self._load(index, self._client.db)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            for event, collection_name, payload in self._pending:
+                self._apply(index, event, collection_name, payload)
+            self._index = index
+            self._pending = None
+        self._ready.set()
+    
+    def _run(self) -> None:
+        while True:
+            try:
+                self.rebuild()
+            except Exception as e:
+                print(f"Error rebuilding the {self.name}: {str(e)}")
+            time.sleep(self._rebuild_seconds)
@@ -0,0 +1,120 @@
+import heapq
+import math
+import threading
+from collections import defaultdict
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+from .TextAnalyzer import text_terms, tokenize, word_terms
+
+class SearchIndex:
+    """Inverted n-gram index of text sources, each belonging to a key that results are ranked by"""
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        # term -> key -> weighted frequency
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        # source id -> (key, term -> weighted frequency), so a source can be replaced or removed
+        self._sources: Dict[str, Tuple[str, Dict[str, float]]] = {}
+        self._sources_by_key: Dict[str, Set[str]] = defaultdict(set)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sources_by_key)
+    
+    def upsert(self, source_id: str, key: str, fields: Iterable[Tuple[str, float]]) -> None:
+        """Index (text, weight) fields of a source, replacing what was indexed for it before"""
+        terms: Dict[str, float] = defaultdict(float)
+        for text, weight in fields:
+            for term, count in text_terms(text).items():
+                terms[term] += count * weight
+        with self._lock:
+            self._remove_source(source_id)
+            if not terms:
+                return
+            self._sources[source_id] = (key, dict(terms))
+            self._sources_by_key[key].add(source_id)
+            for term, weight in terms.items():
+                postings = self._postings[term]
+                postings[key] = postings.get(key, 0.0) + weight
+    
+    def remove(self, source_id: str) -> None:
+        """Drop one source from the index"""
+        with self._lock:
+            self._remove_source(source_id)
+    
+    def remove_key(self, key: str) -> None:
+        """Drop every source of a key"""
+        with self._lock:
+            for source_id in list(self._sources_by_key.get(key, ())):
+                self._remove_source(source_id)
+    
+    def _remove_source(self, source_id: str) -> None:
+        entry = self._sources.pop(source_id, None)
+        if entry is None:
+            return
+        key, terms = entry
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            remaining = postings.get(key, 0.0) - weight
+            if remaining > 1e-9:
+                postings[key] = remaining
+            else:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        sources = self._sources_by_key.get(key)
+        if sources is not None:
+            sources.discard(source_id)
+            if not sources:
+                del self._sources_by_key[key]
+    
+    def search(self, query: str, keys: Optional[Collection[str]] = None, limit: int = 50,
+               allowed: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Keys containing every query word, best first; restricted to the given keys when set
+        
+        allowed, when given, is asked about the ranked keys in order until limit of them pass,
+        so scoping costs as many checks as there are hits rather than one per key in scope.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        with self._lock:
+            total = max(len(self._sources_by_key), 1)
+            scores: Optional[Dict[str, float]] = None
+            for word in words:
+                matches = self._match_word(word)
+                if not matches:
+                    return []
+                # Rare words say more about a task than common ones
+                idf = math.log(1 + total / len(matches))
+                if scores is None:
+                    scores = {key: weight * idf for key, weight in matches.items()
+                              if keys is None or key in keys}
+                else:
+                    scores = {key: score + matches[key] * idf for key, score in scores.items() if key in matches}
+                if not scores:
+                    return []
+        if allowed is None:
+            return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        ranked = [(-score, key) for key, score in scores.items()]
+        heapq.heapify(ranked)
+        hits = []
+        while ranked and len(hits) < limit:
+            score, key = heapq.heappop(ranked)
+            if allowed(key):
+                hits.append((key, -score))
+        return hits
+    
+    def _match_word(self, word: str) -> Dict[str, float]:
+        """Keys having every n-gram of the word, weighted by the rarest one's frequency"""
+        postings = sorted((self._postings.get(term, {}) for term in set(word_terms(word))), key=len)
+        if not postings or not postings[0]:
+            return {}
+        # Intersect starting from the shortest posting list
+        matches = dict(postings[0])
+        for posting in postings[1:]:
+            matches = {key: min(weight, posting[key]) for key, weight in matches.items() if key in posting}
+            if not matches:
+                break
+        return matches
@@ -0,0 +1,86 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+def popcount(bitmap: int) -> int:
+    """Number of set bits"""
+    return bin(bitmap).count('1')
+
+class TagBitmapIndex:
+    """Maps each tag to a bitmap of task ordinals, stored as a Python int"""
+    
+    def __init__(self):
+        self._ordinals: Dict[str, int] = {}
+        self._task_ids: List[Optional[str]] = []
+        # Ordinals of deleted tasks, reused so bitmaps stay dense
+        self._free: List[int] = []
+        self._tags_of: Dict[int, frozenset] = {}
+        self._bitmaps: Dict[str, int] = {}
+        self.all = 0
+    
+    def __len__(self) -> int:
+        return len(self._ordinals)
+    
+    def set_tags(self, task_id: str, tags: Iterable[str]) -> None:
+        """Record the current tags of a task"""
+        ordinal = self._ordinals.get(task_id)
+        if ordinal is None:
+            ordinal = self._free.pop() if self._free else len(self._task_ids)
+            if ordinal == len(self._task_ids):
+                self._task_ids.append(task_id)
+            else:
+                self._task_ids[ordinal] = task_id
+            self._ordinals[task_id] = ordinal
+            self.all |= 1 << ordinal
+        new_tags = frozenset(tag for tag in tags if tag)
+        old_tags = self._tags_of.get(ordinal, frozenset())
+        bit = 1 << ordinal
+        for tag in old_tags - new_tags:
+            remaining = self._bitmaps[tag] & ~bit
+            if remaining:
+                self._bitmaps[tag] = remaining
+            else:
+                del self._bitmaps[tag]
+        for tag in new_tags - old_tags:
+            self._bitmaps[tag] = self._bitmaps.get(tag, 0) | bit
+        self._tags_of[ordinal] = new_tags
+    
+    def remove(self, task_id: str) -> None:
+        """Forget a deleted task"""
+        if task_id not in self._ordinals:
+            return
+        self.set_tags(task_id, ())
+        ordinal = self._ordinals.pop(task_id)
+        del self._tags_of[ordinal]
+        self._task_ids[ordinal] = None
+        self._free.append(ordinal)
+        self.all &= ~(1 << ordinal)
+    
+    def bitmap(self, tag: str) -> int:
+        """Tasks carrying a tag"""
+        return self._bitmaps.get(tag, 0)
+    
+    def bitmap_of(self, task_ids: Iterable[str]) -> int:
+        """Bitmap of the given tasks, skipping unknown ones"""
+        bitmap = 0
+        for task_id in task_ids:
+            ordinal = self._ordinals.get(task_id)
+            if ordinal is not None:
+                bitmap |= 1 << ordinal
+        return bitmap
+    
+    def task_ids(self, bitmap: int) -> Iterator[str]:
+        """Task IDs of the set bits, lowest ordinal first"""
+        while bitmap:
+            low = bitmap & -bitmap
+            yield self._task_ids[low.bit_length() - 1]
+            bitmap ^= low
+    
+    def counts(self, scope: Optional[int] = None) -> Dict[str, int]:
+        """Number of tasks per tag, within the scope bitmap when given"""
+        if scope is None:
+            return {tag: popcount(bitmap) for tag, bitmap in self._bitmaps.items()}
+        counts = {}
+        for tag, bitmap in self._bitmaps.items():
+            count = popcount(bitmap & scope)
+            if count:
+                counts[tag] = count
+        return counts
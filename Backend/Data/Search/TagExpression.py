@@ -0,0 +1,94 @@
+import re
+from typing import Callable, List, Tuple
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+))')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+
+class TagExpressionError(ValueError):
+    """Raised when a tag expression cannot be parsed"""
+
+class TagExpression:
+    """Boolean expression over tags, e.g. 'urgent AND (backend OR "on hold") AND NOT blocked'
+    
+    Adjacent terms without an operator are ANDed; NOT binds tightest, then AND, then OR.
+    """
+    
+    def __init__(self, source: str):
+        self.source = source
+        self._tokens = self._tokenize(source)
+        self._position = 0
+        self._evaluate = self._parse_or()
+        if self._position != len(self._tokens):
+            raise TagExpressionError(f"Unexpected '{self._tokens[self._position][1]}'")
+        self.tags = sorted({value for kind, value in self._tokens if kind == 'tag'})
+    
+    def evaluate(self, bitmap_of: Callable[[str], int], universe: int) -> int:
+        """Bitmap of the tasks matching the expression, given each tag's bitmap and all tasks"""
+        return self._evaluate(bitmap_of, universe)
+    
+    @staticmethod
+    def _tokenize(source: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        source = source.rstrip()
+        while position < len(source):
+            match = _TOKEN.match(source, position)
+            if match is None:
+                raise TagExpressionError(f"Invalid tag expression at position {position}")
+            position = match.end()
+            open_paren, close_paren, quoted, word = match.groups()
+            if open_paren:
+                tokens.append(('(', '('))
+            elif close_paren:
+                tokens.append((')', ')'))
+            elif quoted is not None:
+                tokens.append(('tag', re.sub(r'\\(.)', r'\1', quoted)))
+            elif word.upper() in _OPERATORS:
+                tokens.append((word.upper(), word))
+            else:
+                tokens.append(('tag', word))
+        if not tokens:
+            raise TagExpressionError("Empty tag expression")
+        return tokens
+    
+    def _peek(self) -> str:
+        return self._tokens[self._position][0] if self._position < len(self._tokens) else ''
+    
+    def _parse_or(self):
+        left = self._parse_and()
+        while self._peek() == 'OR':
+            self._position += 1
+            right = self._parse_and()
+            left = (lambda a, b: lambda get, universe: a(get, universe) | b(get, universe))(left, right)
+        return left
+    
+    def _parse_and(self):
+        left = self._parse_not()
+        while self._peek() in ('AND', 'NOT', 'tag', '('):
+            if self._peek() == 'AND':
+                self._position += 1
+            right = self._parse_not()
+            left = (lambda a, b: lambda get, universe: a(get, universe) & b(get, universe))(left, right)
+        return left
+    
+    def _parse_not(self):
+        if self._peek() == 'NOT':
+            self._position += 1
+            operand = self._parse_not()
+            return lambda get, universe: universe & ~operand(get, universe)
+        return self._parse_atom()
+    
+    def _parse_atom(self):
+        kind = self._peek()
+        if kind == '(':
+            self._position += 1
+            inner = self._parse_or()
+            if self._peek() != ')':
+                raise TagExpressionError("Missing ')'")
+            self._position += 1
+            return inner
+        if kind == 'tag':
+            tag = self._tokens[self._position][1]
+            self._position += 1
+            return lambda get, universe: get(tag)
+        raise TagExpressionError("Expected a tag" if not kind else f"Unexpected '{self._tokens[self._position][1]}'")
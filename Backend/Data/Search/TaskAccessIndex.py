@@ -0,0 +1,65 @@
+from typing import Dict, FrozenSet, Set
+
+class TaskAccessIndex:
+    """Who can see each task: its owner and its members, with the visible task IDs kept per user"""
+    
+    def __init__(self):
+        # task_id -> owner_id, task_id -> member user IDs, user_id -> IDs of the tasks they see
+        self._owners: Dict[str, str] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._visible: Dict[str, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._owners)
+    
+    def set_owner(self, task_id: str, owner_id: str) -> None:
+        """Record the current owner of a task"""
+        previous = self._owners.get(task_id)
+        if previous == owner_id:
+            return
+        if previous is not None and previous not in self._members.get(task_id, ()):
+            self._hide(previous, task_id)
+        if not owner_id:
+            self._owners.pop(task_id, None)
+            return
+        self._owners[task_id] = owner_id
+        self._visible.setdefault(owner_id, set()).add(task_id)
+    
+    def remove(self, task_id: str) -> None:
+        """Forget a deleted task and its memberships"""
+        owner_id = self._owners.pop(task_id, None)
+        for user_id in self._members.pop(task_id, set()) | {owner_id}:
+            if user_id:
+                self._hide(user_id, task_id)
+    
+    def add_member(self, task_id: str, user_id: str) -> None:
+        """Let a user who joined a task see it"""
+        self._members.setdefault(task_id, set()).add(user_id)
+        self._visible.setdefault(user_id, set()).add(task_id)
+    
+    def remove_member(self, task_id: str, user_id: str) -> None:
+        """Stop showing a task to a user who left it, unless they own it"""
+        members = self._members.get(task_id)
+        if members is None or user_id not in members:
+            return
+        members.discard(user_id)
+        if not members:
+            del self._members[task_id]
+        if self._owners.get(task_id) != user_id:
+            self._hide(user_id, task_id)
+    
+    def can_see(self, user_id: str, task_id: str) -> bool:
+        """Whether a user owns or is a member of a task"""
+        return task_id in self._visible.get(user_id, ())
+    
+    def task_ids(self, user_id: str) -> FrozenSet[str]:
+        """IDs of the tasks a user owns or is a member of"""
+        return frozenset(self._visible.get(user_id, ()))
+    
+    def _hide(self, user_id: str, task_id: str) -> None:
+        visible = self._visible.get(user_id)
+        if visible is None:
+            return
+        visible.discard(task_id)
+        if not visible:
+            del self._visible[user_id]
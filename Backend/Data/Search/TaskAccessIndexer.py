@@ -0,0 +1,49 @@
+import os
+from typing import Any, FrozenSet
+from ..Entities.Member import Member
+from .ReloadingIndexer import ReloadingIndexer
+from .TaskAccessIndex import TaskAccessIndex
+
+REBUILD_SECONDS = float(os.environ.get("MOONTRIP_ACCESS_INDEX_REBUILD_SECONDS", 600))
+
+class TaskAccessIndexer(ReloadingIndexer[TaskAccessIndex]):
+    """Keeps who can see each task in memory, from task and membership writes and periodic reloads"""
+    
+    name = "task access index"
+    
+    def __init__(self, rebuild_seconds: float = REBUILD_SECONDS):
+        super().__init__(rebuild_seconds)
+    
+    def can_see(self, user_id: str, task_id: str) -> bool:
+        """Whether a user owns or is a member of a task"""
+        with self._lock:
+            return self._index.can_see(user_id, task_id)
+    
+    def visible_task_ids(self, user_id: str) -> FrozenSet[str]:
+        """IDs of the tasks a user owns or is a member of"""
+        with self._lock:
+            return self._index.task_ids(user_id)
+    
+    def _new_index(self) -> TaskAccessIndex:
+        return TaskAccessIndex()
+    
+    def _apply(self, index: TaskAccessIndex, event: str, collection_name: str, payload: Any) -> None:
+        if collection_name == 'tasks':
+            if event == 'saved':
+                index.set_owner(payload.id, payload.owner_id)
+            else:
+                index.remove(payload)
+        elif collection_name == 'task_members':
+            if event == 'saved':
+                index.add_member(payload.task_id, payload.user_id)
+            else:
+                index.remove_member(*Member.parse_membership_id(payload))
+    
+    def _load(self, index: TaskAccessIndex, db) -> None:
+        """Index the owner of every task, then every membership"""
+        for doc in db.collection('tasks').select(['owner_id']).stream():
+            index.set_owner(doc.id, doc.to_dict().get('owner_id'))
+        for doc in db.collection('task_members').select(['task_id', 'user_id']).stream():
+            data = doc.to_dict()
+            if data.get('task_id') and data.get('user_id'):
+                index.add_member(data['task_id'], data['user_id'])
@@ -0,0 +1,65 @@
+import os
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, List, Optional
+from ..Entities.Member import Member
+from ..Enums.TaskStatus import TaskStatus
+from .ReloadingIndexer import ReloadingIndexer
+from .DueDateIndex import DueDateIndex
+
+REBUILD_SECONDS = float(os.environ.get("MOONTRIP_DUE_INDEX_REBUILD_SECONDS", 600))
+
+def _is_done(status: Any) -> bool:
+    """Whether a status, as an enum member or its stored value, marks the task finished"""
+    return getattr(status, 'value', status) == TaskStatus.DONE.value
+
+class TaskDueIndexer(ReloadingIndexer[DueDateIndex]):
+    """Keeps the due dates of all tasks sorted per user who can see them, from task and membership writes and periodic reloads"""
+    
+    name = "due date index"
+    
+    def __init__(self, rebuild_seconds: float = REBUILD_SECONDS):
+        super().__init__(rebuild_seconds)
+    
+    def due_between(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    open_only: bool = False, limit: Optional[int] = None) -> List[str]:
+        """IDs of the tasks the user owns or is a member of due within [start, end], earliest first"""
+        with self._lock:
+            entries = self._index.between(user_id, start, end, open_only)
+            return [task_id for _, task_id in islice(entries, limit)]
+    
+    def months(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+               open_only: bool = False) -> Dict[str, int]:
+        """Number of the user's tasks due in each calendar month ('YYYY-MM', UTC) within [start, end]"""
+        buckets: Dict[str, int] = {}
+        with self._lock:
+            for due, _ in self._index.between(user_id, start, end, open_only):
+                month = datetime.fromtimestamp(due, timezone.utc).strftime('%Y-%m')
+                buckets[month] = buckets.get(month, 0) + 1
+        return buckets
+    
+    def _new_index(self) -> DueDateIndex:
+        return DueDateIndex()
+    
+    def _apply(self, index: DueDateIndex, event: str, collection_name: str, payload: Any) -> None:
+        if collection_name == 'tasks':
+            if event == 'saved':
+                index.upsert(payload.id, payload.owner_id, payload.due_date, _is_done(payload.status))
+            else:
+                index.remove(payload)
+        elif collection_name == 'task_members':
+            if event == 'saved':
+                index.add_member(payload.task_id, payload.user_id)
+            else:
+                index.remove_member(*Member.parse_membership_id(payload))
+    
+    def _load(self, index: DueDateIndex, db) -> None:
+        """Index every membership, then every task that has a due date"""
+        for doc in db.collection('task_members').select(['task_id', 'user_id']).stream():
+            data = doc.to_dict()
+            if data.get('task_id') and data.get('user_id'):
+                index.add_member(data['task_id'], data['user_id'])
+        for doc in db.collection('tasks').select(['owner_id', 'due_date', 'status']).stream():
+            data = doc.to_dict()
+            if data.get('due_date') is not None:
+                index.upsert(doc.id, data.get('owner_id'), data['due_date'], _is_done(data.get('status')))
@@ -0,0 +1,61 @@
+import os
+from typing import Any, Callable, Collection, List, Optional, Tuple
+from .ReloadingIndexer import ReloadingIndexer
+from .SearchIndex import SearchIndex
+
+# Relative weight of each searchable field
+TITLE_WEIGHT = 3.0
+MINI_TASK_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+COMMENT_WEIGHT = 1.0
+
+# Full reloads pick up writes made by other processes, such as mini-tasks from the Google service
+REBUILD_SECONDS = float(os.environ.get("MOONTRIP_SEARCH_REBUILD_SECONDS", 600))
+
+class TaskSearchIndexer(ReloadingIndexer[SearchIndex]):
+    """Keeps a search index of task text up to date from repository writes and periodic reloads"""
+    
+    name = "search index"
+    
+    def __init__(self, rebuild_seconds: float = REBUILD_SECONDS):
+        super().__init__(rebuild_seconds)
+    
+    def search(self, query: str, task_ids: Optional[Collection[str]] = None, limit: int = 50,
+               allowed: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Task IDs matching the query, best first, limited to the given tasks and those allowed passes"""
+        return self._index.search(query, task_ids, limit, allowed)
+    
+    def _new_index(self) -> SearchIndex:
+        return SearchIndex()
+    
+    def _apply(self, index: SearchIndex, event: str, collection_name: str, payload: Any) -> None:
+        if collection_name == 'tasks':
+            if event == 'saved':
+                index.upsert(f"task:{payload.id}", payload.id, [
+                    (payload.title, TITLE_WEIGHT),
+                    (payload.description, DESCRIPTION_WEIGHT)
+                ])
+            else:
+                index.remove_key(payload)
+        elif collection_name == 'task_comments':
+            if event == 'saved':
+                index.upsert(f"comment:{payload.id}", payload.task_id, [(payload.content, COMMENT_WEIGHT)])
+            else:
+                index.remove(f"comment:{payload}")
+    
+    def _load(self, index: SearchIndex, db) -> None:
+        """Index every task, mini-task and comment"""
+        for doc in db.collection('tasks').select(['title', 'description']).stream():
+            data = doc.to_dict()
+            index.upsert(f"task:{doc.id}", doc.id, [
+                (data.get('title', ''), TITLE_WEIGHT),
+                (data.get('description', ''), DESCRIPTION_WEIGHT)
+            ])
+        # Mini-tasks live in a subcollection of their task
+        for doc in db.collection_group('mini_tasks').select(['title']).stream():
+            task_id = doc.reference.parent.parent.id
+            index.upsert(f"mini_task:{task_id}/{doc.id}", task_id, [(doc.get('title') or '', MINI_TASK_WEIGHT)])
+        for doc in db.collection('task_comments').select(['task_id', 'content']).stream():
+            data = doc.to_dict()
+            if data.get('task_id'):
+                index.upsert(f"comment:{doc.id}", data['task_id'], [(data.get('content', ''), COMMENT_WEIGHT)])
@@ -0,0 +1,59 @@
+import os
+from typing import Any, Callable, Collection, Dict, List, Optional
+from .ReloadingIndexer import ReloadingIndexer
+from .TagBitmapIndex import TagBitmapIndex, popcount
+from .TagExpression import TagExpression
+
+REBUILD_SECONDS = float(os.environ.get("MOONTRIP_TAG_INDEX_REBUILD_SECONDS", 600))
+
+class TaskTagIndexer(ReloadingIndexer[TagBitmapIndex]):
+    """Keeps tag bitmaps of all tasks up to date from task writes and periodic reloads"""
+    
+    name = "tag index"
+    
+    def __init__(self, rebuild_seconds: float = REBUILD_SECONDS):
+        super().__init__(rebuild_seconds)
+    
+    def match(self, expression: TagExpression, task_ids: Optional[Collection[str]] = None,
+              limit: Optional[int] = None, allowed: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """IDs of the tasks matching a tag expression, limited to the given tasks and those allowed passes"""
+        with self._lock:
+            index = self._index
+            scope = index.all if task_ids is None else index.bitmap_of(task_ids)
+            bitmap = expression.evaluate(index.bitmap, scope) & scope
+            ids = []
+            for task_id in index.task_ids(bitmap):
+                if limit is not None and len(ids) >= limit:
+                    break
+                if allowed is None or allowed(task_id):
+                    ids.append(task_id)
+            return ids
+    
+    def count(self, expression: TagExpression, task_ids: Optional[Collection[str]] = None) -> int:
+        """Number of tasks matching a tag expression"""
+        with self._lock:
+            index = self._index
+            scope = index.all if task_ids is None else index.bitmap_of(task_ids)
+            return popcount(expression.evaluate(index.bitmap, scope) & scope)
+    
+    def counts(self, task_ids: Optional[Collection[str]] = None) -> Dict[str, int]:
+        """Number of tasks per tag, limited to the given tasks"""
+        with self._lock:
+            index = self._index
+            return index.counts(None if task_ids is None else index.bitmap_of(task_ids))
+    
+    def _new_index(self) -> TagBitmapIndex:
+        return TagBitmapIndex()
+    
+    def _apply(self, index: TagBitmapIndex, event: str, collection_name: str, payload: Any) -> None:
+        if collection_name != 'tasks':
+            return
+        if event == 'saved':
+            index.set_tags(payload.id, payload.tags or [])
+        else:
+            index.remove(payload)
+    
+    def _load(self, index: TagBitmapIndex, db) -> None:
+        """Index the tags of every task"""
+        for doc in db.collection('tasks').select(['tags']).stream():
+            index.set_tags(doc.id, doc.to_dict().get('tags') or [])
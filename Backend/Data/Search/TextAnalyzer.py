@@ -0,0 +1,35 @@
+import re
+import unicodedata
+from collections import Counter
+from typing import List
+
+# Length of the character n-grams that make substring queries possible
+NGRAM_SIZE = 3
+
+_WORD = re.compile(r'\w+')
+
+def normalize(text: str) -> str:
+    """Lowercase and strip accents so 'Café' and 'cafe' index the same"""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def tokenize(text: str) -> List[str]:
+    """Split normalized text into words"""
+    return _WORD.findall(normalize(text))
+
+def word_terms(word: str) -> List[str]:
+    """Query terms of one word: its n-grams, or the word itself when it is shorter than an n-gram"""
+    if len(word) < NGRAM_SIZE:
+        return [word]
+    return [word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)]
+
+def indexed_terms(word: str) -> List[str]:
+    """Index terms of one word: its n-grams plus every shorter gram, so short query words match inside longer words"""
+    return [word[i:i + size] for size in range(1, NGRAM_SIZE + 1) for i in range(len(word) - size + 1)]
+
+def text_terms(text: str) -> Counter:
+    """Term frequencies of a text, counting every indexed gram of every word"""
+    terms = Counter()
+    for word in tokenize(text):
+        terms.update(indexed_terms(word))
+    return terms
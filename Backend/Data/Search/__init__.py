@@ -0,0 +1,27 @@
+from Backend.Data.Search.TextAnalyzer import normalize, tokenize
+from Backend.Data.Search.SearchIndex import SearchIndex
+from Backend.Data.Search.ReloadingIndexer import ReloadingIndexer
+from Backend.Data.Search.TaskSearchIndexer import TaskSearchIndexer
+from Backend.Data.Search.TagBitmapIndex import TagBitmapIndex
+from Backend.Data.Search.TagExpression import TagExpression, TagExpressionError
+from Backend.Data.Search.TaskTagIndexer import TaskTagIndexer
+from Backend.Data.Search.DueDateIndex import DueDateIndex
+from Backend.Data.Search.TaskDueIndexer import TaskDueIndexer
+from Backend.Data.Search.TaskAccessIndex import TaskAccessIndex
+from Backend.Data.Search.TaskAccessIndexer import TaskAccessIndexer
+
+__all__ = [
+    'normalize',
+    'tokenize',
+    'SearchIndex',
+    'ReloadingIndexer',
+    'TaskSearchIndexer',
+    'TagBitmapIndex',
+    'TagExpression',
+    'TagExpressionError',
+    'TaskTagIndexer',
+    'DueDateIndex',
+    'TaskDueIndexer',
+    'TaskAccessIndex',
+    'TaskAccessIndexer'
+]
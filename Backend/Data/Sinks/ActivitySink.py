@@ -0,0 +1,156 @@
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+from ..Database.FirestoreClient import FirestoreClient
+from ..Entities.Activity import Activity
+from .SinkConfig import SinkConfig, get_sink_config
+
+# Attempts to commit one batch before its activities are dropped
+MAX_ATTEMPTS = 3
+
+class ActivitySink:
+    """Buffers activity records in memory and writes them to Firestore in batches from a background thread"""
+    
+    def __init__(self, collection_name: str = 'task_activities', config: Optional[SinkConfig] = None):
+        self._config = config or get_sink_config()
+        self._client = FirestoreClient()
+        self._collection = self._client.get_collection(collection_name)
+        self._queue: "queue.Queue[Activity]" = queue.Queue(maxsize=self._config.max_queue)
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._enqueued = 0
+        self._written = 0
+        self._batches = 0
+        self._inline = 0
+        self._dropped = 0
+    
+    def start(self) -> None:
+        """Start the flushing thread; called lazily by the first put"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="activity-sink", daemon=True)
+                self._worker.start()
+    
+    def _assign_id(self, activity: Activity) -> None:
+        """Give the activity its document ID now so callers can reference it before it is written"""
+        if activity.id is None:
+            activity.id = self._collection.document().id
+    
+    def offer(self, activity: Activity) -> bool:
+        """Queue an activity without blocking; returns False when the queue is full"""
+        self._assign_id(activity)
+        self.start()
+        try:
+            self._queue.put_nowait(activity)
+        except queue.Full:
+            return False
+        with self._lock:
+            self._enqueued += 1
+        return True
+    
+    def put(self, activity: Activity) -> None:
+        """Queue an activity, waiting for room; a caller still blocked after the timeout writes it itself"""
+        self._assign_id(activity)
+        if self._closed.is_set():
+            self._write([activity])
+            return
+        self.start()
+        try:
+            self._queue.put(activity, timeout=self._config.put_timeout_seconds)
+        except queue.Full:
+            # Backpressure: the producer pays for its own write instead of losing the record
+            with self._lock:
+                self._inline += 1
+            self._write([activity])
+            return
+        with self._lock:
+            self._enqueued += 1
+    
+    def flush(self) -> None:
+        """Write everything queued so far from the calling thread"""
+        while True:
+            batch = self._drain(self._config.batch_size)
+            if not batch:
+                return
+            self._commit(batch)
+    
+    def close(self) -> None:
+        """Stop the background thread and write what is still queued"""
+        self._closed.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self._config.flush_interval_ms / 1000 + 5)
+        self.flush()
+    
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and write counters"""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "max_queue": self._config.max_queue,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "batches": self._batches,
+                "written_inline": self._inline,
+                "dropped": self._dropped
+            }
+    
+    def _drain(self, limit: int) -> List[Activity]:
+        """Take up to limit queued activities without waiting"""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self) -> None:
+        interval = self._config.flush_interval_ms / 1000
+        while not self._closed.is_set():
+            try:
+                first = self._queue.get(timeout=interval)
+            except queue.Empty:
+                continue
+            # Collect until the batch is full or the flush interval has passed
+            batch = [first]
+            deadline = time.monotonic() + interval
+            while len(batch) < self._config.batch_size and not self._closed.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._commit(batch)
+    
+    def _commit(self, batch: List[Activity], attempts: int = MAX_ATTEMPTS) -> None:
+        """Write a batch, retrying with backoff; a batch that still fails is split in halves so only bad records are dropped"""
+        for attempt in range(1, attempts + 1):
+            try:
+                self._write(batch)
+                with self._lock:
+                    self._batches += 1
+                return
+            except Exception as e:
+                print(f"Error writing {len(batch)} activities (attempt {attempt}): {str(e)}")
+                if attempt < attempts:
+                    time.sleep(0.1 * 2 ** attempt)
+        if len(batch) > 1:
+            # Transient failures were retried above, so each half gets one attempt before splitting again
+            middle = len(batch) // 2
+            self._commit(batch[:middle], 1)
+            self._commit(batch[middle:], 1)
+            return
+        with self._lock:
+            self._dropped += len(batch)
+    
+    def _write(self, activities: List[Activity]) -> None:
+        batch = self._client.db.batch()
+        for activity in activities:
+            batch.set(self._collection.document(activity.id), activity.to_document())
+        batch.commit()
+        with self._lock:
+            self._written += len(activities)
@@ -0,0 +1,18 @@
+import os
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class SinkConfig:
+    """Batching and backpressure limits of a write-behind sink"""
+    flush_interval_ms: int = 250
+    batch_size: int = 500
+    max_queue: int = 10000
+    put_timeout_seconds: float = 2.0
+
+def get_sink_config() -> SinkConfig:
+    """Get the sink settings, honouring MOONTRIP_ACTIVITY_FLUSH_MS, _BATCH and _QUEUE overrides"""
+    return SinkConfig(
+        flush_interval_ms=int(os.environ.get("MOONTRIP_ACTIVITY_FLUSH_MS", 250)),
+        batch_size=min(int(os.environ.get("MOONTRIP_ACTIVITY_BATCH", 500)), 500),
+        max_queue=int(os.environ.get("MOONTRIP_ACTIVITY_QUEUE", 10000))
+    )
@@ -0,0 +1,8 @@
+from Backend.Data.Sinks.SinkConfig import SinkConfig, get_sink_config
+from Backend.Data.Sinks.ActivitySink import ActivitySink
+
+__all__ = [
+    'SinkConfig',
+    'get_sink_config',
+    'ActivitySink'
+]
@@ -0,0 +1,146 @@
+from typing import Awaitable, Callable, Optional, TypeVar
+from google.cloud.firestore import AsyncTransaction, async_transactional
+from ..Database.AsyncFirestoreClient import AsyncFirestoreClient
+from ..Repositories.Async.AsyncUserRepository import AsyncUserRepository
+from ..Repositories.Async.AsyncTaskRepository import AsyncTaskRepository
+from ..Repositories.Async.AsyncMemberRepository import AsyncMemberRepository
+from ..Repositories.Async.AsyncCommentRepository import AsyncCommentRepository
+from ..Repositories.Async.AsyncAttachmentRepository import AsyncAttachmentRepository
+from ..Repositories.Async.AsyncActivityRepository import AsyncActivityRepository
+from .WriteBuffer import WriteBuffer, MAX_TRANSACTION_ATTEMPTS
+from .IdentityMap import IdentityMap
+
+T = TypeVar('T')
+
+class AsyncUnitOfWork:
+    """Unit of Work over the asyncio Firestore client, used with 'async with'"""
+    
+    def __init__(self,
+                 users: Optional[AsyncUserRepository] = None,
+                 tasks: Optional[AsyncTaskRepository] = None,
+                 members: Optional[AsyncMemberRepository] = None,
+                 comments: Optional[AsyncCommentRepository] = None,
+                 attachments: Optional[AsyncAttachmentRepository] = None,
+                 activities: Optional[AsyncActivityRepository] = None):
+        """Create a unit of work; pass shared repositories to avoid building new ones per instance"""
+        self._client = AsyncFirestoreClient()
+        self._transaction: Optional[AsyncTransaction] = None
+        self._write_buffer = WriteBuffer()
+        self._identity_map = IdentityMap()
+        
+        # Initialize repositories, bound to the shared write buffer and identity map
+        self._user_repository = (users or AsyncUserRepository()).bind(self._write_buffer, self._identity_map)
+        self._task_repository = (tasks or AsyncTaskRepository()).bind(self._write_buffer, self._identity_map)
+        self._member_repository = (members or AsyncMemberRepository()).bind(self._write_buffer, self._identity_map)
+        self._comment_repository = (comments or AsyncCommentRepository()).bind(self._write_buffer, self._identity_map)
+        self._attachment_repository = (attachments or AsyncAttachmentRepository()).bind(self._write_buffer, self._identity_map)
+        self._activity_repository = (activities or AsyncActivityRepository()).bind(self._write_buffer, self._identity_map)
+    
+    @property
+    def users(self) -> AsyncUserRepository:
+        return self._user_repository
+    
+    @property
+    def tasks(self) -> AsyncTaskRepository:
+        return self._task_repository
+    
+    @property
+    def members(self) -> AsyncMemberRepository:
+        return self._member_repository
+    
+    @property
+    def comments(self) -> AsyncCommentRepository:
+        return self._comment_repository
+    
+    @property
+    def attachments(self) -> AsyncAttachmentRepository:
+        return self._attachment_repository
+    
+    @property
+    def activities(self) -> AsyncActivityRepository:
+        return self._activity_repository
+    
+    @property
+    def pending_writes(self) -> int:
+        """Number of writes queued for the next commit"""
+        return len(self._write_buffer)
+    
+    async def begin_transaction(self) -> None:
+        """Start buffering writes"""
+        if self._write_buffer.is_open:
+            raise RuntimeError("Transaction already in progress")
+        self._write_buffer.is_open = True
+    
+    async def run_in_transaction(self, work: Callable[['AsyncUnitOfWork'], Awaitable[T]],
+                                 max_attempts: int = MAX_TRANSACTION_ATTEMPTS) -> T:
+        """Run work with its reads in a Firestore transaction and commit its writes with it;
+        work is awaited again from scratch when Firestore aborts the transaction on contention"""
+        if self._write_buffer.is_open:
+            raise RuntimeError("Transaction already in progress")
+        
+        @async_transactional
+        async def attempt(transaction: AsyncTransaction) -> T:
+            # A retry must not see entities or writes from the aborted attempt
+            self._identity_map.clear()
+            self._write_buffer.clear()
+            self._transaction = transaction
+            self._write_buffer.transaction = transaction
+            self._write_buffer.is_open = True
+            result = await work(self)
+            self._write_buffer.stage(transaction)
+            return result
+        
+        try:
+            result = await attempt(self._client.db.transaction(max_attempts=max_attempts))
+            self._write_buffer.committed()
+            return result
+        except Exception:
+            self._identity_map.clear()
+            raise
+        finally:
+            self._close()
+    
+    async def commit(self) -> None:
+        """Flush all buffered writes, committing the batches concurrently"""
+        if not self._write_buffer.is_open:
+            raise RuntimeError("No transaction in progress")
+        try:
+            await self._write_buffer.flush_async(self._client.db)
+        finally:
+            self._close()
+    
+    async def rollback(self) -> None:
+        """Discard all buffered writes"""
+        if not self._write_buffer.is_open:
+            raise RuntimeError("No transaction in progress")
+        # Loaded entities may hold changes that were never written
+        self._identity_map.clear()
+        self._close()
+    
+    async def end_transaction(self) -> None:
+        """End the current transaction (commit or rollback)"""
+        if self._write_buffer.is_open:
+            await self.rollback()
+    
+    def clear_identity_map(self) -> None:
+        """Forget all entities loaded so far; called at the end of each request"""
+        self._identity_map.clear()
+    
+    def _close(self) -> None:
+        """Reset the buffer and transaction state after commit or rollback"""
+        self._write_buffer.clear()
+        self._write_buffer.is_open = False
+        self._write_buffer.transaction = None
+        self._transaction = None
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.begin_transaction()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Callable, Protocol, TypeVar
 from Backend.Data.Repositories.UserRepository import UserRepository
 from Backend.Data.Repositories.TaskRepository import TaskRepository
 from Backend.Data.Repositories.MemberRepository import MemberRepository
@@ -6,6 +6,8 @@ from Backend.Data.Repositories.CommentRepository import CommentRepository
 from Backend.Data.Repositories.AttachmentRepository import AttachmentRepository
 from Backend.Data.Repositories.ActivityRepository import ActivityRepository
 
+T = TypeVar('T')
+
 class IUnitOfWork(Protocol):
     """Interface defining the contract for Unit of Work pattern"""
     
@@ -52,6 +54,14 @@ class IUnitOfWork(Protocol):
         """Begin a new transaction"""
         ...
     
+    def run_in_transaction(self, work: Callable[['IUnitOfWork'], T]) -> T:
+        """Run work in a Firestore transaction, retrying it when the transaction is aborted"""
+        ...
+    
     def end_transaction(self) -> None:
         """End the current transaction"""
+        ...
+    
+    def clear_identity_map(self) -> None:
+        """Forget all entities loaded during the current request"""
         ... 
\ No newline at end of file
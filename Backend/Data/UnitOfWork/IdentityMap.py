@@ -0,0 +1,26 @@
+from typing import Any, Dict, Optional, Tuple
+
+class IdentityMap:
+    """Request-scoped map from (collection, id) to the entity instance already loaded"""
+
+    def __init__(self):
+        self._entities: Dict[Tuple[str, str], Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, collection_name: str, id: str) -> Optional[Any]:
+        """Get the loaded entity for a document, if any"""
+        return self._entities.get((collection_name, id))
+
+    def add(self, collection_name: str, id: str, entity: Any) -> Any:
+        """Register a loaded entity, keeping the instance already mapped for the same document"""
+        return self._entities.setdefault((collection_name, id), entity)
+
+    def remove(self, collection_name: str, id: str) -> None:
+        """Forget a document, e.g. after it was deleted"""
+        self._entities.pop((collection_name, id), None)
+
+    def clear(self) -> None:
+        """Forget all loaded entities"""
+        self._entities.clear()
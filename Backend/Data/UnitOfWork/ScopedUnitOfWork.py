@@ -0,0 +1,31 @@
+from typing import Any, Callable
+
+class ScopedUnitOfWork:
+    """Long-lived handle that forwards every call to the unit of work of the current request"""
+    
+    def __init__(self, resolve: Callable[[], Any]):
+        self._resolve = resolve
+    
+    @property
+    def current(self) -> Any:
+        """The unit of work of the active request scope"""
+        return self._resolve()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+    
+    def __enter__(self):
+        """Context manager entry, delegated to the request's unit of work"""
+        return self._resolve().__enter__()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit, delegated to the request's unit of work"""
+        return self._resolve().__exit__(exc_type, exc_val, exc_tb)
+    
+    async def __aenter__(self):
+        """Async context manager entry, delegated to the request's unit of work"""
+        return await self._resolve().__aenter__()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, delegated to the request's unit of work"""
+        return await self._resolve().__aexit__(exc_type, exc_val, exc_tb)
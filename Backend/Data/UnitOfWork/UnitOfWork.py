@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from google.cloud import firestore
 from ..Database.FirestoreClient import FirestoreClient
 from ..Repositories.UserRepository import UserRepository
@@ -8,21 +8,34 @@ from ..Repositories.CommentRepository import CommentRepository
 from ..Repositories.AttachmentRepository import AttachmentRepository
 from ..Repositories.ActivityRepository import ActivityRepository
 from .IUnitOfWork import IUnitOfWork
+from .WriteBuffer import WriteBuffer, MAX_TRANSACTION_ATTEMPTS
+from .IdentityMap import IdentityMap
+
+T = TypeVar('T')
 
 class UnitOfWork(IUnitOfWork):
     """Implementation of Unit of Work pattern for Firestore"""
     
-    def __init__(self):
+    def __init__(self,
+                 users: Optional[UserRepository] = None,
+                 tasks: Optional[TaskRepository] = None,
+                 members: Optional[MemberRepository] = None,
+                 comments: Optional[CommentRepository] = None,
+                 attachments: Optional[AttachmentRepository] = None,
+                 activities: Optional[ActivityRepository] = None):
+        """Create a unit of work; pass shared repositories to avoid building new ones per instance"""
         self._client = FirestoreClient()
         self._transaction: Optional[firestore.Transaction] = None
+        self._write_buffer = WriteBuffer()
+        self._identity_map = IdentityMap()
         
-        # Initialize repositories
-        self._user_repository = UserRepository()
-        self._task_repository = TaskRepository()
-        self._member_repository = MemberRepository()
-        self._comment_repository = CommentRepository()
-        self._attachment_repository = AttachmentRepository()
-        self._activity_repository = ActivityRepository()
+        # Initialize repositories, bound to the shared write buffer and identity map
+        self._user_repository = (users or UserRepository()).bind(self._write_buffer, self._identity_map)
+        self._task_repository = (tasks or TaskRepository()).bind(self._write_buffer, self._identity_map)
+        self._member_repository = (members or MemberRepository()).bind(self._write_buffer, self._identity_map)
+        self._comment_repository = (comments or CommentRepository()).bind(self._write_buffer, self._identity_map)
+        self._attachment_repository = (attachments or AttachmentRepository()).bind(self._write_buffer, self._identity_map)
+        self._activity_repository = (activities or ActivityRepository()).bind(self._write_buffer, self._identity_map)
     
     @property
     def users(self) -> UserRepository:
@@ -48,32 +61,79 @@ class UnitOfWork(IUnitOfWork):
     def activities(self) -> ActivityRepository:
         return self._activity_repository
     
+    @property
+    def pending_writes(self) -> int:
+        """Number of writes queued for the next commit"""
+        return len(self._write_buffer)
+    
     def begin_transaction(self) -> None:
-        """Begin a new Firestore transaction"""
-        if self._transaction is not None:
+        """Start buffering writes"""
+        if self._write_buffer.is_open:
             raise RuntimeError("Transaction already in progress")
-        self._transaction = self._client.db.transaction()
+        self._write_buffer.is_open = True
+    
+    def run_in_transaction(self, work: Callable[['UnitOfWork'], T],
+                           max_attempts: int = MAX_TRANSACTION_ATTEMPTS) -> T:
+        """Run work with its reads in a Firestore transaction and commit its writes with it;
+        work is called again from scratch when Firestore aborts the transaction on contention"""
+        if self._write_buffer.is_open:
+            raise RuntimeError("Transaction already in progress")
+        
+        @firestore.transactional
+        def attempt(transaction: firestore.Transaction) -> T:
+            # A retry must not see entities or writes from the aborted attempt
+            self._identity_map.clear()
+            self._write_buffer.clear()
+            self._transaction = transaction
+            self._write_buffer.transaction = transaction
+            self._write_buffer.is_open = True
+            result = work(self)
+            self._write_buffer.stage(transaction)
+            return result
+        
+        try:
+            result = attempt(self._client.db.transaction(max_attempts=max_attempts))
+            self._write_buffer.committed()
+            return result
+        except Exception:
+            self._identity_map.clear()
+            raise
+        finally:
+            self._close()
     
     def commit(self) -> None:
-        """Commit the current transaction"""
-        if self._transaction is None:
+        """Flush all buffered writes in as few commit round trips as possible"""
+        if not self._write_buffer.is_open:
             raise RuntimeError("No transaction in progress")
         try:
-            self._transaction.commit()
+            self._write_buffer.flush(self._client.db)
         finally:
-            self._transaction = None
+            self._close()
     
     def rollback(self) -> None:
-        """Rollback the current transaction"""
-        if self._transaction is None:
+        """Discard all buffered writes"""
+        if not self._write_buffer.is_open:
             raise RuntimeError("No transaction in progress")
-        self._transaction = None
+        # Loaded entities may hold changes that were never written
+        self._identity_map.clear()
+        self._close()
     
     def end_transaction(self) -> None:
         """End the current transaction (commit or rollback)"""
-        if self._transaction is not None:
+        if self._write_buffer.is_open:
             self.rollback()
     
+    def clear_identity_map(self) -> None:
+        """Forget all entities loaded so far; called at the end of each request"""
+        self._identity_map.clear()
+    
+    def _close(self) -> None:
+        """Reset the buffer and transaction state after commit or rollback"""
+        self._write_buffer.clear()
+        self._write_buffer.is_open = False
+        self._write_buffer.transaction = None
+        self._transaction = None
+    
     def __enter__(self):
         """Context manager entry"""
         self.begin_transaction()
@@ -84,4 +144,4 @@ class UnitOfWork(IUnitOfWork):
         if exc_type is None:
             self.commit()
         else:
-            self.rollback() 
\ No newline at end of file
+            self.rollback()
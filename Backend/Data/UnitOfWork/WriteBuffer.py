@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from google.cloud import firestore
+from ..Cache.EntityCache import EntityCache
+
+# Firestore rejects commits with more than 500 write operations
+MAX_BATCH_SIZE = 500
+# Attempts, including the first, before a transaction Firestore keeps aborting is given up
+MAX_TRANSACTION_ATTEMPTS = 5
+
+SET = 'set'
+UPDATE = 'update'
+DELETE = 'delete'
+
+class WriteBuffer:
+    """Collects pending Firestore writes until the unit of work commits them"""
+
+    def __init__(self):
+        self._operations: List[Tuple[str, firestore.DocumentReference, Optional[Dict[str, Any]]]] = []
+        self._after_commit: List[Callable[[], None]] = []
+        self.is_open = False
+        self.transaction: Optional[firestore.Transaction] = None
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def set(self, ref: firestore.DocumentReference, data: Dict[str, Any]) -> None:
+        """Queue a full document write"""
+        self._operations.append((SET, ref, dict(data)))
+
+    def update(self, ref: firestore.DocumentReference, fields: Dict[str, Any]) -> None:
+        """Queue a partial document update"""
+        self._operations.append((UPDATE, ref, dict(fields)))
+
+    def delete(self, ref: firestore.DocumentReference) -> None:
+        """Queue a document deletion"""
+        self._operations.append((DELETE, ref, None))
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the pending writes are committed; dropped on rollback"""
+        self._after_commit.append(callback)
+
+    def clear(self) -> None:
+        """Discard all pending writes"""
+        self._operations = []
+        self._after_commit = []
+
+    @staticmethod
+    def _run_after_commit(callbacks: List[Callable[[], None]]) -> None:
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in after-commit callback: {str(e)}")
+
+    @staticmethod
+    def _apply(writer, operation: str, ref: firestore.DocumentReference, data: Optional[Dict[str, Any]]) -> None:
+        """Apply one queued operation to a WriteBatch or Transaction"""
+        if operation == SET:
+            writer.set(ref, data)
+        elif operation == UPDATE:
+            writer.update(ref, data)
+        else:
+            writer.delete(ref)
+
+    def stage(self, transaction: Union[firestore.Transaction, firestore.AsyncTransaction]) -> None:
+        """Add the pending writes to a transaction, which commits them; call committed() once it has"""
+        if len(self._operations) > MAX_BATCH_SIZE:
+            raise RuntimeError(f"Transaction exceeds {MAX_BATCH_SIZE} write operations")
+        for operation in self._operations:
+            self._apply(transaction, *operation)
+
+    def committed(self) -> None:
+        """Finish the writes a transaction committed: run the after-commit callbacks and drop stale cache entries"""
+        operations, self._operations = self._operations, []
+        callbacks, self._after_commit = self._after_commit, []
+        try:
+            self._run_after_commit(callbacks)
+        finally:
+            self._invalidate_cached(operations)
+
+    def flush(self, db: firestore.Client) -> int:
+        """Send all pending writes to Firestore and return the number of commit round trips"""
+        operations, self._operations = self._operations, []
+        callbacks, self._after_commit = self._after_commit, []
+        try:
+            # Each chunk is committed atomically; chunks are committed in order
+            commits = 0
+            for start in range(0, len(operations), MAX_BATCH_SIZE):
+                batch = db.batch()
+                for operation in operations[start:start + MAX_BATCH_SIZE]:
+                    self._apply(batch, *operation)
+                batch.commit()
+                commits += 1
+            self._run_after_commit(callbacks)
+            return commits
+        finally:
+            # Entries re-read by other requests while the writes were pending are now stale
+            self._invalidate_cached(operations)
+
+    async def flush_async(self, db: firestore.AsyncClient) -> int:
+        """Send all pending writes through the asyncio client, committing chunks concurrently"""
+        operations, self._operations = self._operations, []
+        callbacks, self._after_commit = self._after_commit, []
+        try:
+            batches = []
+            for start in range(0, len(operations), MAX_BATCH_SIZE):
+                batch = db.batch()
+                for operation in operations[start:start + MAX_BATCH_SIZE]:
+                    self._apply(batch, *operation)
+                batches.append(batch)
+            await asyncio.gather(*(batch.commit() for batch in batches))
+            self._run_after_commit(callbacks)
+            return len(batches)
+        finally:
+            self._invalidate_cached(operations)
+
+    @staticmethod
+    def _invalidate_cached(operations) -> None:
+        """Drop written documents from the shared entity caches"""
+        for _, ref, _ in operations:
+            cache = EntityCache.for_collection(ref.parent.id)
+            if cache is not None:
+                cache.invalidate(ref.id)
@@ -1,7 +1,15 @@
 from Backend.Data.UnitOfWork.IUnitOfWork import IUnitOfWork
 from Backend.Data.UnitOfWork.UnitOfWork import UnitOfWork
+from Backend.Data.UnitOfWork.AsyncUnitOfWork import AsyncUnitOfWork
+from Backend.Data.UnitOfWork.ScopedUnitOfWork import ScopedUnitOfWork
+from Backend.Data.UnitOfWork.WriteBuffer import WriteBuffer
+from Backend.Data.UnitOfWork.IdentityMap import IdentityMap
 
 __all__ = [
     'IUnitOfWork',
-    'UnitOfWork'
+    'UnitOfWork',
+    'AsyncUnitOfWork',
+    'ScopedUnitOfWork',
+    'WriteBuffer',
+    'IdentityMap'
 ] 
\ No newline at end of file
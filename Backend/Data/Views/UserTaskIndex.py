@@ -0,0 +1,166 @@
+from typing import Any, Dict, Iterable, List, Optional
+from google.cloud import firestore
+from ..Database.FirestoreClient import FirestoreClient
+from ..Database.AsyncFirestoreClient import AsyncFirestoreClient
+
+COLLECTION = 'user_task_index'
+OWNER = 'owner'
+MEMBER = 'member'
+ACCEPTED = 'accepted'
+# Descriptions are cut so one document can hold a few thousand summaries under the 1 MiB limit
+DESCRIPTION_PREVIEW = 200
+# Firestore rejects commits with more than 500 write operations
+MAX_BATCH_SIZE = 500
+
+def _field(data: Dict[str, Any], snake: str, camel: str) -> Any:
+    """Read a field stored by either the backend (snake_case) or the Google service (camelCase)"""
+    value = data.get(snake)
+    return data.get(camel) if value is None else value
+
+def _value(value: Any) -> Any:
+    return getattr(value, 'value', value)
+
+class UserTaskIndex:
+    """Materialized per-user task list: one document per user with a summary of every task they own or joined
+    
+    Documents are shared with the Google service and use its camelCase field names:
+    {'taskIds': [...], 'tasks': {task_id: summary}, 'updatedAt': timestamp}
+    """
+    
+    def __init__(self):
+        self._client = FirestoreClient()
+        self._collection = self._client.get_collection(COLLECTION)
+    
+    @staticmethod
+    def summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact summary of a task document or of a task entity's fields"""
+        return {
+            'title': data.get('title') or '',
+            'description': (data.get('description') or '')[:DESCRIPTION_PREVIEW],
+            'status': _value(data.get('status')),
+            'priority': _value(data.get('priority')),
+            'ownerId': _field(data, 'owner_id', 'ownerId'),
+            'dueDate': _field(data, 'due_date', 'dueDate'),
+            'tags': list(data.get('tags') or [])
+        }
+    
+    def read(self, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Summaries of a user's tasks, or None when the user's document has not been built yet"""
+        doc = self._collection.document(user_id).get()
+        return self._entries(doc) if doc.exists else None
+    
+    async def read_async(self, user_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Same as read, through the asyncio client"""
+        doc = await AsyncFirestoreClient().get_document(COLLECTION, user_id).get()
+        return self._entries(doc) if doc.exists else None
+    
+    def put_task(self, task_id: str, summary: Dict[str, Any]) -> None:
+        """Add or refresh a task in its owner's document and in every document already listing it"""
+        owner_id = summary.get('ownerId')
+        writes = []
+        if owner_id:
+            writes.append((self._collection.document(owner_id), self._add(task_id, dict(summary, role=OWNER))))
+        for doc in self._listing(task_id):
+            if doc.id != owner_id:
+                # Merging leaves the role and membership status of the entry untouched
+                writes.append((doc.reference, {'tasks': {task_id: summary}, 'updatedAt': firestore.SERVER_TIMESTAMP}))
+        self._commit(writes)
+    
+    def remove_task(self, task_id: str) -> None:
+        """Drop a deleted task from every document listing it"""
+        self._commit(
+            (doc.reference, self._remove(task_id)) for doc in self._listing(task_id)
+        )
+    
+    def put_membership(self, task_id: str, user_id: str, status: str = ACCEPTED) -> None:
+        """Add a task to a member's document"""
+        task = self._client.get_document('tasks', task_id).get()
+        if not task.exists:
+            return
+        summary = self.summarize(task.to_dict())
+        entry = dict(summary, role=OWNER) if summary['ownerId'] == user_id else dict(summary, role=MEMBER, membershipStatus=status)
+        self._collection.document(user_id).set(self._add(task_id, entry), merge=True)
+    
+    def remove_membership(self, task_id: str, user_id: str) -> None:
+        """Drop a task from a former member's document, unless the user owns it"""
+        ref = self._collection.document(user_id)
+        doc = ref.get()
+        if not doc.exists:
+            return
+        entry = (doc.to_dict().get('tasks') or {}).get(task_id)
+        if entry is not None and entry.get('role') != OWNER:
+            ref.set(self._remove(task_id), merge=True)
+    
+    def remove_user(self, user_id: str) -> None:
+        """Delete a deleted user's document"""
+        self._collection.document(user_id).delete()
+    
+    def rebuild(self, user_id: str) -> int:
+        """Recompute a user's document from their tasks and memberships and return the number of tasks"""
+        db = self._client.db
+        tasks: Dict[str, Dict[str, Any]] = {}
+        for owner_field in ('owner_id', 'ownerId'):
+            for doc in db.collection('tasks').where(owner_field, '==', user_id).stream():
+                tasks[doc.id] = dict(self.summarize(doc.to_dict()), role=OWNER)
+        
+        statuses: Dict[str, str] = {}
+        for user_field in ('user_id', 'userId'):
+            for doc in db.collection('task_members').where(user_field, '==', user_id).stream():
+                data = doc.to_dict()
+                task_id = _field(data, 'task_id', 'taskId')
+                if task_id and task_id not in tasks:
+                    # Backend memberships have no status; they are accepted when created
+                    statuses[task_id] = data.get('status') or ACCEPTED
+        refs = [db.collection('tasks').document(task_id) for task_id in statuses]
+        for start in range(0, len(refs), MAX_BATCH_SIZE):
+            for doc in db.get_all(refs[start:start + MAX_BATCH_SIZE]):
+                if doc.exists:
+                    tasks[doc.id] = dict(self.summarize(doc.to_dict()), role=MEMBER, membershipStatus=statuses[doc.id])
+        
+        self._collection.document(user_id).set({
+            'taskIds': sorted(tasks),
+            'tasks': tasks,
+            'updatedAt': firestore.SERVER_TIMESTAMP
+        })
+        return len(tasks)
+    
+    def _listing(self, task_id: str):
+        """Documents whose task list contains a task, reading only their IDs"""
+        return self._collection.where('taskIds', 'array_contains', task_id).select([]).stream()
+    
+    def _commit(self, writes: Iterable) -> None:
+        """Merge (reference, fields) writes in batches"""
+        batch = self._client.db.batch()
+        count = 0
+        for ref, data in writes:
+            batch.set(ref, data, merge=True)
+            count += 1
+            if count == MAX_BATCH_SIZE:
+                batch.commit()
+                batch = self._client.db.batch()
+                count = 0
+        if count:
+            batch.commit()
+    
+    @staticmethod
+    def _add(task_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'taskIds': firestore.ArrayUnion([task_id]),
+            'tasks': {task_id: entry},
+            'updatedAt': firestore.SERVER_TIMESTAMP
+        }
+    
+    @staticmethod
+    def _remove(task_id: str) -> Dict[str, Any]:
+        return {
+            'taskIds': firestore.ArrayRemove([task_id]),
+            'tasks': {task_id: firestore.DELETE_FIELD},
+            'updatedAt': firestore.SERVER_TIMESTAMP
+        }
+    
+    @staticmethod
+    def _entries(doc) -> List[Dict[str, Any]]:
+        """Summaries with their task IDs, ordered by title"""
+        tasks = doc.to_dict().get('tasks') or {}
+        return sorted(({'id': task_id, **entry} for task_id, entry in tasks.items()),
+                      key=lambda entry: (entry.get('title') or '').lower())
@@ -0,0 +1,68 @@
+import queue
+import threading
+from typing import Any, Callable, Optional
+from ..Entities.Member import Member
+from ..Repositories.Repository.IRepositoryObserver import IRepositoryObserver
+from .UserTaskIndex import UserTaskIndex
+
+class UserTaskIndexer(IRepositoryObserver):
+    """Keeps the user_task_index documents current from task, membership and user writes
+    
+    Index writes fan out to every user listing a task, so they run on a background
+    thread in commit order instead of on the request that made the change.
+    """
+    
+    def __init__(self, index: Optional[UserTaskIndex] = None):
+        self.index = index or UserTaskIndex()
+        self._queue: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Start the writing thread; called lazily by the first write"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="user-task-index", daemon=True)
+                self._worker.start()
+    
+    def close(self) -> None:
+        """Write what is still queued and stop the background thread"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join(timeout=30)
+    
+    def request_rebuild(self, user_id: str) -> None:
+        """Recompute a user's document in the background, e.g. when it does not exist yet"""
+        self._submit(lambda: self.index.rebuild(user_id))
+    
+    def entity_saved(self, collection_name: str, entity: Any) -> None:
+        if collection_name == 'tasks':
+            # Summarized now, while the entity still holds the committed values
+            summary = UserTaskIndex.summarize(vars(entity))
+            self._submit(lambda: self.index.put_task(entity.id, summary))
+        elif collection_name == 'task_members':
+            self._submit(lambda: self.index.put_membership(entity.task_id, entity.user_id))
+    
+    def entity_deleted(self, collection_name: str, entity_id: str) -> None:
+        if collection_name == 'tasks':
+            self._submit(lambda: self.index.remove_task(entity_id))
+        elif collection_name == 'task_members':
+            task_id, user_id = Member.parse_membership_id(entity_id)
+            self._submit(lambda: self.index.remove_membership(task_id, user_id))
+        elif collection_name == 'users':
+            self._submit(lambda: self.index.remove_user(entity_id))
+    
+    def _submit(self, write: Callable[[], None]) -> None:
+        self.start()
+        self._queue.put(write)
+    
+    def _run(self) -> None:
+        while True:
+            write = self._queue.get()
+            if write is None:
+                return
+            try:
+                write()
+            except Exception as e:
+                # The document stays stale until its next write or a rebuild
+                print(f"Error updating the user task index: {str(e)}")
@@ -0,0 +1,7 @@
+from Backend.Data.Views.UserTaskIndex import UserTaskIndex
+from Backend.Data.Views.UserTaskIndexer import UserTaskIndexer
+
+__all__ = [
+    'UserTaskIndex',
+    'UserTaskIndexer'
+]
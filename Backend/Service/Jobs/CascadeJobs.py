@@ -0,0 +1,102 @@
+from typing import Any, Dict, List
+from Backend.Data.Database.FirestoreClient import FirestoreClient
+from Backend.Data.Repositories.UserRepository import UserRepository
+from Backend.Data.Repositories.TaskRepository import TaskRepository
+from Backend.Data.Repositories.MemberRepository import MemberRepository
+from Backend.Data.Repositories.CommentRepository import CommentRepository
+from Backend.Data.Repositories.ActivityRepository import ActivityRepository
+from Backend.Service.Jobs.JobContext import JobContext
+from Backend.Service.Jobs.JobQueue import JobQueue
+
+DELETE_USER = "delete_user"
+DELETE_TASK = "delete_task"
+
+# Firestore rejects commits with more than 500 write operations
+BATCH_SIZE = 500
+
+# Phases of a user deletion, in order; the checkpoint records the next one to run
+USER_PHASES = ("tasks", "memberships", "comments", "activities", "user")
+
+class CascadeJobs:
+    """Job handlers for deletions too large to run inside a request"""
+    
+    def __init__(self, users: UserRepository, tasks: TaskRepository, members: MemberRepository,
+                 comments: CommentRepository, activities: ActivityRepository):
+        self._db = FirestoreClient().db
+        self._users = users
+        self._tasks = tasks
+        self._members = members
+        self._comments = comments
+        self._activities = activities
+    
+    def register(self, queue: JobQueue) -> None:
+        queue.register(DELETE_USER, self.delete_user)
+        queue.register(DELETE_TASK, self.delete_task)
+    
+    def delete_task(self, context: JobContext) -> Dict[str, Any]:
+        """Delete a task and everything related to it; rerunning after a crash finishes the cascade"""
+        result = self._tasks.delete_cascade(
+            context.params["task_id"],
+            on_progress=lambda progress: context.report(deleted=progress.deleted, failed=progress.failed),
+            max_ops_per_second=int(context.limiter.rate)
+        )
+        if not result.success:
+            raise RuntimeError(f"{result.failed} documents could not be deleted: {'; '.join(result.errors[:5])}")
+        return {"deleted": result.deleted}
+    
+    def delete_user(self, context: JobContext) -> Dict[str, Any]:
+        """Delete a user's tasks, memberships, comments and activities, then the user"""
+        user_id = context.params["user_id"]
+        deleted = context.progress.get("deleted", 0)
+        start = USER_PHASES.index(context.checkpoint.get("phase", USER_PHASES[0]))
+        
+        for phase in USER_PHASES[start:]:
+            context.save_checkpoint(phase=phase)
+            if phase == "tasks":
+                # Deleted tasks drop out of the query, so a resumed run continues where it stopped
+                for task in self._tasks.iter_by_owner(user_id):
+                    # Progress reports also renew the lease while a large task is being deleted
+                    result = self._tasks.delete_cascade(
+                        task.id,
+                        on_progress=lambda progress: context.report(phase=phase, deleted=deleted + progress.deleted),
+                        max_ops_per_second=int(context.limiter.rate)
+                    )
+                    if not result.success:
+                        raise RuntimeError(f"Task {task.id}: {result.failed} documents could not be deleted")
+                    deleted += result.deleted
+                    context.report(phase=phase, deleted=deleted)
+            elif phase == "memberships":
+                deleted = self._delete_all(context, phase, self._members, user_id, deleted)
+            elif phase == "comments":
+                deleted = self._delete_all(context, phase, self._comments, user_id, deleted)
+            elif phase == "activities":
+                deleted = self._delete_all(context, phase, self._activities, user_id, deleted)
+            else:
+                user = self._users.find_by_id(user_id)
+                if user is not None:
+                    self._users.delete(user)
+                    deleted += 1
+        
+        return {"phase": "done", "deleted": deleted}
+    
+    def _delete_all(self, context: JobContext, phase: str, repository: Any, user_id: str, deleted: int) -> int:
+        """Delete a user's documents of one repository in rate-limited batches"""
+        refs: List[Any] = []
+        for entity in repository.iter_by_user(user_id):
+            refs.append(repository.collection.document(entity.id))
+            if len(refs) == BATCH_SIZE:
+                deleted = self._commit_deletes(context, phase, refs, deleted)
+                refs = []
+        if refs:
+            deleted = self._commit_deletes(context, phase, refs, deleted)
+        return deleted
+    
+    def _commit_deletes(self, context: JobContext, phase: str, refs: List[Any], deleted: int) -> int:
+        context.limiter.acquire(len(refs))
+        batch = self._db.batch()
+        for ref in refs:
+            batch.delete(ref)
+        batch.commit()
+        deleted += len(refs)
+        context.report(phase=phase, deleted=deleted)
+        return deleted
@@ -0,0 +1,51 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from Backend.Data.Entities.Job import Job
+from Backend.Data.Repositories.JobRepository import JobRepository
+from Backend.Service.Jobs.RateLimiter import RateLimiter
+
+# Progress is persisted at most this often, unless a checkpoint forces a write
+PROGRESS_INTERVAL_SECONDS = 2.0
+
+class JobContext:
+    """What a running job handler sees: its parameters, checkpoint, progress reporting and rate limit"""
+    
+    def __init__(self, job: Job, repository: JobRepository, limiter: RateLimiter, lease_seconds: float):
+        self.job = job
+        self.limiter = limiter
+        self._repository = repository
+        self._lease_seconds = lease_seconds
+        self._progress: Dict[str, Any] = dict(job.progress)
+        self._last_saved = 0.0
+    
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self.job.params
+    
+    @property
+    def checkpoint(self) -> Dict[str, Any]:
+        """State saved by the last run of this job, empty on the first run"""
+        return self.job.checkpoint
+    
+    @property
+    def progress(self) -> Dict[str, Any]:
+        """Progress counters reported so far"""
+        return self._progress
+    
+    def report(self, **progress: Any) -> None:
+        """Record progress counters; written to the job document periodically"""
+        self._progress.update(progress)
+        if time.monotonic() - self._last_saved >= PROGRESS_INTERVAL_SECONDS:
+            self._save({})
+    
+    def save_checkpoint(self, **state: Any) -> None:
+        """Persist the point a resumed run should continue from"""
+        self.job.checkpoint = dict(self.job.checkpoint, **state)
+        self._save({'checkpoint': self.job.checkpoint})
+    
+    def _save(self, fields: Dict[str, Any]) -> None:
+        # Every write also renews the lease so other workers do not take the job over
+        lease_until = datetime.now(timezone.utc) + timedelta(seconds=self._lease_seconds)
+        self._repository.save(self.job.id, dict(fields, progress=self._progress, lease_until=lease_until))
+        self._last_saved = time.monotonic()
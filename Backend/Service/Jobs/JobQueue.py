@@ -0,0 +1,134 @@
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Set
+from Backend.Data.Entities.Job import Job
+from Backend.Data.Enums.JobStatus import JobStatus
+from Backend.Data.Repositories.JobRepository import JobRepository
+from Backend.Service.Jobs.JobContext import JobContext
+from Backend.Service.Jobs.RateLimiter import RateLimiter
+
+JobHandler = Callable[[JobContext], Optional[Dict[str, Any]]]
+
+DEFAULT_WORKERS = int(os.environ.get("MOONTRIP_JOB_WORKERS", 2))
+# Write budget of background jobs, so cascades cannot starve interactive traffic
+DEFAULT_WRITES_PER_SECOND = float(os.environ.get("MOONTRIP_JOB_WRITES_PER_SECOND", 500))
+# A job whose worker stopped renewing its lease for this long is resumed by another worker
+LEASE_SECONDS = 60.0
+# How often queued jobs and expired leases, e.g. of a worker that died, are looked for
+SWEEP_SECONDS = LEASE_SECONDS / 2
+
+class JobQueue:
+    """In-process worker pool for long-running jobs persisted in the jobs collection"""
+    
+    def __init__(self, repository: JobRepository, workers: int = DEFAULT_WORKERS,
+                 writes_per_second: float = DEFAULT_WRITES_PER_SECOND):
+        self._repository = repository
+        self._handlers: Dict[str, JobHandler] = {}
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._limiter = RateLimiter(writes_per_second)
+        self._owner = f"{socket.gethostname()}-{os.getpid()}"
+        # Jobs scheduled or running in this process; the owner string alone cannot tell them from a predecessor's
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+    
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter
+    
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        """Register the function that runs jobs of a type"""
+        self._handlers[job_type] = handler
+    
+    def submit(self, job_type: str, params: Dict[str, Any]) -> Job:
+        """Persist a new job and schedule it; returns as soon as the job document exists"""
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        job = Job(id=None, type=job_type, params=params)
+        self._repository.add(job)
+        self._schedule(job.id)
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get the current state of a job"""
+        return self._repository.find_by_id(job_id)
+    
+    def start(self) -> None:
+        """Resume jobs left queued or abandoned by a previous process, then keep sweeping for expired leases"""
+        self.sweep()
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="job-sweeper", daemon=True)
+            self._sweeper.start()
+    
+    def sweep(self) -> None:
+        """Schedule queued jobs and running jobs whose lease expired or was left under this owner"""
+        now = datetime.now(timezone.utc)
+        for status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            for job in self._repository.iter_by_status(status):
+                if job.type not in self._handlers:
+                    continue
+                if status == JobStatus.RUNNING and job.lease_owner != self._owner \
+                        and job.lease_until is not None and job.lease_until >= now:
+                    # Another live worker holds it
+                    continue
+                self._schedule(job.id)
+    
+    def shutdown(self) -> None:
+        """Stop taking new work; unfinished jobs resume from their checkpoint on the next start"""
+        self._stopped.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _sweep_loop(self) -> None:
+        while not self._stopped.wait(SWEEP_SECONDS):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Error sweeping jobs: {str(e)}")
+    
+    def _schedule(self, job_id: str) -> None:
+        with self._active_lock:
+            if job_id in self._active:
+                return
+            self._active.add(job_id)
+        try:
+            self._pool.submit(self._run, job_id)
+        except RuntimeError:
+            # The pool was shut down
+            with self._active_lock:
+                self._active.discard(job_id)
+    
+    def _run(self, job_id: str) -> None:
+        try:
+            self._run_claimed(job_id)
+        finally:
+            with self._active_lock:
+                self._active.discard(job_id)
+    
+    def _run_claimed(self, job_id: str) -> None:
+        job = self._repository.claim(job_id, self._owner, LEASE_SECONDS)
+        if job is None:
+            # Finished, or running on a worker that still holds the lease
+            return
+        context = JobContext(job, self._repository, self._limiter, LEASE_SECONDS)
+        try:
+            result = self._handlers[job.type](context) or {}
+            self._repository.save(job.id, {
+                'status': JobStatus.SUCCEEDED.value,
+                'progress': dict(context.progress, **result),
+                'finished_at': datetime.now(timezone.utc),
+                'lease_owner': None,
+                'lease_until': None
+            })
+        except Exception as e:
+            print(f"Job {job.id} ({job.type}) failed: {str(e)}")
+            self._repository.save(job.id, {
+                'status': JobStatus.FAILED.value,
+                'error': str(e),
+                'finished_at': datetime.now(timezone.utc),
+                'lease_owner': None,
+                'lease_until': None
+            })
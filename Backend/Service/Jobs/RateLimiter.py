@@ -0,0 +1,31 @@
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe token bucket that caps the write rate of background jobs"""
+    
+    def __init__(self, ops_per_second: float, burst: int = None):
+        self._rate = ops_per_second
+        self._capacity = burst or max(1, int(ops_per_second))
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @property
+    def rate(self) -> float:
+        return self._rate
+    
+    def acquire(self, count: int = 1) -> None:
+        """Block until count operations may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                # Requests larger than the bucket are let through once it is full
+                needed = min(count, self._capacity)
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return
+                wait = (needed - self._tokens) / self._rate
+            time.sleep(wait)
@@ -0,0 +1,13 @@
+from Backend.Service.Jobs.RateLimiter import RateLimiter
+from Backend.Service.Jobs.JobContext import JobContext
+from Backend.Service.Jobs.JobQueue import JobQueue
+from Backend.Service.Jobs.CascadeJobs import CascadeJobs, DELETE_USER, DELETE_TASK
+
+__all__ = [
+    'RateLimiter',
+    'JobContext',
+    'JobQueue',
+    'CascadeJobs',
+    'DELETE_USER',
+    'DELETE_TASK'
+]
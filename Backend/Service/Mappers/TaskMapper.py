@@ -1,6 +1,6 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from ...Data.Entities.Task import Task
-from ..Services.Tasks.TaskDTO import TaskDTO
+from ..Services.Tasks.TaskDTO import TaskDTO, TaskSummaryDTO
 
 class TaskMapper:
     """Mapper for converting between Task entity and TaskDTO"""
@@ -50,4 +50,37 @@ class TaskMapper:
     @staticmethod
     def to_dto_list(tasks: List[Task]) -> List[TaskDTO]:
         """Convert a list of Task entities to TaskDTO objects"""
-        return [TaskMapper.to_dto(task) for task in tasks if task is not None] 
\ No newline at end of file
+        return [TaskMapper.to_dto(task) for task in tasks if task is not None] 
+    
+    @staticmethod
+    def index_entry_to_summary(entry: Dict[str, Any]) -> TaskSummaryDTO:
+        """Convert an entry of a user_task_index document to TaskSummaryDTO"""
+        return TaskSummaryDTO(
+            id=entry['id'],
+            title=entry.get('title') or '',
+            description=entry.get('description') or '',
+            status=entry.get('status'),
+            owner_id=entry.get('ownerId'),
+            role=entry.get('role') or 'member',
+            membership_status=entry.get('membershipStatus'),
+            priority=entry.get('priority'),
+            due_date=entry.get('dueDate'),
+            tags=entry.get('tags') or []
+        )
+    
+    @staticmethod
+    def to_summary(dto: TaskDTO, user_id: str) -> TaskSummaryDTO:
+        """Convert TaskDTO to the task list entry seen by the given user"""
+        is_owner = dto.owner_id == user_id
+        return TaskSummaryDTO(
+            id=dto.id,
+            title=dto.title,
+            description=dto.description,
+            status=getattr(dto.status, 'value', dto.status),
+            owner_id=dto.owner_id,
+            role='owner' if is_owner else 'member',
+            membership_status=None if is_owner else 'accepted',
+            priority=getattr(dto.priority, 'value', dto.priority),
+            due_date=dto.due_date,
+            tags=dto.tags or []
+        )
\ No newline at end of file
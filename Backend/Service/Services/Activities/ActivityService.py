@@ -46,7 +46,15 @@ class ActivityService(IActivityService):
             print(f"Error creating activity: {str(e)}")
             raise
     
-    def get_task_activities(self, task_id: str, limit: Optional[int] = None) -> List[ActivityDTO]:
+    def get_all_activities(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
+        """Get one page of all activities"""
+        try:
+            return ActivityMapper.to_dto_list(self._uow.activities.get_all(limit=limit, start_after=cursor))
+        except Exception as e:
+            print(f"Error getting activities: {str(e)}")
+            return []
+    
+    def get_task_activities(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get all activities for a task"""
         try:
             # Validate task exists
@@ -54,12 +62,8 @@ class ActivityService(IActivityService):
             if not task:
                 raise ValueError("Task not found")
             
-            # Get activities
-            activities = self._uow.activities.find_by_task(task_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                activities = activities[:limit]
+            # Get a page of activities
+            activities = self._uow.activities.find_by_task(task_id, limit=limit, start_after=cursor)
             
             return ActivityMapper.to_dto_list(activities)
             
@@ -67,7 +71,7 @@ class ActivityService(IActivityService):
             print(f"Error getting task activities: {str(e)}")
             return []
     
-    def get_user_activities(self, user_id: str, limit: Optional[int] = None) -> List[ActivityDTO]:
+    def get_user_activities(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get all activities performed by a user"""
         try:
             # Validate user exists
@@ -75,12 +79,8 @@ class ActivityService(IActivityService):
             if not user:
                 raise ValueError("User not found")
             
-            # Get activities
-            activities = self._uow.activities.find_by_user(user_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                activities = activities[:limit]
+            # Get a page of activities
+            activities = self._uow.activities.find_by_user(user_id, limit=limit, start_after=cursor)
             
             return ActivityMapper.to_dto_list(activities)
             
@@ -88,7 +88,8 @@ class ActivityService(IActivityService):
             print(f"Error getting user activities: {str(e)}")
             return []
     
-    def get_activities_by_type(self, task_id: str, activity_type: ActivityType) -> List[ActivityDTO]:
+    def get_activities_by_type(self, task_id: str, activity_type: ActivityType, limit: Optional[int] = None,
+                               cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get activities of a specific type for a task"""
         try:
             # Validate task exists
@@ -96,22 +97,20 @@ class ActivityService(IActivityService):
             if not task:
                 raise ValueError("Task not found")
             
-            # Get activities
-            activities = self._uow.activities.find_by_task(task_id)
-            
-            # Filter by type
-            filtered_activities = [
-                activity for activity in activities
-                if activity.activity_type == activity_type
-            ]
+            # Filter by type in Firestore, oldest first
+            activities = self._uow.activities.find_by_task_and_type(
+                task_id, getattr(activity_type, 'value', activity_type), limit=limit, start_after=cursor
+            )
             
-            return ActivityMapper.to_dto_list(filtered_activities)
+            return ActivityMapper.to_dto_list(activities)
             
         except Exception as e:
             print(f"Error getting activities by type: {str(e)}")
             return []
     
-    def get_activities_by_date_range(self, task_id: str, start_date: datetime, end_date: datetime) -> List[ActivityDTO]:
+    def get_activities_by_date_range(self, task_id: str, start_date: datetime, end_date: datetime,
+                                     activity_type: Optional[ActivityType] = None, limit: Optional[int] = None,
+                                     cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get activities within a date range for a task"""
         try:
             # Validate task exists
@@ -123,16 +122,14 @@ class ActivityService(IActivityService):
             if start_date > end_date:
                 raise ValueError("Start date must be before end date")
             
-            # Get activities
-            activities = self._uow.activities.find_by_task(task_id)
-            
-            # Filter by date range
-            filtered_activities = [
-                activity for activity in activities
-                if start_date <= activity.created_at <= end_date
-            ]
+            # Only the activities inside the window are read
+            activities = self._uow.activities.find_by_task_in_range(
+                task_id, start_date, end_date,
+                activity_type=getattr(activity_type, 'value', activity_type),
+                limit=limit, start_after=cursor
+            )
             
-            return ActivityMapper.to_dto_list(filtered_activities)
+            return ActivityMapper.to_dto_list(activities)
             
         except Exception as e:
             print(f"Error getting activities by date range: {str(e)}")
@@ -160,11 +157,8 @@ class ActivityService(IActivityService):
             if not task:
                 raise ValueError("Task not found")
             
-            # Get all activities for the task
-            activities = self._uow.activities.find_by_task(task_id)
-            
-            # Delete all activities
-            for activity in activities:
+            # Delete all activities, streaming them page by page
+            for activity in self._uow.activities.iter_by_task(task_id):
                 self._uow.activities.delete(activity)
             
             return True
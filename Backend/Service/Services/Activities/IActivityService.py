@@ -10,19 +10,26 @@ class IActivityService:
         """Create a new activity"""
         ...
     
-    def get_task_activities(self, task_id: str, limit: Optional[int] = None) -> List[ActivityDTO]:
+    def get_all_activities(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
+        """Get one page of all activities"""
+        ...
+    
+    def get_task_activities(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get all activities for a task"""
         ...
     
-    def get_user_activities(self, user_id: str, limit: Optional[int] = None) -> List[ActivityDTO]:
+    def get_user_activities(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get all activities performed by a user"""
         ...
     
-    def get_activities_by_type(self, task_id: str, activity_type: ActivityType) -> List[ActivityDTO]:
+    def get_activities_by_type(self, task_id: str, activity_type: ActivityType, limit: Optional[int] = None,
+                               cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get activities of a specific type for a task"""
         ...
     
-    def get_activities_by_date_range(self, task_id: str, start_date: datetime, end_date: datetime) -> List[ActivityDTO]:
+    def get_activities_by_date_range(self, task_id: str, start_date: datetime, end_date: datetime,
+                                     activity_type: Optional[ActivityType] = None, limit: Optional[int] = None,
+                                     cursor: Optional[str] = None) -> List[ActivityDTO]:
         """Get activities within a date range for a task"""
         ...
     
@@ -67,7 +67,15 @@ class AttachmentService(IAttachmentService):
             print(f"Error getting attachment: {str(e)}")
             return None
     
-    def get_task_attachments(self, task_id: str, limit: Optional[int] = None) -> List[AttachmentDTO]:
+    def get_all_attachments(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
+        """Get one page of all attachments"""
+        try:
+            return AttachmentMapper.to_dto_list(self._uow.attachments.get_all(limit=limit, start_after=cursor))
+        except Exception as e:
+            print(f"Error getting attachments: {str(e)}")
+            return []
+    
+    def get_task_attachments(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
         """Get all attachments for a task"""
         try:
             # Validate task exists
@@ -75,12 +83,8 @@ class AttachmentService(IAttachmentService):
             if not task:
                 raise ValueError("Task not found")
             
-            # Get attachments
-            attachments = self._uow.attachments.find_by_task(task_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                attachments = attachments[:limit]
+            # Get a page of attachments
+            attachments = self._uow.attachments.find_by_task(task_id, limit=limit, start_after=cursor)
             
             return AttachmentMapper.to_dto_list(attachments)
             
@@ -88,7 +92,7 @@ class AttachmentService(IAttachmentService):
             print(f"Error getting task attachments: {str(e)}")
             return []
     
-    def get_user_attachments(self, user_id: str, limit: Optional[int] = None) -> List[AttachmentDTO]:
+    def get_user_attachments(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
         """Get all attachments uploaded by a user"""
         try:
             # Validate user exists
@@ -96,12 +100,8 @@ class AttachmentService(IAttachmentService):
             if not user:
                 raise ValueError("User not found")
             
-            # Get attachments
-            attachments = self._uow.attachments.find_by_user(user_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                attachments = attachments[:limit]
+            # Get a page of attachments
+            attachments = self._uow.attachments.find_by_user(user_id, limit=limit, start_after=cursor)
             
             return AttachmentMapper.to_dto_list(attachments)
             
@@ -17,12 +17,17 @@ class IAttachmentService(ABC):
         pass
     
     @abstractmethod
-    def get_task_attachments(self, task_id: str, limit: Optional[int] = None) -> List[AttachmentDTO]:
+    def get_all_attachments(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
+        """Get one page of all attachments"""
+        pass
+    
+    @abstractmethod
+    def get_task_attachments(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
         """Get all attachments for a task"""
         pass
     
     @abstractmethod
-    def get_user_attachments(self, user_id: str, limit: Optional[int] = None) -> List[AttachmentDTO]:
+    def get_user_attachments(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentDTO]:
         """Get all attachments uploaded by a user"""
         pass
     
@@ -71,7 +71,15 @@ class CommentService(ICommentService):
             print(f"Error getting comment: {str(e)}")
             return None
     
-    def get_task_comments(self, task_id: str, limit: Optional[int] = None) -> List[CommentDTO]:
+    def get_all_comments(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
+        """Get one page of all comments"""
+        try:
+            return CommentMapper.to_dto_list(self._uow.comments.get_all(limit=limit, start_after=cursor))
+        except Exception as e:
+            print(f"Error getting comments: {str(e)}")
+            return []
+    
+    def get_task_comments(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
         """Get all comments for a task"""
         try:
             # Validate task exists
@@ -79,12 +87,8 @@ class CommentService(ICommentService):
             if not task:
                 raise ValueError("Task not found")
             
-            # Get comments
-            comments = self._uow.comments.find_by_task(task_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                comments = comments[:limit]
+            # Get a page of comments
+            comments = self._uow.comments.find_by_task(task_id, limit=limit, start_after=cursor)
             
             return CommentMapper.to_dto_list(comments)
             
@@ -92,7 +96,7 @@ class CommentService(ICommentService):
             print(f"Error getting task comments: {str(e)}")
             return []
     
-    def get_user_comments(self, user_id: str, limit: Optional[int] = None) -> List[CommentDTO]:
+    def get_user_comments(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
         """Get all comments by a user"""
         try:
             # Validate user exists
@@ -100,12 +104,8 @@ class CommentService(ICommentService):
             if not user:
                 raise ValueError("User not found")
             
-            # Get comments
-            comments = self._uow.comments.find_by_user(user_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                comments = comments[:limit]
+            # Get a page of comments
+            comments = self._uow.comments.find_by_user(user_id, limit=limit, start_after=cursor)
             
             return CommentMapper.to_dto_list(comments)
             
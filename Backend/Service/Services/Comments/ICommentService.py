@@ -17,12 +17,17 @@ class ICommentService(ABC):
         pass
     
     @abstractmethod
-    def get_task_comments(self, task_id: str, limit: Optional[int] = None) -> List[CommentDTO]:
+    def get_all_comments(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
+        """Get one page of all comments"""
+        pass
+    
+    @abstractmethod
+    def get_task_comments(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
         """Get all comments for a task"""
         pass
     
     @abstractmethod
-    def get_user_comments(self, user_id: str, limit: Optional[int] = None) -> List[CommentDTO]:
+    def get_user_comments(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentDTO]:
         """Get all comments by a user"""
         pass
     
@@ -17,12 +17,17 @@ class IMemberService(ABC):
         pass
     
     @abstractmethod
-    def get_project_members(self, project_id: str, limit: Optional[int] = None) -> List[MemberDTO]:
+    def get_all_members(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
+        """Get one page of all members"""
+        pass
+    
+    @abstractmethod
+    def get_project_members(self, project_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
         """Get all members of a project"""
         pass
     
     @abstractmethod
-    def get_user_memberships(self, user_id: str, limit: Optional[int] = None) -> List[MemberDTO]:
+    def get_user_memberships(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
         """Get all project memberships for a user"""
         pass
     
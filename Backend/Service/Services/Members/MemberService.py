@@ -32,13 +32,13 @@ class MemberService(IMemberService):
                     raise ValueError("Inviter not found")
             
             # Check if user is already a member
-            existing_member = self._uow.members.find_by_project_and_user(project_id, user_id)
+            existing_member = self._uow.members.find_by_task_and_user(project_id, user_id)
             if existing_member:
                 raise ValueError("User is already a member of this project")
             
             # Create member entity
             member = Member(
-                id=None,  # Will be set by Firestore
+                id=Member.membership_id(project_id, user_id),
                 project_id=project_id,
                 user_id=user_id,
                 role=role,
@@ -76,20 +76,24 @@ class MemberService(IMemberService):
             print(f"Error getting member: {str(e)}")
             return None
     
-    def get_project_members(self, project_id: str, limit: Optional[int] = None) -> List[MemberDTO]:
+    def get_all_members(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
+        """Get one page of all members"""
+        try:
+            return [self._to_dto(member) for member in self._uow.members.get_all(limit=limit, start_after=cursor)]
+        except Exception as e:
+            print(f"Error getting members: {str(e)}")
+            return []
+    
+    def get_project_members(self, project_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
         """Get all members of a project"""
         try:
-            # Validate project exists
-            project = self._uow.projects.find_by_id(project_id)
+            # Members belong to tasks; the project is the task they joined
+            project = self._uow.tasks.find_by_id(project_id)
             if not project:
                 raise ValueError("Project not found")
             
-            # Get members
-            members = self._uow.members.find_by_project(project_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                members = members[:limit]
+            # Get a page of members
+            members = self._uow.members.find_by_task(project_id, limit=limit, start_after=cursor)
             
             return [self._to_dto(member) for member in members]
             
@@ -97,7 +101,7 @@ class MemberService(IMemberService):
             print(f"Error getting project members: {str(e)}")
             return []
     
-    def get_user_memberships(self, user_id: str, limit: Optional[int] = None) -> List[MemberDTO]:
+    def get_user_memberships(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberDTO]:
         """Get all project memberships for a user"""
         try:
             # Validate user exists
@@ -105,12 +109,8 @@ class MemberService(IMemberService):
             if not user:
                 raise ValueError("User not found")
             
-            # Get memberships
-            memberships = self._uow.members.find_by_user(user_id)
-            
-            # Apply limit if specified
-            if limit is not None:
-                memberships = memberships[:limit]
+            # Get a page of memberships
+            memberships = self._uow.members.find_by_user(user_id, limit=limit, start_after=cursor)
             
             return [self._to_dto(membership) for membership in memberships]
             
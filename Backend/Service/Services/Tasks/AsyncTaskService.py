@@ -0,0 +1,432 @@
+import asyncio
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set
+from Backend.Data.UnitOfWork.AsyncUnitOfWork import AsyncUnitOfWork
+from Backend.Data.Entities.Task import Task
+from Backend.Service.Services.Tasks.ITaskService import ITaskService
+from Backend.Service.Services.Tasks.TaskDTO import TaskDTO, TaskSummaryDTO, CreateTaskDTO, UpdateTaskDTO, TaskResponseDTO
+from Backend.Service.Services.Activities.ActivityDTO import ActivityType
+from Backend.Service.Mappers.TaskMapper import TaskMapper
+from Backend.Service.Jobs.JobQueue import JobQueue
+from Backend.Service.Jobs.CascadeJobs import DELETE_TASK
+from Backend.Data.Search.TaskSearchIndexer import TaskSearchIndexer
+from Backend.Data.Search.TaskTagIndexer import TaskTagIndexer
+from Backend.Data.Search.TaskDueIndexer import TaskDueIndexer
+from Backend.Data.Search.TaskAccessIndexer import TaskAccessIndexer
+from Backend.Data.Views.UserTaskIndexer import UserTaskIndexer
+from Backend.Data.Search.TagBitmapIndex import TagBitmapIndex
+from Backend.Data.Search.TagExpression import TagExpression
+from Backend.Data.Queries.TaskQuery import TaskQuery, UnindexedQueryError
+from Backend.Data.Enums.TaskStatus import TaskStatus
+
+class AsyncTaskService(ITaskService):
+    """Task service running on the asyncio Firestore client"""
+    
+    def __init__(self, unit_of_work: AsyncUnitOfWork, job_queue: Optional[JobQueue] = None,
+                 search_index: Optional[TaskSearchIndexer] = None, tag_index: Optional[TaskTagIndexer] = None,
+                 due_index: Optional[TaskDueIndexer] = None, task_list: Optional[UserTaskIndexer] = None,
+                 access_index: Optional[TaskAccessIndexer] = None):
+        self._uow = unit_of_work
+        self._job_queue = job_queue
+        self._search_index = search_index
+        self._tag_index = tag_index
+        self._due_index = due_index
+        self._task_list = task_list
+        self._access_index = access_index
+    
+    async def create_task(self, task_dto: CreateTaskDTO, owner_id: str) -> TaskResponseDTO:
+        """Create a new task"""
+        try:
+            member_ids = list(task_dto.member_ids or [])
+            if member_ids and owner_id not in member_ids:
+                member_ids.append(owner_id)
+            
+            # Validate owner and members concurrently
+            owner, members = await asyncio.gather(
+                self._uow.users.find_by_id(owner_id),
+                self._uow.users.find_by_ids(member_ids)
+            )
+            if not owner:
+                return TaskResponseDTO(
+                    success=False,
+                    message="Task owner not found",
+                    error_code=404
+                )
+            
+            # Create task entity
+            task = Task(
+                id=None,  # Will be set by Firestore
+                title=task_dto.title,
+                description=task_dto.description,
+                status=task_dto.status,
+                priority=task_dto.priority,
+                owner_id=owner_id,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow(),
+                due_date=task_dto.due_date,
+                tags=task_dto.tags or []
+            )
+            
+            # Write the task and its members in a single commit; the activity is logged once it lands
+            async with self._uow as uow:
+                await uow.tasks.add(task)
+                for member in members:
+                    await uow.members.add_member(task.id, member.id, "member")
+                await uow.activities.create_activity(
+                    task.id,
+                    owner_id,
+                    ActivityType.TASK_CREATED,
+                    {"task_title": task.title}
+                )
+            
+            return TaskResponseDTO(
+                success=True,
+                message="Task created successfully",
+                task=TaskMapper.to_dto(task)
+            )
+            
+        except Exception as e:
+            return TaskResponseDTO(
+                success=False,
+                message=f"Error creating task: {str(e)}",
+                error_code=500
+            )
+    
+    async def get_task(self, task_id: str) -> TaskResponseDTO:
+        """Get task by ID"""
+        try:
+            task = await self._uow.tasks.find_by_id(task_id)
+            if not task:
+                return TaskResponseDTO(
+                    success=False,
+                    message="Task not found",
+                    error_code=404
+                )
+            
+            return TaskResponseDTO(
+                success=True,
+                message="Task retrieved successfully",
+                task=TaskMapper.to_dto(task)
+            )
+            
+        except Exception as e:
+            return TaskResponseDTO(
+                success=False,
+                message=f"Error retrieving task: {str(e)}",
+                error_code=500
+            )
+    
+    async def update_task(self, task_id: str, task_dto: UpdateTaskDTO) -> TaskResponseDTO:
+        """Update task details"""
+        try:
+            # Load the task and its current members concurrently
+            task, current_members = await asyncio.gather(
+                self._uow.tasks.find_by_id(task_id),
+                self._uow.members.find_by_task(task_id) if task_dto.member_ids is not None else asyncio.sleep(0, [])
+            )
+            if not task:
+                return TaskResponseDTO(
+                    success=False,
+                    message="Task not found",
+                    error_code=404
+                )
+            
+            # Track changes for activity logging
+            changes = {}
+            for field in ("title", "description", "status", "priority", "due_date", "tags"):
+                new_value = getattr(task_dto, field)
+                old_value = getattr(task, field)
+                if new_value is not None and new_value != old_value:
+                    changes[field] = {"old": old_value, "new": new_value}
+                    setattr(task, field, new_value)
+            
+            task.updated_at = datetime.utcnow()
+            
+            new_members = []
+            if task_dto.member_ids is not None:
+                current_member_ids = {member.user_id for member in current_members}
+                new_members = await self._uow.users.find_by_ids([
+                    member_id for member_id in task_dto.member_ids
+                    if member_id not in current_member_ids
+                ])
+            
+            # Write the task and member changes in a single commit; the activity is logged once it lands
+            async with self._uow as uow:
+                await uow.tasks.update(task)
+                
+                if task_dto.member_ids is not None:
+                    # Add new members
+                    for member in new_members:
+                        await uow.members.add_member(task.id, member.id, "member")
+                        changes.setdefault("members", {}).setdefault("added", []).append(member.id)
+                    
+                    # Remove members not in the new list
+                    for member in current_members:
+                        if member.user_id not in task_dto.member_ids and member.user_id != task.owner_id:
+                            await uow.members.delete(member)
+                            changes.setdefault("members", {}).setdefault("removed", []).append(member.user_id)
+                
+                # Create activity for task update if there were changes
+                if changes:
+                    await uow.activities.create_activity(
+                        task.id,
+                        task.owner_id,
+                        ActivityType.TASK_UPDATED,
+                        {"changes": changes}
+                    )
+            
+            return TaskResponseDTO(
+                success=True,
+                message="Task updated successfully",
+                task=TaskMapper.to_dto(task)
+            )
+            
+        except Exception as e:
+            return TaskResponseDTO(
+                success=False,
+                message=f"Error updating task: {str(e)}",
+                error_code=500
+            )
+    
+    async def delete_task(self, task_id: str) -> TaskResponseDTO:
+        """Delete a task"""
+        try:
+            task = await self._uow.tasks.find_by_id(task_id)
+            if not task:
+                return TaskResponseDTO(
+                    success=False,
+                    message="Task not found",
+                    error_code=404
+                )
+            
+            # Large cascades run in the background; the caller polls the job
+            if self._job_queue is not None:
+                job = await asyncio.to_thread(self._job_queue.submit, DELETE_TASK, {"task_id": task_id})
+                return TaskResponseDTO(
+                    success=True,
+                    message="Task deletion scheduled",
+                    job_id=job.id
+                )
+            
+            # Delete the task, its subcollections and related documents through a BulkWriter
+            result = await self._uow.tasks.delete_cascade(
+                task_id,
+                on_progress=lambda progress: print(f"Deleting task {task_id}: {progress.deleted} documents deleted")
+            )
+            if not result.success:
+                return TaskResponseDTO(
+                    success=False,
+                    message=f"Error deleting task: {result.failed} documents could not be deleted",
+                    error_code=500
+                )
+            
+            return TaskResponseDTO(
+                success=True,
+                message="Task deleted successfully"
+            )
+            
+        except Exception as e:
+            return TaskResponseDTO(
+                success=False,
+                message=f"Error deleting task: {str(e)}",
+                error_code=500
+            )
+    
+    async def get_all_tasks(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[TaskDTO]:
+        """Get one page of all tasks"""
+        try:
+            return TaskMapper.to_dto_list(await self._uow.tasks.get_all(limit=limit, start_after=cursor))
+        except Exception as e:
+            print(f"Error getting tasks: {str(e)}")
+            return []
+    
+    async def get_user_tasks(self, user_id: str, include_member_tasks: bool = True) -> List[TaskDTO]:
+        """Get all tasks for a user (owned and/or member tasks)"""
+        try:
+            if not include_member_tasks:
+                owned_tasks = await self._uow.tasks.find_by_owner(user_id)
+                return [TaskMapper.to_dto(task) for task in owned_tasks]
+            
+            # Owned tasks and memberships are independent reads
+            owned_tasks, memberships = await asyncio.gather(
+                self._uow.tasks.find_by_owner(user_id),
+                self._uow.members.find_by_user(user_id)
+            )
+            member_tasks = await self._uow.tasks.find_by_ids([member.task_id for member in memberships])
+            
+            tasks = [TaskMapper.to_dto(task) for task in owned_tasks]
+            tasks.extend(
+                TaskMapper.to_dto(task) for task in member_tasks
+                if task.owner_id != user_id  # Don't duplicate owned tasks
+            )
+            return tasks
+            
+        except Exception as e:
+            # Log error and return empty list
+            print(f"Error getting user tasks: {str(e)}")
+            return []
+    
+    async def get_task_list(self, user_id: str) -> List[TaskSummaryDTO]:
+        """Summaries of the tasks a user owns or is a member of, from one read of their user_task_index document"""
+        try:
+            if self._task_list is not None:
+                entries = await self._task_list.index.read_async(user_id)
+                if entries is not None:
+                    return [TaskMapper.index_entry_to_summary(entry) for entry in entries]
+                # Not built yet: build it behind this request and answer from the tasks themselves
+                self._task_list.request_rebuild(user_id)
+        except Exception as e:
+            print(f"Error reading the task list of user {user_id}: {str(e)}")
+        return [TaskMapper.to_summary(task, user_id) for task in await self.get_user_tasks(user_id)]
+    
+    async def find_tasks(self, user_id: str, task_query: TaskQuery, include_member_tasks: bool = False) -> List[TaskDTO]:
+        """Run a composed task query over the tasks a user owns, and optionally those they are a member of"""
+        try:
+            if include_member_tasks:
+                member_task_ids = await self._uow.members.find_task_ids_by_user(user_id)
+                task_query = task_query.visible_to(user_id, member_task_ids)
+            else:
+                task_query = task_query.owned_by(user_id)
+            tasks = await self._uow.tasks.find_by_query(task_query)
+            return [TaskMapper.to_dto(task) for task in tasks]
+        except UnindexedQueryError:
+            # The filter combination is the caller's to fix, not an empty result
+            raise
+        except Exception as e:
+            print(f"Error finding tasks: {str(e)}")
+            return []
+    
+    async def get_tasks_by_status(self, status: str, user_id: str) -> List[TaskDTO]:
+        """Get tasks by status for a specific user"""
+        return await self.find_tasks(user_id, TaskQuery().with_status(status), include_member_tasks=True)
+    
+    async def get_tasks_by_priority(self, priority: str, user_id: str) -> List[TaskDTO]:
+        """Get tasks by priority for a specific user"""
+        return await self.find_tasks(user_id, TaskQuery().with_priority(priority), include_member_tasks=True)
+    
+    async def search_tasks(self, query: str, user_id: str, limit: int = 50) -> List[TaskDTO]:
+        """Search the titles, descriptions, mini-tasks and comments of the tasks a user can see, best match first"""
+        if self._search_index is not None and self._search_index.ready:
+            try:
+                # Only the ranked hits are checked against the access index; while it loads, task IDs are read
+                # to scope the search. Full tasks are fetched for the hits alone
+                allowed = self._access_check(user_id)
+                task_ids = None if allowed is not None else await self._visible_task_ids(user_id)
+                ranked = self._search_index.search(query, task_ids, limit, allowed)
+                tasks = await self._uow.tasks.find_by_ids([task_id for task_id, _ in ranked])
+                return [TaskMapper.to_dto(task) for task in tasks]
+            except Exception as e:
+                print(f"Error searching tasks: {str(e)}")
+                return []
+        
+        # Index still loading: scan the user's tasks
+        tasks = await self.get_user_tasks(user_id)
+        query = query.lower()
+        return [
+            task for task in tasks
+            if query in task.title.lower() or query in task.description.lower()
+        ]
+    
+    async def get_tasks_by_due_date(self, start_date: datetime, end_date: datetime, user_id: str) -> List[TaskDTO]:
+        """Get tasks due between start_date and end_date"""
+        return await self.get_due_timeline(user_id, start_date, end_date)
+    
+    async def get_tasks_by_tag(self, tag: str, user_id: str) -> List[TaskDTO]:
+        """Get tasks with a specific tag"""
+        return await self.find_tasks(user_id, TaskQuery().tagged(tag), include_member_tasks=True)
+    
+    async def get_overdue_tasks(self, user_id: str) -> List[TaskDTO]:
+        """Get all overdue tasks for a user"""
+        return await self.get_due_timeline(user_id, end=datetime.utcnow(), open_only=True)
+    
+    async def get_tasks_due_within(self, days: int, user_id: str) -> List[TaskDTO]:
+        """Get the unfinished tasks due in the next given number of days"""
+        now = datetime.utcnow()
+        return await self.get_due_timeline(user_id, now, now + timedelta(days=days), open_only=True)
+    
+    async def get_due_timeline(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               open_only: bool = False, limit: Optional[int] = None) -> List[TaskDTO]:
+        """Get the tasks a user can see due within [start, end], earliest first"""
+        try:
+            if self._due_index is not None and self._due_index.ready:
+                task_ids = self._due_index.due_between(user_id, start, end, open_only, limit)
+                return [TaskMapper.to_dto(task) for task in await self._uow.tasks.find_by_ids(task_ids)]
+        except Exception as e:
+            print(f"Error reading the due date index: {str(e)}")
+        
+        # Index still loading: query Firestore instead
+        return await self.find_tasks(user_id, self._due_query(start, end, open_only).take(limit), include_member_tasks=True)
+    
+    async def get_due_months(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                             open_only: bool = False) -> Dict[str, int]:
+        """Number of tasks a user can see due in each calendar month ('YYYY-MM') within [start, end]"""
+        try:
+            if self._due_index is not None and self._due_index.ready:
+                return self._due_index.months(user_id, start, end, open_only)
+        except Exception as e:
+            print(f"Error reading the due date index: {str(e)}")
+        
+        months: Dict[str, int] = {}
+        for task in await self.find_tasks(user_id, self._due_query(start, end, open_only), include_member_tasks=True):
+            month = task.due_date.strftime('%Y-%m')
+            months[month] = months.get(month, 0) + 1
+        return months
+    
+    @staticmethod
+    def _due_query(start: Optional[datetime], end: Optional[datetime], open_only: bool) -> TaskQuery:
+        task_query = TaskQuery().due_between(start, end).ordered_by("due_date")
+        return task_query.without_status(TaskStatus.DONE) if open_only else task_query
+    
+    async def get_tasks_by_tag_expression(self, expression: str, user_id: str, limit: int = 50) -> List[TaskDTO]:
+        """Get the tasks a user can see whose tags match a boolean expression such as 'a AND (b OR c) AND NOT d'"""
+        # Syntax errors are left to the caller to report
+        tag_expression = TagExpression(expression)
+        try:
+            if self._tag_index is not None and self._tag_index.ready:
+                allowed = self._access_check(user_id)
+                scope = None if allowed is not None else await self._visible_task_ids(user_id)
+                task_ids = self._tag_index.match(tag_expression, scope, limit, allowed)
+                return [TaskMapper.to_dto(task) for task in await self._uow.tasks.find_by_ids(task_ids)]
+            
+            # Index still loading: evaluate the expression over the user's tasks
+            tasks = {task.id: task for task in await self.get_user_tasks(user_id)}
+            index = TagBitmapIndex()
+            for task in tasks.values():
+                index.set_tags(task.id, task.tags or [])
+            matches = index.task_ids(tag_expression.evaluate(index.bitmap, index.all) & index.all)
+            return [tasks[task_id] for task_id in islice(matches, limit)]
+        except Exception as e:
+            print(f"Error getting tasks by tag expression: {str(e)}")
+            return []
+    
+    async def get_tag_counts(self, user_id: str) -> Dict[str, int]:
+        """Number of tasks per tag among the tasks a user can see"""
+        try:
+            if self._tag_index is not None and self._tag_index.ready:
+                return self._tag_index.counts(await self._visible_task_ids(user_id))
+            counts: Dict[str, int] = {}
+            for task in await self.get_user_tasks(user_id):
+                for tag in set(task.tags or []):
+                    counts[tag] = counts.get(tag, 0) + 1
+            return counts
+        except Exception as e:
+            print(f"Error counting tags: {str(e)}")
+            return {}
+    
+    async def _visible_task_ids(self, user_id: str) -> Set[str]:
+        """IDs of the tasks a user owns or is a member of, without reading the tasks themselves"""
+        if self._access_index is not None and self._access_index.ready:
+            return set(self._access_index.visible_task_ids(user_id))
+        owned_ids, member_task_ids = await asyncio.gather(
+            self._uow.tasks.find_ids_by_owner(user_id),
+            self._uow.members.find_task_ids_by_user(user_id)
+        )
+        return set(owned_ids) | set(member_task_ids)
+    
+    def _access_check(self, user_id: str) -> Optional[Callable[[str], bool]]:
+        """Whether the user can see a task, answered from the access index, or None while it is loading"""
+        if self._access_index is None or not self._access_index.ready:
+            return None
+        access_index = self._access_index
+        return lambda task_id: access_index.can_see(user_id, task_id)
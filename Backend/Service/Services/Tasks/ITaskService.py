@@ -1,38 +1,74 @@
-from typing import Optional, List
-from Backend.Service.Services.Tasks.TaskDTO import TaskDTO
+from datetime import datetime
+from typing import Dict, Optional, List
+from Backend.Data.Queries.TaskQuery import TaskQuery
+from Backend.Service.Services.Tasks.TaskDTO import TaskDTO, TaskSummaryDTO
 from Backend.Service.Services.Tasks.TaskRequestDTO import CreateTaskDTO, UpdateTaskDTO, TaskResponseDTO
 
 class ITaskService:
     """Interface for task service operations"""
     
-    def create_task(self, task_dto: CreateTaskDTO, owner_id: str) -> TaskResponseDTO:
+    async def create_task(self, task_dto: CreateTaskDTO, owner_id: str) -> TaskResponseDTO:
         """Create a new task"""
         ...
     
-    def get_task(self, task_id: str) -> TaskResponseDTO:
+    async def get_task(self, task_id: str) -> TaskResponseDTO:
         """Get task by ID"""
         ...
     
-    def update_task(self, task_id: str, task_dto: UpdateTaskDTO) -> TaskResponseDTO:
+    async def update_task(self, task_id: str, task_dto: UpdateTaskDTO) -> TaskResponseDTO:
         """Update task details"""
         ...
     
-    def delete_task(self, task_id: str) -> TaskResponseDTO:
+    async def delete_task(self, task_id: str) -> TaskResponseDTO:
         """Delete a task"""
         ...
     
-    def get_user_tasks(self, user_id: str, include_member_tasks: bool = True) -> List[TaskDTO]:
+    async def get_all_tasks(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[TaskDTO]:
+        """Get one page of all tasks"""
+        ...
+    
+    async def get_user_tasks(self, user_id: str, include_member_tasks: bool = True) -> List[TaskDTO]:
         """Get all tasks for a user (owned and/or member tasks)"""
         ...
     
-    def get_tasks_by_status(self, status: str, user_id: str) -> List[TaskDTO]:
+    async def get_task_list(self, user_id: str) -> List[TaskSummaryDTO]:
+        """Summaries of the tasks a user owns or is a member of, from their materialized task list"""
+        ...
+    
+    async def find_tasks(self, user_id: str, task_query: TaskQuery, include_member_tasks: bool = False) -> List[TaskDTO]:
+        """Run a composed task query over the tasks a user owns, and optionally those they are a member of"""
+        ...
+    
+    async def get_tasks_by_status(self, status: str, user_id: str) -> List[TaskDTO]:
         """Get tasks by status for a specific user"""
         ...
     
-    def get_tasks_by_priority(self, priority: str, user_id: str) -> List[TaskDTO]:
+    async def get_tasks_by_priority(self, priority: str, user_id: str) -> List[TaskDTO]:
         """Get tasks by priority for a specific user"""
         ...
     
-    def search_tasks(self, query: str, user_id: str) -> List[TaskDTO]:
-        """Search tasks by title or description"""
-        ... 
\ No newline at end of file
+    async def search_tasks(self, query: str, user_id: str, limit: int = 50) -> List[TaskDTO]:
+        """Search tasks a user can see by text, best match first"""
+        ... 
+    
+    async def get_tasks_by_tag_expression(self, expression: str, user_id: str, limit: int = 50) -> List[TaskDTO]:
+        """Get the tasks a user can see whose tags match a boolean tag expression"""
+        ...
+    
+    async def get_tag_counts(self, user_id: str) -> Dict[str, int]:
+        """Number of tasks per tag among the tasks a user can see"""
+        ...
+    
+    async def get_tasks_due_within(self, days: int, user_id: str) -> List[TaskDTO]:
+        """Get the unfinished tasks due in the next given number of days"""
+        ...
+    
+    async def get_due_timeline(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               open_only: bool = False, limit: Optional[int] = None) -> List[TaskDTO]:
+        """Get the tasks a user can see due within [start, end], earliest first"""
+        ...
+    
+    async def get_due_months(self, user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                             open_only: bool = False) -> Dict[str, int]:
+        """Number of tasks a user can see due in each calendar month within [start, end]"""
+        ...
\ No newline at end of file
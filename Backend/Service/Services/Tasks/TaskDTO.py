@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from enum import Enum
 from Backend.Service.Services.Members.MemberDTO import MemberDTO
 from Backend.Service.Services.Comments.CommentDTO import CommentDTO
@@ -39,6 +39,20 @@ class TaskDTO:
     tags: List[str] = field(default_factory=list)
     attachments: List[str] = field(default_factory=list)  # List of attachment URLs
 
+@dataclass
+class TaskSummaryDTO:
+    """Compact task entry of a user's task list"""
+    id: str
+    title: str
+    description: str
+    status: Optional[str]
+    owner_id: Optional[str]
+    role: str  # "owner" or "member"
+    membership_status: Optional[str] = None  # e.g. "pending", "accepted"; None for owners
+    priority: Optional[Any] = None
+    due_date: Optional[datetime] = None
+    tags: List[str] = field(default_factory=list)
+
 @dataclass
 class CreateTaskDTO:
     """Data Transfer Object for creating a new task"""
@@ -67,4 +81,5 @@ class TaskResponseDTO:
     success: bool
     message: str
     task: Optional[TaskDTO] = None
-    error_code: Optional[int] = None 
\ No newline at end of file
+    error_code: Optional[int] = None
+    job_id: Optional[str] = None  # Set when the operation continues as a background job
@@ -1,10 +1,14 @@
-from typing import Optional
+from typing import List, Optional
 from .UserDTO import UserDTO
 from .UserRequestDTO import RegisterUserDTO, UpdateUserDTO, UserResponseDTO
 
 class IUserService:
     """Interface for user service operations"""
     
+    def get_all_users(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[UserDTO]:
+        """Get one page of all users"""
+        ...
+    
     def get_user_details(self, user_id: str) -> UserResponseDTO:
         """Get detailed user information"""
         ...
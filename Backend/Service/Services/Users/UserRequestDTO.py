@@ -22,4 +22,5 @@ class UserResponseDTO:
     success: bool
     message: str
     user: Optional['UserDTO'] = None
-    error_code: Optional[int] = None 
\ No newline at end of file
+    error_code: Optional[int] = None
+    job_id: Optional[str] = None  # Set when the operation continues as a background job
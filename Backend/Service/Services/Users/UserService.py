@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 import re
 from datetime import datetime
 from Backend.Data.UnitOfWork.IUnitOfWork import IUnitOfWork
@@ -10,12 +10,23 @@ from Backend.Service.Services.Comments.CommentDTO import CommentDTO
 from Backend.Service.Services.Activities.ActivityDTO import ActivityDTO
 from Backend.Service.Mappers.UserMapper import UserMapper
 from Backend.Service.Services.Users.IUserService import IUserService
+from Backend.Service.Jobs.JobQueue import JobQueue
+from Backend.Service.Jobs.CascadeJobs import DELETE_USER
 
 class UserService(IUserService):
     """Service for handling user operations"""
     
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IUnitOfWork, job_queue: Optional[JobQueue] = None):
         self._uow = unit_of_work
+        self._job_queue = job_queue
+    
+    def get_all_users(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[UserDTO]:
+        """Get one page of all users"""
+        try:
+            return [UserMapper.to_dto(user) for user in self._uow.users.get_all(limit=limit, start_after=cursor)]
+        except Exception as e:
+            print(f"Error getting users: {str(e)}")
+            return []
     
     def get_user_details(self, user_id: str) -> UserResponseDTO:
         """Get detailed user information"""
@@ -30,10 +41,10 @@ class UserService(IUserService):
                 )
             
             # Get related data
-            owned_tasks = [TaskDTO(**task.__dict__) for task in self._uow.tasks.find_by_owner(user_id)]
-            member_tasks = [MemberDTO(**member.__dict__) for member in self._uow.task_members.find_by_user(user_id)]
-            comments = [CommentDTO(**comment.__dict__) for comment in self._uow.task_comments.find_by_user(user_id)]
-            activities = [ActivityDTO(**activity.__dict__) for activity in self._uow.task_activities.find_by_user(user_id)]
+            owned_tasks = [TaskDTO(**task.to_document()) for task in self._uow.tasks.find_by_owner(user_id)]
+            member_tasks = [MemberDTO(**member.to_document()) for member in self._uow.members.find_by_user(user_id)]
+            comments = [CommentDTO(**comment.to_document()) for comment in self._uow.comments.find_by_user(user_id)]
+            activities = [ActivityDTO(**activity.to_document()) for activity in self._uow.activities.find_by_user(user_id)]
             
             # Map to DTO
             user_dto = UserMapper.to_dto(
@@ -124,23 +135,32 @@ class UserService(IUserService):
                     error_code=404
                 )
             
+            # Large cascades run in the background; the caller polls the job
+            if self._job_queue is not None:
+                job = self._job_queue.submit(DELETE_USER, {"user_id": user_id})
+                return UserResponseDTO(
+                    success=True,
+                    message="User deletion scheduled",
+                    job_id=job.id
+                )
+            
             # Delete user's tasks, comments, etc.
             with self._uow as uow:
                 # Delete user's tasks
-                for task in uow.tasks.find_by_owner(user_id):
+                for task in uow.tasks.iter_by_owner(user_id):
                     uow.tasks.delete(task)
                 
                 # Delete user's task memberships
-                for member in uow.task_members.find_by_user(user_id):
-                    uow.task_members.delete(member)
+                for member in uow.members.iter_by_user(user_id):
+                    uow.members.delete(member)
                 
                 # Delete user's comments
-                for comment in uow.task_comments.find_by_user(user_id):
-                    uow.task_comments.delete(comment)
+                for comment in uow.comments.iter_by_user(user_id):
+                    uow.comments.delete(comment)
                 
                 # Delete user's activities
-                for activity in uow.task_activities.find_by_user(user_id):
-                    uow.task_activities.delete(activity)
+                for activity in uow.activities.iter_by_user(user_id):
+                    uow.activities.delete(activity)
                 
                 # Finally, delete the user
                 uow.users.delete(user)
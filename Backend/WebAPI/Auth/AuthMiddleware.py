@@ -0,0 +1,47 @@
+from typing import Iterable
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from Backend.WebAPI.Auth.TokenVerifier import TokenVerifier, InvalidTokenError
+
+DEFAULT_PUBLIC_PATHS = ("/", "/swagger", "/redoc", "/openapi.json", "/metrics")
+
+class AuthMiddleware:
+    """ASGI middleware that verifies the bearer token and stores its claims on request.state"""
+    
+    def __init__(self, app: ASGIApp, verifier: TokenVerifier, public_paths: Iterable[str] = DEFAULT_PUBLIC_PATHS):
+        self.app = app
+        self._verifier = verifier
+        self._public_paths = tuple(public_paths)
+    
+    def _is_public(self, path: str) -> bool:
+        """Docs, metrics and the root page do not require a token"""
+        return any(
+            path == public or (public != "/" and path.startswith(public + "/"))
+            for public in self._public_paths
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or self._is_public(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        
+        authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+        if not authorization.startswith("Bearer "):
+            await self._reject("No bearer token provided")(scope, receive, send)
+            return
+        
+        try:
+            claims = await self._verifier.verify(authorization[len("Bearer "):])
+        except InvalidTokenError as e:
+            await self._reject(str(e))(scope, receive, send)
+            return
+        
+        # Starlette exposes scope["state"] as request.state
+        state = scope.setdefault("state", {})
+        state["claims"] = claims
+        state["uid"] = claims["uid"]
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    def _reject(detail: str) -> JSONResponse:
+        return JSONResponse(status_code=401, content={"detail": detail}, headers={"WWW-Authenticate": "Bearer"})
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from jose.backends.base import Key
+
+class IKeySource(ABC):
+    """Source of the public keys that sign ID tokens"""
+    
+    @abstractmethod
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """Get the verification key for a key ID, or None when it is unknown"""
+        pass
@@ -0,0 +1,58 @@
+import asyncio
+import json
+import re
+import time
+import urllib.request
+from typing import Dict, Optional, Tuple
+from jose import jwk
+from jose.backends.base import Key
+from Backend.WebAPI.Auth.IKeySource import IKeySource
+
+# JSON Web Key Set used by Firebase Auth to sign ID tokens
+FIREBASE_JWKS_URL = 'https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com'
+DEFAULT_MAX_AGE = 3600
+# Unknown key IDs trigger a refetch at most this often, so bogus tokens cannot hammer Google
+MIN_REFETCH_SECONDS = 30
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+class JwksKeySet(IKeySource):
+    """Remote JWKS kept in memory for as long as its Cache-Control max-age allows"""
+    
+    def __init__(self, url: str = FIREBASE_JWKS_URL, timeout: float = 10):
+        self._url = url
+        self._timeout = timeout
+        self._keys: Dict[str, Key] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _fetch(self) -> Tuple[Dict[str, Key], int]:
+        """Download the key set and its max-age (blocking)"""
+        with urllib.request.urlopen(self._url, timeout=self._timeout) as response:
+            payload = json.load(response)
+            match = _MAX_AGE.search(response.headers.get('Cache-Control', ''))
+        keys = {key['kid']: jwk.construct(key, key.get('alg', 'RS256')) for key in payload['keys']}
+        return keys, int(match.group(1)) if match else DEFAULT_MAX_AGE
+    
+    async def refresh(self) -> None:
+        """Fetch the key set now without blocking the event loop"""
+        keys, max_age = await asyncio.to_thread(self._fetch)
+        now = time.monotonic()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + max_age
+    
+    async def get_key(self, kid: str) -> Optional[Key]:
+        key = self._keys.get(kid)
+        now = time.monotonic()
+        if key is not None and now < self._expires_at:
+            return key
+        async with self._lock:
+            # Another request may have refreshed the keys while this one waited
+            now = time.monotonic()
+            expired = now >= self._expires_at
+            unknown = kid not in self._keys and now - self._fetched_at >= MIN_REFETCH_SECONDS
+            if expired or unknown:
+                await self.refresh()
+        return self._keys.get(kid)
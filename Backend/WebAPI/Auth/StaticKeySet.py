@@ -0,0 +1,14 @@
+from typing import Any, Dict, Optional
+from jose import jwk
+from jose.backends.base import Key
+from Backend.WebAPI.Auth.IKeySource import IKeySource
+
+class StaticKeySet(IKeySource):
+    """Fixed in-memory key set, for tests and deployments that pin their keys"""
+    
+    def __init__(self, keys: Dict[str, Any], algorithm: str = 'RS256'):
+        """Build the set from kid -> JWK dict or PEM string"""
+        self._keys = {kid: jwk.construct(key, algorithm) for kid, key in keys.items()}
+    
+    async def get_key(self, kid: str) -> Optional[Key]:
+        return self._keys.get(kid)
@@ -0,0 +1,47 @@
+from typing import Any, Dict
+from jose import jwt, JWTError
+from Backend.WebAPI.Auth.IKeySource import IKeySource
+
+CLOCK_SKEW_SECONDS = 5
+
+class InvalidTokenError(Exception):
+    """Raised when an ID token cannot be trusted"""
+
+class TokenVerifier:
+    """Verifies Firebase ID tokens locally against a key source"""
+    
+    def __init__(self, project_id: str, key_source: IKeySource):
+        self._project_id = project_id
+        self._issuer = f'https://securetoken.google.com/{project_id}'
+        self._key_source = key_source
+    
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """Check the signature and standard claims and return the decoded claims"""
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError as e:
+            raise InvalidTokenError("Malformed token") from e
+        if header.get('alg') != 'RS256':
+            raise InvalidTokenError("Unexpected signing algorithm")
+        
+        key = await self._key_source.get_key(header.get('kid'))
+        if key is None:
+            raise InvalidTokenError("Unknown signing key")
+        
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=['RS256'],
+                audience=self._project_id,
+                issuer=self._issuer,
+                options={'leeway': CLOCK_SKEW_SECONDS}
+            )
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
+        
+        subject = claims.get('sub')
+        if not isinstance(subject, str) or not subject:
+            raise InvalidTokenError("Token has no subject")
+        claims['uid'] = subject
+        return claims
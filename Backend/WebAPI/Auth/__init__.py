@@ -0,0 +1,14 @@
+from Backend.WebAPI.Auth.IKeySource import IKeySource
+from Backend.WebAPI.Auth.StaticKeySet import StaticKeySet
+from Backend.WebAPI.Auth.JwksKeySet import JwksKeySet
+from Backend.WebAPI.Auth.TokenVerifier import TokenVerifier, InvalidTokenError
+from Backend.WebAPI.Auth.AuthMiddleware import AuthMiddleware
+
+__all__ = [
+    'IKeySource',
+    'StaticKeySet',
+    'JwksKeySet',
+    'TokenVerifier',
+    'InvalidTokenError',
+    'AuthMiddleware'
+]
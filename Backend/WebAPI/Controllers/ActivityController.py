@@ -1,44 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from Backend.Data.Enums.ActivityType import ActivityType
 from Backend.WebAPI.Models.ActivityModel import ActivityModel
 from Backend.WebAPI.Mappers.ActivityMapper import ActivityMapper
 from Backend.Service.Services.Activities.IActivityService import IActivityService
 from Backend.Service.Services.Activities.ActivityDTO import ActivityDTO
-from Backend.WebAPI.Controllers.BaseController import BaseController
+from Backend.WebAPI.Controllers.BaseController import BaseController, PageParams
 
 class ActivityController(BaseController[ActivityModel, ActivityDTO]):
     def __init__(self, router: APIRouter, activity_service: IActivityService):
         super().__init__(router, "activities")
-        self.activity_service = activity_service
+        self.activity_service = self.offload(activity_service)
         self._setup_additional_routes()
     
     def _setup_additional_routes(self):
         @self.router.get(f"/{self.prefix}/task/{{task_id}}", response_model=List[ActivityModel])
-        async def get_by_task(task_id: str):
-            return await self.get_by_task(task_id)
+        async def get_by_task(task_id: str, response: Response, page: PageParams = Depends()):
+            activities = await self.get_by_task(task_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, activities, page)
         
         @self.router.get(f"/{self.prefix}/user/{{user_id}}", response_model=List[ActivityModel])
-        async def get_by_user(user_id: str):
-            return await self.get_by_user(user_id)
+        async def get_by_user(user_id: str, response: Response, page: PageParams = Depends()):
+            activities = await self.get_by_user(user_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, activities, page)
+        
+        @self.router.get(f"/{self.prefix}/task/{{task_id}}/timeline", response_model=List[ActivityModel])
+        async def get_timeline(task_id: str, response: Response, start: datetime = Query(...),
+                               end: datetime = Query(...), type: Optional[ActivityType] = Query(None),
+                               page: PageParams = Depends()):
+            activities = await self.get_timeline(task_id, start, end, type, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, activities, page, order_by="created_at")
         
         @self.router.get(f"/{self.prefix}/type/{{activity_type}}", response_model=List[ActivityModel])
         async def get_by_type(activity_type: str):
             return await self.get_by_type(activity_type)
     
-    async def get_by_task(self, task_id: str) -> List[ActivityModel]:
-        activities = await self.activity_service.get_activities_by_task(task_id)
+    async def get_by_task(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityModel]:
+        activities = await self.activity_service.get_task_activities(task_id, limit=limit, cursor=cursor)
+        return ActivityMapper.to_model_list(activities)
+    
+    async def get_by_user(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityModel]:
+        activities = await self.activity_service.get_user_activities(user_id, limit=limit, cursor=cursor)
         return ActivityMapper.to_model_list(activities)
     
-    async def get_by_user(self, user_id: str) -> List[ActivityModel]:
-        activities = await self.activity_service.get_activities_by_user(user_id)
+    async def get_timeline(self, task_id: str, start: datetime, end: datetime, activity_type: Optional[ActivityType] = None,
+                           limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityModel]:
+        if start > end:
+            raise HTTPException(status_code=400, detail="start must not be after end")
+        activities = await self.activity_service.get_activities_by_date_range(
+            task_id, start, end, activity_type=activity_type, limit=limit, cursor=cursor
+        )
         return ActivityMapper.to_model_list(activities)
     
     async def get_by_type(self, activity_type: str) -> List[ActivityModel]:
         activities = await self.activity_service.get_activities_by_type(activity_type)
         return ActivityMapper.to_model_list(activities)
     
-    async def get_all(self) -> List[ActivityModel]:
-        activities = await self.activity_service.get_all_activities()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[ActivityModel]:
+        activities = await self.activity_service.get_all_activities(limit=limit, cursor=cursor)
         return ActivityMapper.to_model_list(activities)
     
     async def get_by_id(self, id: str) -> ActivityModel:
@@ -1,21 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File
+from typing import List, Optional
 from Backend.WebAPI.Models.AttachmentModel import AttachmentModel
 from Backend.WebAPI.Mappers.AttachmentMapper import AttachmentMapper
 from Backend.Service.Services.Attachments.IAttachmentService import IAttachmentService
 from Backend.Service.Services.Attachments.AttachmentDTO import AttachmentDTO
-from Backend.WebAPI.Controllers.BaseController import BaseController
+from Backend.WebAPI.Controllers.BaseController import BaseController, PageParams
 
 class AttachmentController(BaseController[AttachmentModel, AttachmentDTO]):
     def __init__(self, router: APIRouter, attachment_service: IAttachmentService):
         super().__init__(router, "attachments")
-        self.attachment_service = attachment_service
+        self.attachment_service = self.offload(attachment_service)
         self._setup_upload_route()
     
     def _setup_upload_route(self):
         @self.router.post(f"/{self.prefix}/upload", response_model=AttachmentModel)
         async def upload_file(task_id: str, user_id: str, file: UploadFile = File(...)):
             return await self.upload_file(task_id, user_id, file)
+        
+        @self.router.get(f"/{self.prefix}/task/{{task_id}}", response_model=List[AttachmentModel])
+        async def get_by_task(task_id: str, response: Response, page: PageParams = Depends()):
+            attachments = await self.get_by_task(task_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, attachments, page)
     
     async def upload_file(self, task_id: str, user_id: str, file: UploadFile) -> AttachmentModel:
         attachment = await self.attachment_service.upload_attachment(
@@ -28,8 +33,12 @@ class AttachmentController(BaseController[AttachmentModel, AttachmentDTO]):
         )
         return AttachmentMapper.to_model(attachment)
     
-    async def get_all(self) -> List[AttachmentModel]:
-        attachments = await self.attachment_service.get_all_attachments()
+    async def get_by_task(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentModel]:
+        attachments = await self.attachment_service.get_task_attachments(task_id, limit=limit, cursor=cursor)
+        return AttachmentMapper.to_model_list(attachments)
+    
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[AttachmentModel]:
+        attachments = await self.attachment_service.get_all_attachments(limit=limit, cursor=cursor)
         return AttachmentMapper.to_model_list(attachments)
     
     async def get_by_id(self, id: str) -> AttachmentModel:
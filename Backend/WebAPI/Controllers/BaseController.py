@@ -1,34 +1,67 @@
-from typing import Generic, TypeVar, List, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Any, Generic, TypeVar, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from Backend.Data.Repositories.Repository.Cursor import cursor_after
+from Backend.WebAPI.Offload.OffloadedService import OffloadedService
 
 T = TypeVar('T', bound=BaseModel)
 U = TypeVar('U', bound=BaseModel)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class PageParams:
+    """Query parameters shared by all paginated GET routes"""
+    def __init__(self,
+                 limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                 cursor: Optional[str] = Query(None)):
+        self.limit = limit
+        self.cursor = cursor
+
 class BaseController(Generic[T, U]):
     def __init__(self, router: APIRouter, prefix: str):
         self.router = router
         self.prefix = prefix
         self._setup_routes()
-    
+
     def _setup_routes(self):
         @self.router.get(f"/{self.prefix}", response_model=List[T])
-        async def get_all():
-            return await self.get_all()
-        
+        async def get_all(response: Response, page: PageParams = Depends()):
+            items = await self.get_all(limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, items, page)
+
         @self.router.get(f"/{self.prefix}/{{id}}", response_model=T)
         async def get_by_id(id: str):
             return await self.get_by_id(id)
-        
+
         @self.router.post(f"/{self.prefix}", response_model=T)
         async def create(item: U):
             return await self.create(item)
-        
+
         @self.router.put(f"/{self.prefix}/{{id}}", response_model=T)
         async def update(id: str, item: U):
             return await self.update(id, item)
-        
+
         @self.router.delete(f"/{self.prefix}/{{id}}")
         async def delete(id: str):
             return await self.delete(id)
-    
\ No newline at end of file
+
+    @staticmethod
+    def offload(service: Any) -> Any:
+        """Run the service's blocking methods on the service thread pool instead of the event loop"""
+        return OffloadedService.wrap(service)
+
+    @staticmethod
+    def accepted(job_id: str) -> JSONResponse:
+        """202 response pointing the caller at the status of a background job"""
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/api/jobs/{job_id}"})
+    
+    @staticmethod
+    def paginate(response: Response, items: List[T], page: PageParams, order_by: Optional[str] = None) -> List[T]:
+        """Expose the cursor of the next page in a response header when the page is full"""
+        if items and len(items) >= page.limit:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_after(items[-1], order_by)
+        return items
+
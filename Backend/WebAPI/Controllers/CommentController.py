@@ -1,36 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import List, Optional
 from Backend.WebAPI.Models.CommentModel import CommentModel
 from Backend.WebAPI.Mappers.CommentMapper import CommentMapper
 from Backend.Service.Services.Comments.ICommentService import ICommentService
 from Backend.Service.Services.Comments.CommentDTO import CommentDTO
-from Backend.WebAPI.Controllers.BaseController import BaseController
+from Backend.WebAPI.Controllers.BaseController import BaseController, PageParams
 
 class CommentController(BaseController[CommentModel, CommentDTO]):
     def __init__(self, router: APIRouter, comment_service: ICommentService):
         super().__init__(router, "comments")
-        self.comment_service = comment_service
+        self.comment_service = self.offload(comment_service)
         self._setup_additional_routes()
     
     def _setup_additional_routes(self):
         @self.router.get(f"/{self.prefix}/task/{{task_id}}", response_model=List[CommentModel])
-        async def get_by_task(task_id: str):
-            return await self.get_by_task(task_id)
+        async def get_by_task(task_id: str, response: Response, page: PageParams = Depends()):
+            comments = await self.get_by_task(task_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, comments, page)
         
         @self.router.get(f"/{self.prefix}/user/{{user_id}}", response_model=List[CommentModel])
-        async def get_by_user(user_id: str):
-            return await self.get_by_user(user_id)
+        async def get_by_user(user_id: str, response: Response, page: PageParams = Depends()):
+            comments = await self.get_by_user(user_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, comments, page)
         
         @self.router.get(f"/{self.prefix}/{{id}}/replies", response_model=List[CommentModel])
         async def get_replies(id: str):
             return await self.get_replies(id)
     
-    async def get_by_task(self, task_id: str) -> List[CommentModel]:
-        comments = await self.comment_service.get_comments_by_task(task_id)
+    async def get_by_task(self, task_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentModel]:
+        comments = await self.comment_service.get_task_comments(task_id, limit=limit, cursor=cursor)
         return CommentMapper.to_model_list(comments)
     
-    async def get_by_user(self, user_id: str) -> List[CommentModel]:
-        comments = await self.comment_service.get_comments_by_user(user_id)
+    async def get_by_user(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentModel]:
+        comments = await self.comment_service.get_user_comments(user_id, limit=limit, cursor=cursor)
         return CommentMapper.to_model_list(comments)
     
     async def get_replies(self, id: str) -> List[CommentModel]:
@@ -40,8 +42,8 @@ class CommentController(BaseController[CommentModel, CommentDTO]):
         replies = await self.comment_service.get_comment_replies(id)
         return CommentMapper.to_model_list(replies)
     
-    async def get_all(self) -> List[CommentModel]:
-        comments = await self.comment_service.get_all_comments()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[CommentModel]:
+        comments = await self.comment_service.get_all_comments(limit=limit, cursor=cursor)
         return CommentMapper.to_model_list(comments)
     
     async def get_by_id(self, id: str) -> CommentModel:
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException
+from Backend.Service.Jobs.JobQueue import JobQueue
+from Backend.WebAPI.Models.JobModel import JobModel
+from Backend.WebAPI.Offload.OffloadedService import OffloadedService
+
+class JobController:
+    """Status of background jobs started by other endpoints"""
+    
+    def __init__(self, router: APIRouter, job_queue: JobQueue):
+        self.router = router
+        self.prefix = "jobs"
+        self.job_queue = OffloadedService.wrap(job_queue)
+        self._setup_routes()
+    
+    def _setup_routes(self):
+        @self.router.get(f"/{self.prefix}/{{id}}", response_model=JobModel)
+        async def get_by_id(id: str):
+            return await self.get_by_id(id)
+    
+    async def get_by_id(self, id: str) -> JobModel:
+        job = await self.job_queue.get(id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JobModel(
+            id=job.id,
+            type=job.type,
+            status=job.status,
+            progress=job.progress,
+            error=job.error,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            finished_at=job.finished_at
+        )
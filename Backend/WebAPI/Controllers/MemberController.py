@@ -1,44 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import List, Optional
 from Backend.WebAPI.Models.MemberModel import MemberModel
 from Backend.WebAPI.Mappers.MemberMapper import MemberMapper
 from Backend.Service.Services.Members.IMemberService import IMemberService
 from Backend.Service.Services.Members.MemberDTO import MemberDTO
-from Backend.WebAPI.Controllers.BaseController import BaseController
+from Backend.WebAPI.Controllers.BaseController import BaseController, PageParams
 
 class MemberController(BaseController[MemberModel, MemberDTO]):
     def __init__(self, router: APIRouter, member_service: IMemberService):
         super().__init__(router, "members")
-        self.member_service = member_service
+        self.member_service = self.offload(member_service)
         self._setup_additional_routes()
     
     def _setup_additional_routes(self):
         @self.router.get(f"/{self.prefix}/project/{{project_id}}", response_model=List[MemberModel])
-        async def get_by_project(project_id: str):
-            return await self.get_by_project(project_id)
+        async def get_by_project(project_id: str, response: Response, page: PageParams = Depends()):
+            members = await self.get_by_project(project_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, members, page)
         
         @self.router.get(f"/{self.prefix}/user/{{user_id}}", response_model=List[MemberModel])
-        async def get_by_user(user_id: str):
-            return await self.get_by_user(user_id)
+        async def get_by_user(user_id: str, response: Response, page: PageParams = Depends()):
+            members = await self.get_by_user(user_id, limit=page.limit, cursor=page.cursor)
+            return self.paginate(response, members, page)
         
         @self.router.get(f"/{self.prefix}/role/{{role}}", response_model=List[MemberModel])
         async def get_by_role(role: str):
             return await self.get_by_role(role)
     
-    async def get_by_project(self, project_id: str) -> List[MemberModel]:
-        members = await self.member_service.get_members_by_project(project_id)
+    async def get_by_project(self, project_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberModel]:
+        members = await self.member_service.get_project_members(project_id, limit=limit, cursor=cursor)
         return MemberMapper.to_model_list(members)
     
-    async def get_by_user(self, user_id: str) -> List[MemberModel]:
-        members = await self.member_service.get_members_by_user(user_id)
+    async def get_by_user(self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberModel]:
+        members = await self.member_service.get_user_memberships(user_id, limit=limit, cursor=cursor)
         return MemberMapper.to_model_list(members)
     
     async def get_by_role(self, role: str) -> List[MemberModel]:
         members = await self.member_service.get_members_by_role(role)
         return MemberMapper.to_model_list(members)
     
-    async def get_all(self) -> List[MemberModel]:
-        members = await self.member_service.get_all_members()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[MemberModel]:
+        members = await self.member_service.get_all_members(limit=limit, cursor=cursor)
         return MemberMapper.to_model_list(members)
     
     async def get_by_id(self, id: str) -> MemberModel:
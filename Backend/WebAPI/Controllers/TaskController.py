@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from datetime import datetime
+from typing import Dict, List, Optional
+from Backend.Data.Enums.TaskStatus import TaskStatus
+from Backend.Data.Queries.TaskQuery import TaskQuery, UnindexedQueryError
+from Backend.Data.Search.TagExpression import TagExpressionError
 from Backend.WebAPI.Models.TaskModel import TaskModel
+from Backend.WebAPI.Models.TaskSummaryModel import TaskSummaryModel
 from Backend.WebAPI.Mappers.TaskMapper import TaskMapper
 from Backend.Service.Services.Tasks.ITaskService import ITaskService
 from Backend.Service.Services.Tasks.TaskDTO import TaskDTO
-from Backend.WebAPI.Controllers.BaseController import BaseController
+from Backend.WebAPI.Controllers.BaseController import BaseController, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 class TaskController(BaseController[TaskModel, TaskDTO]):
     def __init__(self, router: APIRouter, task_service: ITaskService):
         super().__init__(router, "tasks")
-        self.task_service = task_service
+        self.task_service = self.offload(task_service)
         self._setup_additional_routes()
     
     def _setup_additional_routes(self):
@@ -25,6 +30,71 @@ class TaskController(BaseController[TaskModel, TaskDTO]):
         async def get_by_priority(priority: str):
             return await self.get_by_priority(priority)
         
+        # Outside /tasks/ so the path cannot be taken for a task ID
+        @self.router.get(f"/search/{self.prefix}", response_model=List[TaskModel])
+        async def search(request: Request, q: str = Query(..., min_length=1), limit: int = Query(50, ge=1, le=200)):
+            return await self.search(q, request.state.uid, limit)
+        
+        @self.router.get(f"/list/{self.prefix}", response_model=List[TaskSummaryModel])
+        async def get_task_list(request: Request):
+            tasks = await self.task_service.get_task_list(request.state.uid)
+            return TaskMapper.to_summary_model_list(tasks)
+        
+        @self.router.get(f"/board/{self.prefix}", response_model=List[TaskModel])
+        async def board(request: Request,
+                        include_member_tasks: bool = Query(False),
+                        status: List[TaskStatus] = Query([]),
+                        priority: List[str] = Query([]),
+                        tag: List[str] = Query([]),
+                        any_tag: List[str] = Query([]),
+                        due_from: Optional[datetime] = Query(None),
+                        due_to: Optional[datetime] = Query(None),
+                        order_by: Optional[str] = Query(None, pattern=r"^-?(due_date|created_at|updated_at|priority|title)$"),
+                        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+            task_query = (TaskQuery()
+                          .with_status(*status)
+                          .with_priority(*priority)
+                          .tagged(*tag)
+                          .tagged_any(*any_tag)
+                          .due_between(due_from, due_to)
+                          .ordered_by(order_by)
+                          .take(limit))
+            return await self.board(request.state.uid, task_query, include_member_tasks)
+        
+        @self.router.get(f"/tags/{self.prefix}", response_model=List[TaskModel])
+        async def get_by_tag_expression(request: Request, expr: str = Query(..., min_length=1),
+                                        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+            return await self.get_by_tag_expression(expr, request.state.uid, limit)
+        
+        @self.router.get("/tags/counts", response_model=Dict[str, int])
+        async def get_tag_counts(request: Request):
+            return await self.task_service.get_tag_counts(request.state.uid)
+        
+        @self.router.get(f"/timeline/{self.prefix}", response_model=List[TaskModel])
+        async def get_timeline(request: Request,
+                               start: Optional[datetime] = Query(None),
+                               end: Optional[datetime] = Query(None),
+                               open_only: bool = Query(False),
+                               limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+            return await self.timeline(request.state.uid, start, end, open_only, limit)
+        
+        @self.router.get(f"/timeline/{self.prefix}/upcoming", response_model=List[TaskModel])
+        async def get_upcoming(request: Request, days: int = Query(7, ge=1, le=366)):
+            tasks = await self.task_service.get_tasks_due_within(days, request.state.uid)
+            return TaskMapper.to_model_list(tasks)
+        
+        @self.router.get(f"/timeline/{self.prefix}/overdue", response_model=List[TaskModel])
+        async def get_overdue(request: Request):
+            tasks = await self.task_service.get_overdue_tasks(request.state.uid)
+            return TaskMapper.to_model_list(tasks)
+        
+        @self.router.get("/timeline/months", response_model=Dict[str, int])
+        async def get_due_months(request: Request,
+                                 start: Optional[datetime] = Query(None),
+                                 end: Optional[datetime] = Query(None),
+                                 open_only: bool = Query(False)):
+            return await self.task_service.get_due_months(request.state.uid, start, end, open_only)
+        
         @self.router.get(f"/{self.prefix}/{{id}}/members", response_model=List[str])
         async def get_task_members(id: str):
             return await self.get_task_members(id)
@@ -41,21 +111,44 @@ class TaskController(BaseController[TaskModel, TaskDTO]):
         tasks = await self.task_service.get_tasks_by_priority(priority)
         return TaskMapper.to_model_list(tasks)
     
+    async def search(self, query: str, user_id: str, limit: int = 50) -> List[TaskModel]:
+        tasks = await self.task_service.search_tasks(query, user_id, limit)
+        return TaskMapper.to_model_list(tasks)
+    
+    async def board(self, user_id: str, task_query: TaskQuery, include_member_tasks: bool = False) -> List[TaskModel]:
+        try:
+            tasks = await self.task_service.find_tasks(user_id, task_query, include_member_tasks)
+        except UnindexedQueryError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return TaskMapper.to_model_list(tasks)
+    
+    async def get_by_tag_expression(self, expression: str, user_id: str, limit: int) -> List[TaskModel]:
+        try:
+            tasks = await self.task_service.get_tasks_by_tag_expression(expression, user_id, limit)
+        except TagExpressionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return TaskMapper.to_model_list(tasks)
+    
+    async def timeline(self, user_id: str, start: Optional[datetime], end: Optional[datetime],
+                       open_only: bool, limit: int) -> List[TaskModel]:
+        tasks = await self.task_service.get_due_timeline(user_id, start, end, open_only, limit)
+        return TaskMapper.to_model_list(tasks)
+    
     async def get_task_members(self, id: str) -> List[str]:
         task = await self.task_service.get_task_by_id(id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         return [member.id for member in task.members]
     
-    async def get_all(self) -> List[TaskModel]:
-        tasks = await self.task_service.get_all_tasks()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[TaskModel]:
+        tasks = await self.task_service.get_all_tasks(limit=limit, cursor=cursor)
         return TaskMapper.to_model_list(tasks)
     
     async def get_by_id(self, id: str) -> TaskModel:
-        task = await self.task_service.get_task_by_id(id)
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        return TaskMapper.to_model(task)
+        result = await self.task_service.get_task(id)
+        if not result.success:
+            raise HTTPException(status_code=result.error_code or 500, detail=result.message)
+        return TaskMapper.to_model(result.task)
     
     async def create(self, task: TaskDTO) -> TaskModel:
         created_task = await self.task_service.create_task(task)
@@ -68,7 +161,9 @@ class TaskController(BaseController[TaskModel, TaskDTO]):
         return TaskMapper.to_model(updated_task)
     
     async def delete(self, id: str):
-        success = await self.task_service.delete_task(id)
-        if not success:
-            raise HTTPException(status_code=404, detail="Task not found")
+        result = await self.task_service.delete_task(id)
+        if not result.success:
+            raise HTTPException(status_code=result.error_code or 500, detail=result.message)
+        if result.job_id:
+            return self.accepted(result.job_id)
         return {"message": "Task deleted successfully"} 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from typing import List, Optional
 from Backend.WebAPI.Models.UserModel import UserModel
 from Backend.WebAPI.Mappers.UserMapper import UserMapper
 from Backend.Service.Services.Users.IUserService import IUserService
@@ -9,7 +9,7 @@ from Backend.WebAPI.Controllers.BaseController import BaseController
 class UserController(BaseController[UserModel, UserDTO]):
     def __init__(self, router: APIRouter, user_service: IUserService):
         super().__init__(router, "users")
-        self.user_service = user_service
+        self.user_service = self.offload(user_service)
         self._setup_additional_routes()
     
     def _setup_additional_routes(self):
@@ -43,8 +43,8 @@ class UserController(BaseController[UserModel, UserDTO]):
             raise HTTPException(status_code=404, detail="User not found")
         return [task.id for task in user.owned_tasks] + [task.id for task in user.member_tasks]
     
-    async def get_all(self) -> List[UserModel]:
-        users = await self.user_service.get_all_users()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[UserModel]:
+        users = await self.user_service.get_all_users(limit=limit, cursor=cursor)
         return UserMapper.to_model_list(users)
     
     async def get_by_id(self, id: str) -> UserModel:
@@ -64,7 +64,9 @@ class UserController(BaseController[UserModel, UserDTO]):
         return UserMapper.to_model(updated_user)
     
     async def delete(self, id: str):
-        success = await self.user_service.delete_user(id)
-        if not success:
-            raise HTTPException(status_code=404, detail="User not found")
+        result = await self.user_service.delete_user(id)
+        if not result.success:
+            raise HTTPException(status_code=result.error_code or 500, detail=result.message)
+        if result.job_id:
+            return self.accepted(result.job_id)
         return {"message": "User deleted successfully"} 
\ No newline at end of file
@@ -0,0 +1,136 @@
+from typing import AsyncIterator
+from Backend.Data.Database.FirestoreClient import FirestoreClient
+from Backend.Data.Database.AsyncFirestoreClient import AsyncFirestoreClient
+from Backend.Data.Repositories.UserRepository import UserRepository
+from Backend.Data.Repositories.TaskRepository import TaskRepository
+from Backend.Data.Repositories.MemberRepository import MemberRepository
+from Backend.Data.Repositories.CommentRepository import CommentRepository
+from Backend.Data.Repositories.AttachmentRepository import AttachmentRepository
+from Backend.Data.Repositories.ActivityRepository import ActivityRepository
+from Backend.Data.Repositories.JobRepository import JobRepository
+from Backend.Data.Sinks.ActivitySink import ActivitySink
+from Backend.Data.Search.TaskSearchIndexer import TaskSearchIndexer
+from Backend.Data.Search.TaskTagIndexer import TaskTagIndexer
+from Backend.Data.Search.TaskDueIndexer import TaskDueIndexer
+from Backend.Data.Search.TaskAccessIndexer import TaskAccessIndexer
+from Backend.Data.Views.UserTaskIndexer import UserTaskIndexer
+from Backend.Data.Repositories.Async import (
+    AsyncUserRepository, AsyncTaskRepository, AsyncMemberRepository,
+    AsyncCommentRepository, AsyncAttachmentRepository, AsyncActivityRepository
+)
+from Backend.Data.UnitOfWork.UnitOfWork import UnitOfWork
+from Backend.Data.UnitOfWork.AsyncUnitOfWork import AsyncUnitOfWork
+from Backend.Data.UnitOfWork.ScopedUnitOfWork import ScopedUnitOfWork
+from Backend.Service.Jobs import JobQueue, CascadeJobs
+from Backend.Service.Services.Users.UserService import UserService
+from Backend.Service.Services.Tasks.AsyncTaskService import AsyncTaskService
+from Backend.Service.Services.Comments.CommentService import CommentService
+from Backend.Service.Services.Activities.ActivityService import ActivityService
+from Backend.Service.Services.Attachments.AttachmentService import AttachmentService
+from Backend.Service.Services.Members.MemberService import MemberService
+from Backend.WebAPI.Dependencies.RequestScope import RequestScope, current_scope
+
+class Container:
+    """Composition root of the API with explicit lifetimes"""
+    
+    def __init__(self):
+        # Singletons: the clients and repositories hold no request state
+        self.client = FirestoreClient()
+        self.async_client = AsyncFirestoreClient()
+        # Activity logs are written behind the request, in batches
+        self.activity_sink = ActivitySink()
+        self.repositories = {
+            'users': UserRepository(),
+            'tasks': TaskRepository(),
+            'members': MemberRepository(),
+            'comments': CommentRepository(),
+            'attachments': AttachmentRepository(),
+            'activities': ActivityRepository(self.activity_sink)
+        }
+        self.async_repositories = {
+            'users': AsyncUserRepository(),
+            'tasks': AsyncTaskRepository(),
+            'members': AsyncMemberRepository(),
+            'comments': AsyncCommentRepository(),
+            'attachments': AsyncAttachmentRepository(),
+            'activities': AsyncActivityRepository(self.activity_sink)
+        }
+        
+        # Search index fed by task and comment writes made through either repository set
+        self.search_index = TaskSearchIndexer()
+        for repositories in (self.repositories, self.async_repositories):
+            repositories['tasks'].observe(self.search_index)
+            repositories['comments'].observe(self.search_index)
+        
+        # Tag bitmaps answer boolean tag queries and tag counts without reading the tasks
+        self.tag_index = TaskTagIndexer()
+        for repositories in (self.repositories, self.async_repositories):
+            repositories['tasks'].observe(self.tag_index)
+        
+        # Due dates sorted per user serve date ranges, overdue tasks and the timeline; memberships decide who sees a task
+        self.due_index = TaskDueIndexer()
+        for repositories in (self.repositories, self.async_repositories):
+            for name in ('tasks', 'members'):
+                repositories[name].observe(self.due_index)
+        
+        # Owners and members of every task scope search hits and tag queries to the tasks a user can see
+        self.access_index = TaskAccessIndexer()
+        for repositories in (self.repositories, self.async_repositories):
+            for name in ('tasks', 'members'):
+                repositories[name].observe(self.access_index)
+        
+        # Each user's task list is materialized in one document, kept current from task, membership and user writes
+        self.task_list = UserTaskIndexer()
+        for repositories in (self.repositories, self.async_repositories):
+            for name in ('tasks', 'members', 'users'):
+                repositories[name].observe(self.task_list)
+        
+        # Background jobs run outside any request, on the unbound repositories
+        self.job_queue = JobQueue(JobRepository())
+        CascadeJobs(
+            self.repositories['users'], self.repositories['tasks'], self.repositories['members'],
+            self.repositories['comments'], self.repositories['activities']
+        ).register(self.job_queue)
+        
+        # Services are singletons too; their unit of work resolves to the current request's
+        scoped_uow = ScopedUnitOfWork(self.current_unit_of_work)
+        scoped_async_uow = ScopedUnitOfWork(self.current_async_unit_of_work)
+        self.user_service = UserService(scoped_uow, self.job_queue)
+        self.task_service = AsyncTaskService(scoped_async_uow, self.job_queue, self.search_index, self.tag_index,
+                                             self.due_index, self.task_list, self.access_index)
+        self.comment_service = CommentService(scoped_uow)
+        self.activity_service = ActivityService(scoped_uow)
+        self.attachment_service = AttachmentService(scoped_uow)
+        self.member_service = MemberService(scoped_uow)
+    
+    def create_scope(self) -> RequestScope:
+        """Build fresh units of work over the shared repositories"""
+        return RequestScope(
+            UnitOfWork(**self.repositories),
+            AsyncUnitOfWork(**self.async_repositories)
+        )
+    
+    async def request_scope(self) -> AsyncIterator[RequestScope]:
+        """FastAPI dependency opening the scope of one request"""
+        scope = self.create_scope()
+        current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            await scope.close()
+    
+    @staticmethod
+    def _scope() -> RequestScope:
+        """Get the active request scope"""
+        scope = current_scope.get()
+        if scope is None:
+            raise RuntimeError("No request scope is active")
+        return scope
+    
+    def current_unit_of_work(self) -> UnitOfWork:
+        """Get the unit of work of the active request"""
+        return self._scope().unit_of_work
+    
+    def current_async_unit_of_work(self) -> AsyncUnitOfWork:
+        """Get the asyncio unit of work of the active request"""
+        return self._scope().async_unit_of_work
@@ -0,0 +1,23 @@
+from contextvars import ContextVar
+from typing import Optional
+from Backend.Data.UnitOfWork.UnitOfWork import UnitOfWork
+from Backend.Data.UnitOfWork.AsyncUnitOfWork import AsyncUnitOfWork
+
+class RequestScope:
+    """Objects that live for a single request: one unit of work (and identity map) per data layer"""
+    
+    def __init__(self, unit_of_work: UnitOfWork, async_unit_of_work: AsyncUnitOfWork):
+        self.unit_of_work = unit_of_work
+        self.async_unit_of_work = async_unit_of_work
+    
+    async def close(self) -> None:
+        """Discard writes left uncommitted and forget the entities loaded by the request"""
+        try:
+            self.unit_of_work.end_transaction()
+            await self.async_unit_of_work.end_transaction()
+        finally:
+            self.unit_of_work.clear_identity_map()
+            self.async_unit_of_work.clear_identity_map()
+
+# Each request runs in its own copy of the context, so scopes never leak between requests
+current_scope: ContextVar[Optional[RequestScope]] = ContextVar("moontrip_request_scope", default=None)
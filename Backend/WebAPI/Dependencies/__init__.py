@@ -0,0 +1,8 @@
+from Backend.WebAPI.Dependencies.RequestScope import RequestScope, current_scope
+from Backend.WebAPI.Dependencies.Container import Container
+
+__all__ = [
+    'RequestScope',
+    'current_scope',
+    'Container'
+]
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from Backend.WebAPI.Models.TaskModel import TaskModel
-from Backend.Service.Services.Tasks.TaskDTO import TaskDTO
+from Backend.WebAPI.Models.TaskSummaryModel import TaskSummaryModel
+from Backend.Service.Services.Tasks.TaskDTO import TaskDTO, TaskSummaryDTO
 
 class TaskMapper:
     @staticmethod
@@ -55,4 +56,22 @@ class TaskMapper:
     
     @staticmethod
     def to_dto_list(models: List[TaskModel]) -> List[TaskDTO]:
-        return [TaskMapper.to_dto(model) for model in models if model is not None] 
\ No newline at end of file
+        return [TaskMapper.to_dto(model) for model in models if model is not None] 
+    
+    @staticmethod
+    def to_summary_model_list(dtos: List[TaskSummaryDTO]) -> List[TaskSummaryModel]:
+        return [
+            TaskSummaryModel(
+                id=dto.id,
+                title=dto.title,
+                description=dto.description,
+                status=dto.status,
+                owner_id=dto.owner_id,
+                role=dto.role,
+                membership_status=dto.membership_status,
+                priority=dto.priority,
+                due_date=dto.due_date,
+                tags=dto.tags
+            )
+            for dto in dtos
+        ]
\ No newline at end of file
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Dict, Any, Optional
+from pydantic import BaseModel
+
+class JobModel(BaseModel):
+    id: str
+    type: str
+    status: str
+    progress: Dict[str, Any] = {}
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Any, List, Optional
+from pydantic import BaseModel
+
+class TaskSummaryModel(BaseModel):
+    id: str
+    title: str
+    description: str
+    status: Optional[str] = None
+    owner_id: Optional[str] = None
+    role: str
+    membership_status: Optional[str] = None
+    priority: Optional[Any] = None
+    due_date: Optional[datetime] = None
+    tags: List[str] = []
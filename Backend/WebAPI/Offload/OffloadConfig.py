@@ -0,0 +1,17 @@
+import os
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class OffloadConfig:
+    """Limits of the thread pool that runs synchronous service calls"""
+    max_workers: int
+    max_queue: int
+
+DEFAULT_OFFLOAD_CONFIG = OffloadConfig(max_workers=16, max_queue=64)
+
+def get_offload_config() -> OffloadConfig:
+    """Get the pool limits, honouring MOONTRIP_OFFLOAD_WORKERS and MOONTRIP_OFFLOAD_QUEUE overrides"""
+    return OffloadConfig(
+        max_workers=int(os.environ.get("MOONTRIP_OFFLOAD_WORKERS", DEFAULT_OFFLOAD_CONFIG.max_workers)),
+        max_queue=int(os.environ.get("MOONTRIP_OFFLOAD_QUEUE", DEFAULT_OFFLOAD_CONFIG.max_queue))
+    )
@@ -0,0 +1,35 @@
+import functools
+import inspect
+from typing import Any, Optional
+from Backend.WebAPI.Offload.ServiceExecutor import ServiceExecutor
+
+class OffloadedService:
+    """Proxy that turns the blocking methods of a service into awaitables run on the service pool"""
+    
+    def __init__(self, service: Any, executor: Optional[ServiceExecutor] = None):
+        self._service = service
+        self._executor = executor or ServiceExecutor.default()
+    
+    @property
+    def wrapped(self) -> Any:
+        """The proxied service"""
+        return self._service
+    
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._service, name)
+        # Native coroutines already yield to the event loop
+        if not callable(attribute) or inspect.iscoroutinefunction(attribute):
+            return attribute
+        
+        @functools.wraps(attribute)
+        async def offloaded(*args, **kwargs):
+            return await self._executor.run(attribute, *args, **kwargs)
+        
+        return offloaded
+    
+    @classmethod
+    def wrap(cls, service: Any, executor: Optional[ServiceExecutor] = None) -> Any:
+        """Wrap a service once; already wrapped services are returned unchanged"""
+        if isinstance(service, cls):
+            return service
+        return cls(service, executor)
@@ -0,0 +1,93 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from Backend.WebAPI.Offload.OffloadConfig import OffloadConfig, get_offload_config
+
+class ExecutorSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+class ServiceExecutor:
+    """Bounded thread pool that runs blocking service calls off the event loop"""
+    
+    _instance: Optional['ServiceExecutor'] = None
+    
+    def __init__(self, config: Optional[OffloadConfig] = None):
+        self._config = config or get_offload_config()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            thread_name_prefix="service"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._active = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+    
+    @classmethod
+    def default(cls) -> 'ServiceExecutor':
+        """Get the process-wide executor shared by all controllers"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def _admit(self) -> None:
+        """Reserve a worker or queue slot, rejecting the call when none is left"""
+        with self._lock:
+            if self._in_flight >= self._config.max_workers + self._config.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"Service pool saturated ({self._config.max_workers} workers, {self._config.max_queue} queued)"
+                )
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+    
+    def _run(self, func: Callable[..., Any]) -> Any:
+        """Run on a worker thread, tracking how many workers are busy"""
+        with self._lock:
+            self._active += 1
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self._active -= 1
+    
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result"""
+        self._admit()
+        # Copy the request context so context variables are visible in the worker
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._pool, self._run, call)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        with self._lock:
+            self._completed += 1
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """Pool limits and saturation counters"""
+        with self._lock:
+            return {
+                "max_workers": self._config.max_workers,
+                "max_queue": self._config.max_queue,
+                "active": self._active,
+                "queued": self._in_flight - self._active,
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected
+            }
+    
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running calls to finish"""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,12 @@
+from Backend.WebAPI.Offload.OffloadConfig import OffloadConfig, DEFAULT_OFFLOAD_CONFIG, get_offload_config
+from Backend.WebAPI.Offload.ServiceExecutor import ServiceExecutor, ExecutorSaturated
+from Backend.WebAPI.Offload.OffloadedService import OffloadedService
+
+__all__ = [
+    'OffloadConfig',
+    'DEFAULT_OFFLOAD_CONFIG',
+    'get_offload_config',
+    'ServiceExecutor',
+    'ExecutorSaturated',
+    'OffloadedService'
+]
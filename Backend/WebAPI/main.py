@@ -1,4 +1,5 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from Backend.WebAPI.Controllers.UserController import UserController
 from Backend.WebAPI.Controllers.TaskController import TaskController
@@ -6,19 +7,13 @@ from Backend.WebAPI.Controllers.CommentController import CommentController
 from Backend.WebAPI.Controllers.ActivityController import ActivityController
 from Backend.WebAPI.Controllers.AttachmentController import AttachmentController
 from Backend.WebAPI.Controllers.MemberController import MemberController
-from Backend.Service.Services.Users.UserService import UserService
-from Backend.Service.Services.Tasks.TaskService import TaskService
-from Backend.Service.Services.Comments.CommentService import CommentService
-from Backend.Service.Services.Activities.ActivityService import ActivityService
-from Backend.Service.Services.Attachments.AttachmentService import AttachmentService
-from Backend.Service.Services.Members.MemberService import MemberService
-from Backend.Data.Repositories.UserRepository import UserRepository
-from Backend.Data.Repositories.TaskRepository import TaskRepository
-from Backend.Data.Repositories.CommentRepository import CommentRepository
-from Backend.Data.Repositories.ActivityRepository import ActivityRepository
-from Backend.Data.Repositories.AttachmentRepository import AttachmentRepository
-from Backend.Data.Repositories.MemberRepository import MemberRepository
-from Backend.Data.UnitOfWork import UnitOfWork
+from Backend.WebAPI.Controllers.JobController import JobController
+from Backend.WebAPI.Dependencies import Container
+from Backend.WebAPI.Auth import AuthMiddleware, JwksKeySet, TokenVerifier
+from Backend.Data.Cache import EntityCache
+from Backend.WebAPI.Offload import ServiceExecutor, ExecutorSaturated
+import firebase_admin
+import os
 import webbrowser
 import threading
 import time
@@ -31,7 +26,17 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# Configure CORS
+# Singletons (clients, repositories, services); units of work are created per request
+container = Container()
+
+# Verify Firebase ID tokens locally; keys are refetched only when their max-age runs out
+jwks_key_set = JwksKeySet()
+app.add_middleware(
+    AuthMiddleware,
+    verifier=TokenVerifier(os.environ.get("FIREBASE_PROJECT_ID") or firebase_admin.get_app().project_id, jwks_key_set)
+)
+
+# Configure CORS (added last so it also wraps authentication errors)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, replace with specific origins
@@ -40,35 +45,78 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create repositories
-user_repository = UserRepository()
-task_repository = TaskRepository()
-comment_repository = CommentRepository()
-activity_repository = ActivityRepository()
-attachment_repository = AttachmentRepository()
-member_repository = MemberRepository()
+@app.on_event("startup")
+async def prefetch_signing_keys():
+    """Fetch the token signing keys before the first request needs them"""
+    try:
+        await jwks_key_set.refresh()
+    except Exception as e:
+        print(f"Error prefetching signing keys: {str(e)}")
+
+@app.on_event("startup")
+def start_search_index():
+    """Load the task search index in the background; search scans tasks until it is ready"""
+    container.search_index.start()
+
+@app.on_event("startup")
+def start_tag_index():
+    """Load the tag bitmaps in the background; tag queries scan tasks until they are ready"""
+    container.tag_index.start()
+
+@app.on_event("startup")
+def start_due_index():
+    """Load the due date index in the background; due date queries go to Firestore until it is ready"""
+    container.due_index.start()
+
+@app.on_event("startup")
+def start_access_index():
+    """Load who can see each task in the background; search and tag queries read task IDs from Firestore until it is ready"""
+    container.access_index.start()
 
-# Create unit of work
-unit_of_work = UnitOfWork()
+@app.on_event("startup")
+def start_job_queue():
+    """Resume background jobs left unfinished by a previous process"""
+    try:
+        container.job_queue.start()
+    except Exception as e:
+        print(f"Error resuming background jobs: {str(e)}")
 
-# Create services
-user_service = UserService(unit_of_work)
-task_service = TaskService(unit_of_work)
-comment_service = CommentService(unit_of_work)
-activity_service = ActivityService(unit_of_work)
-attachment_service = AttachmentService(unit_of_work)
-member_service = MemberService(unit_of_work)
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated(request: Request, exc: ExecutorSaturated):
+    """Shed load instead of queueing without bound when the service pool is full"""
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
 
-# Create API router
-api_router = APIRouter()
+@app.on_event("shutdown")
+def shutdown_service_executor():
+    """Let running service calls finish before the process exits"""
+    ServiceExecutor.default().shutdown()
+
+@app.on_event("shutdown")
+def shutdown_job_queue():
+    """Stop the job workers; interrupted jobs resume from their checkpoint on the next start"""
+    container.job_queue.shutdown()
+
+@app.on_event("shutdown")
+def flush_activity_sink():
+    """Write the activity records still buffered in memory"""
+    container.activity_sink.close()
+
+@app.on_event("shutdown")
+def flush_task_list():
+    """Write the task list updates still queued"""
+    container.task_list.close()
+
+# Create API router; every route runs inside its own request scope
+api_router = APIRouter(dependencies=[Depends(container.request_scope)])
 
 # Create and register controllers
-user_controller = UserController(api_router, user_service)
-task_controller = TaskController(api_router, task_service)
-comment_controller = CommentController(api_router, comment_service)
-activity_controller = ActivityController(api_router, activity_service)
-attachment_controller = AttachmentController(api_router, attachment_service)
-member_controller = MemberController(api_router, member_service)
+user_controller = UserController(api_router, container.user_service)
+task_controller = TaskController(api_router, container.task_service)
+comment_controller = CommentController(api_router, container.comment_service)
+activity_controller = ActivityController(api_router, container.activity_service)
+attachment_controller = AttachmentController(api_router, container.attachment_service)
+member_controller = MemberController(api_router, container.member_service)
+job_controller = JobController(api_router, container.job_queue)
 
 # Include the API router
 app.include_router(api_router, prefix="/api")
@@ -81,6 +129,21 @@ async def root():
         "version": "1.0.0"
     }
 
+@app.get("/metrics/cache")
+async def cache_metrics():
+    """Hit and miss counters of the entity caches"""
+    return EntityCache.all_stats()
+
+@app.get("/metrics/activities")
+async def activity_metrics():
+    """Queue depth and batch counters of the activity write-behind sink"""
+    return container.activity_sink.stats()
+
+@app.get("/metrics/executor")
+async def executor_metrics():
+    """Saturation of the thread pool running synchronous service calls"""
+    return ServiceExecutor.default().stats()
+
 def open_browser():
     """Open the browser after a short delay"""
     time.sleep(1.5)  # Wait for the server to start
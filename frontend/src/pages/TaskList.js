@@ -9,8 +9,12 @@ const API_URL = "http://localhost:8080";
 
 function TaskList() {
   const navigate = useNavigate();
+  // The user's own and joined tasks, read from their task index document
   const [tasks, setTasks] = useState([]);
-  const [myMemberships, setMyMemberships] = useState([]);
+  // Every task, paged in only when the user browses for tasks to join
+  const [browseTasks, setBrowseTasks] = useState([]);
+  const [isBrowsing, setIsBrowsing] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
   const [newTask, setNewTask] = useState({ title: '', description: '' });
   const [loading, setLoading] = useState(true);
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -40,17 +44,11 @@ function TaskList() {
   const fetchTasks = async () => {
     try {
       const token = localStorage.getItem('authToken');
-      const [tasksResponse, membershipsResponse] = await Promise.all([
-        axios.get(`${API_URL}/api/tasks`, {
-          headers: { Authorization: `Bearer ${token}` }
-        }),
-        axios.get(`${API_URL}/api/member_of`, {
-          headers: { Authorization: `Bearer ${token}` }
-        })
-      ]);
+      const response = await axios.get(`${API_URL}/api/task_index`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
 
-      setTasks(tasksResponse.data.tasks);
-      setMyMemberships(membershipsResponse.data.my_tasks);
+      setTasks(response.data.tasks);
       setLoading(false);
     } catch (error) {
       console.error("Error fetching data:", error);
@@ -58,6 +56,27 @@ function TaskList() {
     }
   };
 
+  const loadBrowseTasks = async (cursor) => {
+    try {
+      const token = localStorage.getItem('authToken');
+      const response = await axios.get(`${API_URL}/api/tasks`, {
+        params: { scope: 'all', cursor },
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      setBrowseTasks(prev => cursor ? [...prev, ...response.data.tasks] : response.data.tasks);
+      setNextCursor(response.data.nextCursor);
+    } catch (error) {
+      console.error("Error loading more tasks:", error);
+    }
+  };
+
+  const toggleBrowse = () => {
+    if (!isBrowsing) {
+      loadBrowseTasks(null);
+    }
+    setIsBrowsing(!isBrowsing);
+  };
+
   const handleLogout = async () => {
     try {
       await signOut(auth);
@@ -107,6 +126,7 @@ function TaskList() {
 
     // Optimistic UI update
     setTasks(prev => prev.filter(task => task.id !== taskId));
+    setBrowseTasks(prev => prev.filter(task => task.id !== taskId));
 
     try {
       const response = await axios.delete(
@@ -156,10 +176,11 @@ function TaskList() {
         </button>
       );
     } else {
-      const membership = myMemberships.find(m => m.taskId === task.id);
+      // Browsed tasks carry no membership; look it up in the user's own list
+      const membership = task.membershipStatus ? task : tasks.find(t => t.id === task.id);
 
       if (membership) {
-        switch (membership.status) {
+        switch (membership.membershipStatus) {
           case 'pending':
             buttons.push(
               <button key="pending" disabled>
@@ -217,14 +238,17 @@ function TaskList() {
       <div className={style.header}>
         <button onClick={handleLogout}>Logout</button>
         <h2>Organize your tasks to reach the Moon</h2>
-        <button onClick={() => setIsModalOpen(true)}>Create Task</button>
+        <div>
+          <button onClick={toggleBrowse}>{isBrowsing ? 'My Tasks' : 'Browse Tasks'}</button>
+          <button onClick={() => setIsModalOpen(true)}>Create Task</button>
+        </div>
       </div>
 
       <div className={style.content}>
-        {tasks.length === 0 ? (
+        {(isBrowsing ? browseTasks : tasks).length === 0 ? (
           <div className={style.emptyState}>No tasks available. Create one to get started!</div>
         ) : (
-          tasks.map(task => (
+          (isBrowsing ? browseTasks : tasks).map(task => (
             <div key={task.id} className={style.task}>
               <div className={style.taskInfo}>
                 <h3>{task.title}</h3>
@@ -234,6 +258,9 @@ function TaskList() {
             </div>
           ))
         )}
+        {isBrowsing && nextCursor && (
+          <button onClick={() => loadBrowseTasks(nextCursor)}>Load more</button>
+        )}
       </div>
 
       {isModalOpen && (
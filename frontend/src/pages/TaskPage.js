@@ -57,7 +57,9 @@ function TaskPage() {
                 return;
             }
 
+            // Pending users are only returned to the owner, in the same round trip
             const response = await axios.get(`${API_URL}/api/tasks/${taskId}`, {
+                params: { include: 'pendingUsers' },
                 headers: { Authorization: `Bearer ${token}` }
             });
 
@@ -76,11 +78,9 @@ function TaskPage() {
                 loading: false
             });
 
-            // If current user is the owner, fetch pending users
-            const user = auth.currentUser;
-            setCurrentUser(user);
-            if (user && taskData.ownerId === user.uid) {
-                fetchPendingUsers();
+            setCurrentUser(auth.currentUser);
+            if (response.data.pendingUsers) {
+                setPendingUsers(response.data.pendingUsers);
             }
 
         } catch (error) {
@@ -88,7 +88,7 @@ function TaskPage() {
             setState(prev => ({ ...prev, error: errorMessage, loading: false }));
             console.error("Error fetching task details:", error);
         }
-    }, [taskId, fetchPendingUsers]);
+    }, [taskId]);
 
     useEffect(() => {
         fetchTaskDetails();
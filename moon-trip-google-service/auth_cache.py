@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from firebase_admin import auth
+from flask import g, jsonify, request
+from google.auth import jwt
+from google.auth.transport import requests as google_requests
+
+# Certificates used by Firebase Auth to sign ID tokens
+PUBLIC_KEYS_URL = 'https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com'
+CLOCK_SKEW_SECONDS = 5
+TOKEN_CACHE_SIZE = int(os.environ.get('AUTH_TOKEN_CACHE_SIZE', 10000))
+REVOCATION_CHECK_SECONDS = float(os.environ.get('AUTH_REVOCATION_CHECK_SECONDS', 300))
+# Refresh the keys a bit before Google says they expire; retry sooner after a failed fetch
+MIN_REFRESH_SECONDS = 60
+RETRY_SECONDS = 30
+# Unknown key IDs trigger a refetch at most this often, so bogus tokens cannot hammer Google
+MIN_REFETCH_SECONDS = 30
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+class TokenVerificationError(Exception):
+    """Raised when an ID token is malformed, expired, revoked or not signed by Firebase"""
+
+
+class PublicKeyStore:
+    """Firebase signing certificates, prefetched and refreshed by a background thread"""
+
+    def __init__(self, url=PUBLIC_KEYS_URL):
+        self._url = url
+        self._certs = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        # Serializes on-demand refetches so concurrent requests with the same unknown kid fetch once
+        self._refetch_lock = threading.Lock()
+        self._refresher = None
+
+    def certs(self):
+        with self._lock:
+            return self._certs
+
+    def refresh(self):
+        """Fetch the certificates now and return how long they may be cached"""
+        response = google_requests.Request()(self._url, method='GET')
+        if response.status != 200:
+            raise TokenVerificationError(f'Could not fetch public keys: HTTP {response.status}')
+        certs = json.loads(response.data.decode('utf-8'))
+        with self._lock:
+            self._certs = certs
+            self._fetched_at = time.monotonic()
+        match = _MAX_AGE.search(response.headers.get('cache-control', ''))
+        return int(match.group(1)) if match else MIN_REFRESH_SECONDS
+
+    def certs_for(self, kid):
+        """Current certificates, refetched first if kid is unknown and the last fetch is old enough"""
+        with self._refetch_lock:
+            with self._lock:
+                known = kid in self._certs
+                fetched_at = self._fetched_at
+            if not known and time.monotonic() - fetched_at >= MIN_REFETCH_SECONDS:
+                self.refresh()
+        return self.certs()
+
+    def start(self):
+        """Prefetch the keys and keep them fresh for the lifetime of the process"""
+        if self._refresher is not None:
+            return
+        self._refresher = threading.Thread(target=self._refresh_loop, name='firebase-keys', daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                max_age = self.refresh()
+                delay = max(MIN_REFRESH_SECONDS, max_age * 0.9)
+            except Exception as e:
+                print(f"Public key refresh failed: {str(e)}")
+                delay = RETRY_SECONDS
+            time.sleep(delay)
+
+
+class VerifiedTokenCache:
+    """LRU of verified token claims keyed by token hash, each entry valid until the token's exp"""
+
+    def __init__(self, max_size=TOKEN_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(id_token):
+        return hashlib.sha256(id_token.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                return None
+            if claims['exp'] + CLOCK_SKEW_SECONDS < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key, claims):
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+class TokenVerifier:
+    """Verifies Firebase ID tokens locally, checking revocation per user on an interval"""
+
+    def __init__(self, project_id, key_store=None, cache=None, revocation_interval=REVOCATION_CHECK_SECONDS):
+        self._project_id = project_id
+        self._issuer = f'https://securetoken.google.com/{project_id}'
+        self._keys = key_store or PublicKeyStore()
+        self._cache = cache or VerifiedTokenCache()
+        self._revocation_interval = revocation_interval
+        # uid -> (checked_at, tokens_valid_after in seconds, disabled)
+        self._revocations = {}
+        self._revocations_lock = threading.Lock()
+
+    def start(self):
+        self._keys.start()
+
+    def verify(self, id_token, check_revoked=False):
+        """Return the decoded claims of a valid token, using the cache on repeat calls"""
+        key = self._cache.key(id_token)
+        claims = self._cache.get(key)
+        if claims is None:
+            claims = self._decode(id_token)
+            self._cache.put(key, claims)
+        if check_revoked:
+            self._check_revoked(claims)
+        return claims
+
+    def _decode(self, id_token):
+        certs = self._keys.certs()
+        if not certs:
+            # Keys not fetched yet; let the Admin SDK do a full verification
+            return dict(auth.verify_id_token(id_token, clock_skew_seconds=CLOCK_SKEW_SECONDS))
+        try:
+            kid = jwt.decode_header(id_token).get('kid')
+            if kid not in certs:
+                # Keys may have been rotated since the last refresh
+                certs = self._keys.certs_for(kid)
+                if kid not in certs:
+                    raise TokenVerificationError('Token was signed by an unknown key')
+            claims = jwt.decode(id_token, certs=certs, audience=self._project_id,
+                                clock_skew_in_seconds=CLOCK_SKEW_SECONDS)
+        except ValueError as e:
+            raise TokenVerificationError(str(e)) from e
+        if claims.get('iss') != self._issuer:
+            raise TokenVerificationError('Token has an invalid issuer')
+        subject = claims.get('sub')
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise TokenVerificationError('Token has an invalid subject')
+        claims['uid'] = subject
+        return claims
+
+    def _check_revoked(self, claims):
+        uid = claims['uid']
+        now = time.time()
+        with self._revocations_lock:
+            state = self._revocations.get(uid)
+        if state is None or now - state[0] > self._revocation_interval:
+            user = auth.get_user(uid)
+            valid_after = (user.tokens_valid_after_timestamp or 0) / 1000
+            state = (now, valid_after, user.disabled)
+            with self._revocations_lock:
+                self._revocations[uid] = state
+        _, valid_after, disabled = state
+        if disabled:
+            raise TokenVerificationError('User account is disabled')
+        if claims['iat'] < valid_after:
+            raise TokenVerificationError('Token has been revoked')
+
+
+_verifier = None
+
+
+def init_auth(project_id):
+    """Create the process-wide verifier and start prefetching the public keys"""
+    global _verifier
+    _verifier = TokenVerifier(project_id)
+    _verifier.start()
+    return _verifier
+
+
+def require_auth(check_revoked=False):
+    """Decorator that verifies the bearer token and exposes the caller as g.uid and g.token"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            auth_header = request.headers.get('Authorization', '')
+            if not auth_header.startswith('Bearer '):
+                return jsonify({'error': 'No bearer token provided'}), 401
+            try:
+                claims = _verifier.verify(auth_header.split('Bearer ')[1], check_revoked=check_revoked)
+            except Exception as e:
+                print(f"Authentication error: {str(e)}")
+                return jsonify({'error': str(e)}), 401
+            g.uid = claims['uid']
+            g.token = claims
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
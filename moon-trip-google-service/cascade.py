@@ -0,0 +1,82 @@
+import threading
+import time
+
+from google.cloud.firestore_v1.bulk_writer import BulkWriterOptions
+from google.cloud.firestore_v1.field_path import FieldPath
+
+# Collections whose documents point at a task through a field
+TASK_RELATED_COLLECTIONS = (
+    ('task_members', 'taskId'),
+)
+
+# Documents enumerated per query page; only their references are read
+ENUMERATION_PAGE_SIZE = 1000
+MAX_ATTEMPTS = 5
+PROGRESS_EVERY = 500
+# Deletes do not create hotspots the way new writes do, so skip most of the 500/50/5 ramp-up
+BULK_WRITER_OPTIONS = BulkWriterOptions(initial_ops_per_second=2000, max_ops_per_second=10000)
+
+
+def _references(query):
+    """Yield the references matched by a query, reading one page of keys at a time"""
+    query = query.select([FieldPath.document_id()]).order_by(FieldPath.document_id()).limit(ENUMERATION_PAGE_SIZE)
+    last_doc = None
+    while True:
+        page = query.start_after(last_doc) if last_doc is not None else query
+        docs = list(page.stream())
+        for doc in docs:
+            yield doc.reference
+        if len(docs) < ENUMERATION_PAGE_SIZE:
+            return
+        last_doc = docs[-1]
+
+
+def cascade_delete(db, doc_ref, related=(), on_progress=None, max_attempts=MAX_ATTEMPTS):
+    """Delete a document, its subcollections and the documents referencing it through a BulkWriter.
+
+    Writes are sent in parallel batches and retried with backoff. on_progress is
+    called with a {'deleted', 'failed'} dict every PROGRESS_EVERY deletions and
+    once at the end. Returns that dict plus 'elapsedSeconds'.
+    """
+    progress = {'deleted': 0, 'failed': 0}
+    lock = threading.Lock()
+    started = time.monotonic()
+
+    def on_result(ref, write_result, bulk_writer):
+        with lock:
+            progress['deleted'] += 1
+            report = progress['deleted'] % PROGRESS_EVERY == 0
+            snapshot = dict(progress)
+        if report and on_progress:
+            on_progress(snapshot)
+
+    def on_error(error, bulk_writer):
+        if error.attempts < max_attempts:
+            return True
+        print(f"Cascade delete failed for {error.operation.reference.path}: {error.message}")
+        with lock:
+            progress['failed'] += 1
+        return False
+
+    writer = db.bulk_writer(options=BULK_WRITER_OPTIONS)
+    writer.on_write_result(on_result)
+    writer.on_write_error(on_error)
+    try:
+        # Subcollections at any depth, e.g. tasks/{id}/mini_tasks
+        for subcollection in doc_ref.collections():
+            db.recursive_delete(subcollection, bulk_writer=writer)
+
+        for collection, field in related:
+            for ref in _references(db.collection(collection).where(field, '==', doc_ref.id)):
+                writer.delete(ref)
+
+        # The root goes last so a failed cascade can be resumed by deleting again
+        writer.flush()
+        writer.delete(doc_ref)
+    finally:
+        writer.close()
+
+    result = dict(progress, elapsedSeconds=time.monotonic() - started)
+    if on_progress:
+        on_progress(result)
+    return result
@@ -1,31 +1,46 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g, stream_with_context
 from flask_cors import CORS
+import heapq
 import os
 import firebase_admin
-from firebase_admin import credentials, auth, firestore
+from firebase_admin import credentials, firestore
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from google.api_core.exceptions import AlreadyExists
+from auth_cache import init_auth, require_auth
+from user_profiles import get_user_profiles
+from cascade import cascade_delete, TASK_RELATED_COLLECTIONS
+import task_index
 
 # Inițializare Firebase
 cred = credentials.Certificate('./serviceAccountKey.json')  # Descarcă din Firebase Console
 firebase_admin.initialize_app(cred)
 db = firestore.client()
+# Verify ID tokens locally against cached Firebase public keys
+init_auth(cred.project_id)
 
 app = Flask(__name__)
 CORS(app)  # Permite cereri cross-origin
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+# Runs independent Firestore reads of one request concurrently
+read_pool = ThreadPoolExecutor(max_workers=int(os.environ.get('READ_POOL_SIZE', 16)), thread_name_prefix='reads')
+
+
+def membership_id(task_id, user_id):
+    """Document ID of the membership of a user in a task"""
+    return f'{task_id}_{user_id}'
+
 
 @app.route('/api/users', methods=['POST'])
+@require_auth(check_revoked=True)
 def create_user():
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     try:
-        # Add clock tolerance parameter (5 seconds)
-        decoded_token = auth.verify_id_token(id_token, check_revoked=True, clock_skew_seconds=5)
-        uid = decoded_token['uid']
-        email = decoded_token.get('email') or request.json.get('email')
+        uid = g.uid
+        email = g.token.get('email') or request.json.get('email')
 
         # Save to Firestore
         db.collection('users').document(uid).set({
@@ -38,12 +53,9 @@ def create_user():
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/auth/login', methods=['POST'])
+@require_auth(check_revoked=True)
 def log_login():
-    # Verify token and get uid
-    id_token = request.headers.get('Authorization', '').split('Bearer ')[1]
-    # Add clock tolerance parameter (5 seconds)
-    decoded_token = auth.verify_id_token(id_token, check_revoked=True, clock_skew_seconds=5)
-    uid = decoded_token['uid']
+    uid = g.uid
 
     # Update last login time
     db.collection('users').document(uid).update({
@@ -53,42 +65,147 @@ def log_login():
     return jsonify({'success': True})
 
 
-@app.route('/api/tasks', methods=['GET'])
-def get_tasks():
-    # Verifică token-ul de autentificare
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
+def update_task_index(write, *args):
+    """Apply a change to the materialized task lists; the source documents are already written"""
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
-
-        # Obține task-urile utilizatorului
-        tasks_ref = db.collection('tasks')
+        write(db, *args)
+    except Exception as e:
+        # The list stays stale until the next change to the task or rebuild_task_index.py
+        print(f"Error updating the task index: {str(e)}")
+
+
+def task_to_dict(doc):
+    task_dict = doc.to_dict()
+    task_dict['id'] = doc.id
+    return task_dict
+
+
+def page_after(collection, query, cursor, limit):
+    """Order a query by document ID and restrict it to one page after the cursor document"""
+    query = query.order_by('__name__')
+    if cursor:
+        query = query.start_after({'__name__': db.collection(collection).document(cursor)})
+    return query.limit(limit)
+
+
+def visible_tasks(uid, cursor, limit):
+    """Yield the user's owned and accepted member tasks in task ID order"""
+    owned = page_after('tasks', db.collection('tasks').where('ownerId', '==', uid), cursor, limit).stream()
+
+    # Membership IDs are {taskId}_{userId}, so their ID order is the task ID order
+    memberships = (db.collection('task_members')
+                   .where('userId', '==', uid)
+                   .where('status', '==', 'accepted'))
+    membership_cursor = membership_id(cursor, uid) if cursor else None
+    member_task_refs = [
+        db.collection('tasks').document(membership.to_dict()['taskId'])
+        for membership in page_after('task_members', memberships, membership_cursor, limit).stream()
+    ]
+    member_tasks = sorted(
+        (doc for doc in db.get_all(member_task_refs) if doc.exists),
+        key=lambda doc: doc.id
+    )
+
+    # Both inputs are sorted by task ID; only member tasks are held in memory
+    last_id = None
+    count = 0
+    for doc in heapq.merge(owned, member_tasks, key=lambda doc: doc.id):
+        if doc.id == last_id:
+            continue
+        last_id = doc.id
+        yield doc
+        count += 1
+        if count == limit:
+            return
+
+
+def all_tasks(cursor, limit):
+    """Yield one page of every task, for browsing tasks to join"""
+    return page_after('tasks', db.collection('tasks'), cursor, limit).stream()
+
+
+def stream_ndjson(docs, limit):
+    """Write each task as one JSON line as soon as Firestore returns it, then the next cursor"""
+    last_id = None
+    count = 0
+    try:
+        for doc in docs:
+            last_id = doc.id
+            count += 1
+            yield app.json.dumps(task_to_dict(doc)) + '\n'
+    except Exception as e:
+        # Headers are already sent; report the failure in-band
+        print(f"Error streaming tasks: {str(e)}")
+        yield app.json.dumps({'error': str(e)}) + '\n'
+        return
+    yield app.json.dumps({'nextCursor': last_id if count == limit else None}) + '\n'
+
+
+def pending_memberships(task_id, cursor, limit):
+    """One page of (membership ID, user ID) pairs of pending join requests"""
+    query = page_after(
+        'task_members',
+        db.collection('task_members').where('taskId', '==', task_id).where('status', '==', 'pending'),
+        cursor,
+        limit
+    )
+    return [(membership.id, membership.to_dict().get('userId')) for membership in query.stream()]
+
+
+def pending_user_entries(memberships):
+    """Resolve pending memberships to user entries with batched profile lookups"""
+    profiles = get_user_profiles([user_id for _, user_id in memberships if user_id])
+    return [
+        {
+            'id': user_id,
+            'email': profiles[user_id]['email'],
+            'membershipId': membership_id
+        }
+        for membership_id, user_id in memberships
+        if user_id in profiles
+    ]
 
-        tasks = []
-        for doc in tasks_ref.stream():
-            task_dict = doc.to_dict()
-            task_dict['id'] = doc.id
-            tasks.append(task_dict)
 
-        return jsonify({'tasks': tasks}), 200
+@app.route('/api/tasks', methods=['GET'])
+@require_auth()
+def get_tasks():
+    try:
+        uid = g.uid
+        scope = request.args.get('scope', 'mine')
+        limit = max(1, min(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+        cursor = request.args.get('cursor')
+
+        if scope == 'all':
+            docs = all_tasks(cursor, limit)
+        elif scope == 'mine':
+            docs = visible_tasks(uid, cursor, limit)
+        else:
+            return jsonify({'error': 'Invalid scope'}), 400
+
+        if request.args.get('format') == 'ndjson' or request.accept_mimetypes.best == 'application/x-ndjson':
+            return Response(stream_with_context(stream_ndjson(docs, limit)), mimetype='application/x-ndjson')
+
+        tasks = [task_to_dict(doc) for doc in docs]
+        next_cursor = tasks[-1]['id'] if len(tasks) == limit else None
+        return jsonify({'tasks': tasks, 'nextCursor': next_cursor}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 401
 
+@app.route('/api/task_index', methods=['GET'])
+@require_auth()
+def get_task_index():
+    """The user's owned and joined tasks with their role and membership status, from one document read"""
+    try:
+        return jsonify({'tasks': task_index.read(db, g.uid)}), 200
+    except Exception as e:
+        print(f"Error reading task index: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/member_of', methods=['GET'])
+@require_auth()
 def get_memeber_of():
-    # Verifică token-ul de autentificare
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Obține task-urile utilizatorului
         my_task_ref = db.collection('task_members').where('userId', '==', uid)
@@ -104,22 +221,23 @@ def get_memeber_of():
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/tasks', methods=['POST'])
+@require_auth()
 def create_task():
-    id_token = request.headers.get('Authorization', '').split('Bearer ')[1]
     data = request.json
 
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         task_ref = db.collection('tasks').document()
-        task_ref.set({
+        task_data = {
             'title': data['title'],
             'description': data.get('description', ''),
             'status': 'active',
             'ownerId': uid,
             'createdAt': firestore.SERVER_TIMESTAMP,
-        })
+        }
+        task_ref.set(task_data)
+        update_task_index(task_index.add_owned_task, task_ref.id, task_data)
 
         return jsonify({
             'id': task_ref.id,
@@ -131,19 +249,27 @@ def create_task():
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/join', methods=['POST'])
+@require_auth()
 def join_task():
-    id_token = request.headers.get('Authorization', '').split('Bearer ')[1]
     data = request.json
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
-        task_member_ref = db.collection('task_members').document()
-        task_member_ref.set({
-            'userId': uid,
-            'status': 'pending',
-            'taskId': data['taskId']
-        })
-
+        uid = g.uid
+        # One membership document per (task, user), so repeated join requests are no-ops
+        task_member_ref = db.collection('task_members').document(membership_id(data['taskId'], uid))
+        try:
+            task_member_ref.create({
+                'userId': uid,
+                'status': 'pending',
+                'taskId': data['taskId']
+            })
+        except AlreadyExists:
+            membership = task_member_ref.get().to_dict() or {}
+            return jsonify({
+                'status': membership.get('status', 'pending'),
+                'taskId': data['taskId']
+            }), 200
+
+        update_task_index(task_index.set_membership, data['taskId'], uid, 'pending')
         return jsonify({
             'status': 'pending',
             'taskId': data['taskId']
@@ -152,55 +278,47 @@ def join_task():
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/tasks/<task_id>', methods=['GET'])
+@require_auth()
 def get_task(task_id):
-    # Verify authentication token
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
-
-        # Get the task document
+        uid = g.uid
+        include = set(filter(None, request.args.get('include', '').split(',')))
         task_ref = db.collection('tasks').document(task_id)
-        task_doc = task_ref.get()
 
+        # The reads are independent, so issue them together; latency is the slowest read
+        task_future = read_pool.submit(task_ref.get)
+        mini_tasks_future = read_pool.submit(
+            lambda: [task_to_dict(doc) for doc in task_ref.collection('mini_tasks').stream()]
+        )
+        # Ownership is only known once the task is read, so pending users are fetched speculatively
+        pending_future = (read_pool.submit(pending_memberships, task_id, None, DEFAULT_PAGE_SIZE)
+                          if 'pendingUsers' in include else None)
+
+        task_doc = task_future.result()
         if not task_doc.exists:
             return jsonify({'error': 'Task not found'}), 404
 
-        task_data = task_doc.to_dict()
-        task_data['id'] = task_doc.id
-
-        # Get mini-tasks for this task
-        mini_tasks_ref = db.collection('tasks').document(task_id).collection('mini_tasks')
-        mini_tasks = []
-        for doc in mini_tasks_ref.stream():
-            mini_task = doc.to_dict()
-            mini_task['id'] = doc.id
-            mini_tasks.append(mini_task)
+        response = {
+            'task': task_to_dict(task_doc),
+            'miniTasks': mini_tasks_future.result()
+        }
+        if pending_future is not None and task_doc.to_dict().get('ownerId') == uid:
+            memberships = pending_future.result()
+            response['pendingUsers'] = pending_user_entries(memberships)
+            response['pendingUsersCursor'] = memberships[-1][0] if len(memberships) == DEFAULT_PAGE_SIZE else None
 
-        return jsonify({
-            'task': task_data,
-            'miniTasks': mini_tasks
-        }), 200
+        return jsonify(response), 200
 
     except Exception as e:
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/tasks/<task_id>/mini-tasks', methods=['POST'])
+@require_auth()
 def create_mini_task(task_id):
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     data = request.json
 
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Verify task exists
         task_ref = db.collection('tasks').document(task_id)
@@ -234,17 +352,12 @@ def create_mini_task(task_id):
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/tasks/<task_id>/mini-tasks/<mini_task_id>', methods=['PATCH'])
+@require_auth()
 def update_mini_task(task_id, mini_task_id):
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     data = request.json
 
     try:
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Update mini-task
         mini_task_ref = db.collection('tasks').document(task_id).collection('mini_tasks').document(mini_task_id)
@@ -272,6 +385,7 @@ def update_mini_task(task_id, mini_task_id):
         return jsonify({'error': str(e)}), 401
 
 @app.route('/api/tasks/<task_id>/mini-tasks/<mini_task_id>', methods=['DELETE'])
+@require_auth()
 def delete_mini_task(task_id, mini_task_id):
     # Handle preflight request
     if request.method == 'OPTIONS':
@@ -280,16 +394,9 @@ def delete_mini_task(task_id, mini_task_id):
         response.headers['Access-Control-Allow-Headers'] = 'Authorization, Content-Type'
         return response
 
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
 
     try:
-        # Verify the token
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Verify task exists
         task_ref = db.collection('tasks').document(task_id)
@@ -315,6 +422,7 @@ def delete_mini_task(task_id, mini_task_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/tasks/<task_id>', methods=['DELETE'])
+@require_auth()
 def delete_task(task_id):
     # Handle preflight request
     if request.method == 'OPTIONS':
@@ -323,16 +431,9 @@ def delete_task(task_id):
         response.headers['Access-Control-Allow-Headers'] = 'Authorization, Content-Type'
         return response
 
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
 
     try:
-        # Verify the token
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Get task reference
         task_ref = db.collection('tasks').document(task_id)
@@ -346,22 +447,16 @@ def delete_task(task_id):
         if task_data.get('ownerId') != uid:
             return jsonify({'error': 'Not authorized to delete this task'}), 403
 
-        # Delete all mini-tasks first
-        mini_tasks_ref = task_ref.collection('mini_tasks')
-        batch = db.batch()
-        for mini_task in mini_tasks_ref.stream():
-            batch.delete(mini_task.reference)
-        batch.commit()
-
-        # Delete task memberships
-        memberships_query = db.collection('task_members').where('taskId', '==', task_id)
-        batch = db.batch()
-        for membership in memberships_query.stream():
-            batch.delete(membership.reference)
-        batch.commit()
-
-        # Delete the task itself
-        task_ref.delete()
+        # Delete mini-tasks, memberships and the task itself in parallel chunks
+        result = cascade_delete(
+            db,
+            task_ref,
+            related=TASK_RELATED_COLLECTIONS,
+            on_progress=lambda progress: print(f"Deleting task {task_id}: {progress['deleted']} documents deleted")
+        )
+        if result['failed']:
+            return jsonify({'error': f"{result['failed']} documents could not be deleted"}), 500
+        update_task_index(task_index.remove_task, task_id)
 
         response = jsonify({'success': True})
         return response, 200
@@ -371,17 +466,10 @@ def delete_task(task_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/tasks/<task_id>/pending-users', methods=['GET'])
+@require_auth()
 def get_pending_users(task_id):
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
-
     try:
-        # Verify the token
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Verify task exists and user is owner
         task_ref = db.collection('tasks').document(task_id)
@@ -393,37 +481,21 @@ def get_pending_users(task_id):
         if task_data.get('ownerId') != uid:
             return jsonify({'error': 'Not authorized to view pending users'}), 403
 
-        # Get pending memberships
-        memberships_query = db.collection('task_members').where('taskId', '==', task_id).where('status', '==', 'pending')
-        pending_users = []
-        
-        for membership in memberships_query.stream():
-            membership_data = membership.to_dict()
-            user_id = membership_data.get('userId')
-            if user_id:
-                try:
-                    user = auth.get_user(user_id)
-                    pending_users.append({
-                        'id': user_id,
-                        'email': user.email,
-                        'membershipId': membership.id
-                    })
-                except:
-                    continue
-
-        return jsonify({'pendingUsers': pending_users}), 200
+        # Get one page of pending memberships and resolve their users with batched lookups
+        limit = max(1, min(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+        memberships = pending_memberships(task_id, request.args.get('cursor'), limit)
+        pending_users = pending_user_entries(memberships)
+        next_cursor = memberships[-1][0] if len(memberships) == limit else None
+
+        return jsonify({'pendingUsers': pending_users, 'nextCursor': next_cursor}), 200
 
     except Exception as e:
         print(f"Error getting pending users: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/tasks/<task_id>/user-action', methods=['POST'])
+@require_auth()
 def handle_user_action(task_id):
-    auth_header = request.headers.get('Authorization', '')
-    if not auth_header.startswith('Bearer '):
-        return jsonify({'error': 'No bearer token provided'}), 401
-
-    id_token = auth_header.split('Bearer ')[1]
     data = request.json
 
     if not data or 'userId' not in data or 'action' not in data:
@@ -433,9 +505,7 @@ def handle_user_action(task_id):
         return jsonify({'error': 'Invalid action'}), 400
 
     try:
-        # Verify the token
-        decoded_token = auth.verify_id_token(id_token)
-        uid = decoded_token['uid']
+        uid = g.uid
 
         # Verify task exists and user is owner
         task_ref = db.collection('tasks').document(task_id)
@@ -448,22 +518,20 @@ def handle_user_action(task_id):
             return jsonify({'error': 'Not authorized to manage users'}), 403
 
         # Find the membership
-        memberships_query = db.collection('task_members').where('taskId', '==', task_id).where('userId', '==', data['userId'])
-        memberships = list(memberships_query.stream())
-        
-        if not memberships:
+        membership_ref = db.collection('task_members').document(membership_id(task_id, data['userId']))
+        if not membership_ref.get().exists:
             return jsonify({'error': 'Membership not found'}), 404
 
-        membership_ref = memberships[0].reference
-
         if data['action'] == 'accept':
             membership_ref.update({
                 'status': 'accepted',
                 'updatedAt': firestore.SERVER_TIMESTAMP,
                 'updatedBy': uid
             })
+            update_task_index(task_index.set_membership, task_id, data['userId'], 'accepted', task_data)
         else:  # reject
             membership_ref.delete()
+            update_task_index(task_index.remove_membership, task_id, data['userId'])
 
         return jsonify({'success': True}), 200
 
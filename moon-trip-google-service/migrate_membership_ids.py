@@ -0,0 +1,80 @@
+"""Re-key task_members documents as {taskId}_{userId}.
+
+Duplicate memberships of the same user in the same task are collapsed into
+one document, preferring an accepted membership over a pending one.
+
+Backend-written memberships (snake_case fields) also store their document ID
+in an 'id' field, which the backend reads back as Member.id; it is rewritten
+to the new ID so deletes through the backend hit the re-keyed document.
+
+Usage: python migrate_membership_ids.py [--dry-run]
+"""
+import sys
+
+import firebase_admin
+from firebase_admin import credentials, firestore
+
+# Firestore rejects commits with more than 500 write operations
+BATCH_SIZE = 500
+
+
+def membership_keys(data):
+    """Task and user IDs of a membership, in either the service's or the backend's field names"""
+    return data.get('taskId') or data.get('task_id'), data.get('userId') or data.get('user_id')
+
+
+def rekeyed(data, target_id):
+    """Membership fields to store under target_id; the backend's copy of the document ID follows the move"""
+    if 'task_id' in data or 'user_id' in data:
+        return dict(data, id=target_id)
+    return data
+
+
+def pick_survivor(docs, target_id):
+    """Keep accepted memberships first, then the document already stored under the new ID"""
+    return min(docs, key=lambda doc: (doc.to_dict().get('status') != 'accepted', doc.id != target_id))
+
+
+def migrate(db, dry_run=False):
+    groups = {}
+    skipped = 0
+    for doc in db.collection('task_members').stream():
+        task_id, user_id = membership_keys(doc.to_dict())
+        if not task_id or not user_id:
+            skipped += 1
+            continue
+        groups.setdefault(f'{task_id}_{user_id}', []).append(doc)
+
+    writes = []
+    for target_id, docs in groups.items():
+        survivor = pick_survivor(docs, target_id)
+        data = survivor.to_dict()
+        target_data = rekeyed(data, target_id)
+        if len(docs) == 1 and survivor.id == target_id and target_data == data:
+            continue
+        target_ref = db.collection('task_members').document(target_id)
+        if survivor.id != target_id or target_data != data:
+            writes.append(('set', target_ref, target_data))
+        for doc in docs:
+            if doc.id != target_id:
+                writes.append(('delete', doc.reference, None))
+
+    print(f'{len(groups)} memberships, {len(writes)} writes, {skipped} documents without task or user')
+    if dry_run:
+        return
+
+    for start in range(0, len(writes), BATCH_SIZE):
+        batch = db.batch()
+        for operation, ref, data in writes[start:start + BATCH_SIZE]:
+            if operation == 'set':
+                batch.set(ref, data)
+            else:
+                batch.delete(ref)
+        batch.commit()
+        print(f'Committed {min(start + BATCH_SIZE, len(writes))}/{len(writes)} writes')
+
+
+if __name__ == '__main__':
+    cred = credentials.Certificate('./serviceAccountKey.json')
+    firebase_admin.initialize_app(cred)
+    migrate(firestore.client(), dry_run='--dry-run' in sys.argv)
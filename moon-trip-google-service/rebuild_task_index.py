@@ -0,0 +1,42 @@
+"""Rebuild the user_task_index documents from tasks and task_members.
+
+Run after deploying the task list, or whenever an index document is
+suspected to be stale; each document is replaced as a whole.
+
+Usage: python rebuild_task_index.py [--user UID]
+"""
+import sys
+
+import firebase_admin
+from firebase_admin import credentials, firestore
+
+from task_index import rebuild
+
+
+def user_ids(db):
+    """Every user with a profile, an owned task or a membership"""
+    uids = {doc.id for doc in db.collection('users').select([]).stream()}
+    for collection, fields in (('tasks', ('ownerId', 'owner_id')), ('task_members', ('userId', 'user_id'))):
+        for doc in db.collection(collection).select(list(fields)).stream():
+            data = doc.to_dict()
+            uids.update(data[field] for field in fields if data.get(field))
+    return sorted(uids)
+
+
+def rebuild_all(db, uids):
+    for count, uid in enumerate(uids, 1):
+        try:
+            index = rebuild(db, uid)
+            print(f'{count}/{len(uids)} {uid}: {len(index["taskIds"])} tasks')
+        except Exception as e:
+            print(f'{count}/{len(uids)} {uid}: failed: {str(e)}')
+
+
+if __name__ == '__main__':
+    cred = credentials.Certificate('./serviceAccountKey.json')
+    firebase_admin.initialize_app(cred)
+    db = firestore.client()
+    if '--user' in sys.argv:
+        rebuild_all(db, [sys.argv[sys.argv.index('--user') + 1]])
+    else:
+        rebuild_all(db, user_ids(db))
@@ -0,0 +1,131 @@
+"""Materialized per-user task list shared with the backend.
+
+Each user has one user_task_index/{uid} document:
+    {'taskIds': [...], 'tasks': {taskId: summary}, 'updatedAt': timestamp}
+so the task list opens with a single document read. taskIds lets a task's
+entries be found with one array-contains query when it changes or is deleted.
+"""
+from firebase_admin import firestore
+
+COLLECTION = 'user_task_index'
+OWNER = 'owner'
+MEMBER = 'member'
+# Descriptions are cut so one document can hold a few thousand summaries under the 1 MiB limit
+DESCRIPTION_PREVIEW = 200
+# Firestore rejects commits with more than 500 write operations
+BATCH_SIZE = 500
+
+
+def _field(data, camel, snake):
+    """Read a field stored by either this service (camelCase) or the backend (snake_case)"""
+    value = data.get(camel)
+    return data.get(snake) if value is None else value
+
+
+def summarize(data):
+    """Compact summary of a task document"""
+    return {
+        'title': data.get('title') or '',
+        'description': (data.get('description') or '')[:DESCRIPTION_PREVIEW],
+        'status': data.get('status'),
+        'priority': data.get('priority'),
+        'ownerId': _field(data, 'ownerId', 'owner_id'),
+        'dueDate': _field(data, 'dueDate', 'due_date'),
+        'tags': list(data.get('tags') or [])
+    }
+
+
+def _added(task_id, entry):
+    return {
+        'taskIds': firestore.ArrayUnion([task_id]),
+        'tasks': {task_id: entry},
+        'updatedAt': firestore.SERVER_TIMESTAMP
+    }
+
+
+def _removed(task_id):
+    return {
+        'taskIds': firestore.ArrayRemove([task_id]),
+        'tasks': {task_id: firestore.DELETE_FIELD},
+        'updatedAt': firestore.SERVER_TIMESTAMP
+    }
+
+
+def _listing(db, task_id):
+    """References of the index documents that list a task"""
+    query = db.collection(COLLECTION).where('taskIds', 'array_contains', task_id).select([])
+    return [doc.reference for doc in query.stream()]
+
+
+def _commit(db, writes):
+    """Merge (reference, fields) writes in batches"""
+    for start in range(0, len(writes), BATCH_SIZE):
+        batch = db.batch()
+        for ref, data in writes[start:start + BATCH_SIZE]:
+            batch.set(ref, data, merge=True)
+        batch.commit()
+
+
+def add_owned_task(db, task_id, data):
+    """List a new task in its owner's document"""
+    summary = summarize(data)
+    db.collection(COLLECTION).document(summary['ownerId']).set(_added(task_id, dict(summary, role=OWNER)), merge=True)
+
+
+def set_membership(db, task_id, user_id, status, task_data=None):
+    """List a task in a member's document, or update the member's status there"""
+    if task_data is None:
+        task = db.collection('tasks').document(task_id).get()
+        if not task.exists:
+            return
+        task_data = task.to_dict()
+    summary = summarize(task_data)
+    if summary['ownerId'] == user_id:
+        entry = dict(summary, role=OWNER)
+    else:
+        entry = dict(summary, role=MEMBER, membershipStatus=status)
+    db.collection(COLLECTION).document(user_id).set(_added(task_id, entry), merge=True)
+
+
+def remove_membership(db, task_id, user_id):
+    """Drop a task from a former member's document"""
+    db.collection(COLLECTION).document(user_id).set(_removed(task_id), merge=True)
+
+
+def remove_task(db, task_id):
+    """Drop a deleted task from every document listing it"""
+    _commit(db, [(ref, _removed(task_id)) for ref in _listing(db, task_id)])
+
+
+def rebuild(db, uid):
+    """Recompute a user's document from their tasks and memberships and return it"""
+    tasks = {}
+    for owner_field in ('ownerId', 'owner_id'):
+        for doc in db.collection('tasks').where(owner_field, '==', uid).stream():
+            tasks[doc.id] = dict(summarize(doc.to_dict()), role=OWNER)
+
+    statuses = {}
+    for user_field in ('userId', 'user_id'):
+        for doc in db.collection('task_members').where(user_field, '==', uid).stream():
+            data = doc.to_dict()
+            task_id = _field(data, 'taskId', 'task_id')
+            if task_id and task_id not in tasks:
+                # Backend memberships have no status; they are accepted when created
+                statuses[task_id] = data.get('status') or 'accepted'
+    refs = [db.collection('tasks').document(task_id) for task_id in statuses]
+    for start in range(0, len(refs), BATCH_SIZE):
+        for doc in db.get_all(refs[start:start + BATCH_SIZE]):
+            if doc.exists:
+                tasks[doc.id] = dict(summarize(doc.to_dict()), role=MEMBER, membershipStatus=statuses[doc.id])
+
+    index = {'taskIds': sorted(tasks), 'tasks': tasks, 'updatedAt': firestore.SERVER_TIMESTAMP}
+    db.collection(COLLECTION).document(uid).set(index)
+    return index
+
+
+def read(db, uid):
+    """A user's task summaries ordered by title, building the document on first use"""
+    doc = db.collection(COLLECTION).document(uid).get()
+    index = doc.to_dict() if doc.exists else rebuild(db, uid)
+    entries = [dict(entry, id=task_id) for task_id, entry in (index.get('tasks') or {}).items()]
+    return sorted(entries, key=lambda entry: (entry.get('title') or '').lower())
@@ -0,0 +1,60 @@
+import os
+import threading
+import time
+
+from firebase_admin import auth
+
+# auth.get_users accepts at most 100 identifiers per call
+MAX_USERS_PER_LOOKUP = 100
+PROFILE_TTL_SECONDS = float(os.environ.get('USER_PROFILE_TTL_SECONDS', 60))
+MAX_CACHED_PROFILES = 10000
+
+_profiles = {}
+_profiles_lock = threading.Lock()
+
+
+def _profile(user):
+    return {'id': user.uid, 'email': user.email, 'displayName': user.display_name}
+
+
+def _prune(now):
+    """Drop expired entries, then the oldest ones, once the cache is over its size limit"""
+    if len(_profiles) <= MAX_CACHED_PROFILES:
+        return
+    for uid in [uid for uid, entry in _profiles.items() if entry[0] <= now]:
+        del _profiles[uid]
+    while len(_profiles) > MAX_CACHED_PROFILES:
+        del _profiles[next(iter(_profiles))]
+
+
+def get_user_profiles(uids):
+    """Return {uid: profile} for existing users, one Admin API call per 100 uncached users"""
+    now = time.time()
+    found = {}
+    missing = []
+    with _profiles_lock:
+        for uid in dict.fromkeys(uids):
+            entry = _profiles.get(uid)
+            if entry is not None and entry[0] > now:
+                if entry[1] is not None:
+                    found[uid] = entry[1]
+            else:
+                missing.append(uid)
+
+    for start in range(0, len(missing), MAX_USERS_PER_LOOKUP):
+        chunk = missing[start:start + MAX_USERS_PER_LOOKUP]
+        result = auth.get_users([auth.UidIdentifier(uid) for uid in chunk])
+        expires_at = time.time() + PROFILE_TTL_SECONDS
+        with _profiles_lock:
+            for user in result.users:
+                found[user.uid] = _profile(user)
+                _profiles[user.uid] = (expires_at, found[user.uid])
+            # Remember deleted accounts too, so they are not looked up on every request
+            for identifier in result.not_found:
+                _profiles[identifier.uid] = (expires_at, None)
+            _prune(time.time())
+        if result.not_found:
+            print(f"User lookup: {len(result.not_found)} of {len(chunk)} users not found")
+
+    return found
+